@@ -24,10 +24,12 @@
 #                                                                                        #
 # ====================================================================================== #
 from deap_er.base import Toolbox
+from typing import Union
 import random
+import numpy
 
 
-__all__ = ['var_and', 'var_or']
+__all__ = ['var_and', 'var_or', 'var_and_batch']
 
 
 # ====================================================================================== #
@@ -108,3 +110,57 @@ def var_or(toolbox: Toolbox, population: list, offsprings: int,
             offspring.append(random.choice(population))
 
     return offspring
+
+
+# -------------------------------------------------------------------------------------- #
+def var_and_batch(toolbox: Toolbox, population: Union[list, numpy.ndarray],
+                  cx_prob: float, mut_prob: float) -> Union[list, numpy.ndarray]:
+    """
+    A vectorized variant of :func:`var_and` for populations of NumPy array
+    individuals of equal length. The genomes are stacked into a matrix, the
+    crossover and the mutation masks are drawn for the whole population at
+    once, and the *'mate'* and *'mutate'* operators of the toolbox are called
+    only once, with the matrices of all the selected pairs and mutants.
+    Hence, the operators must accept 2-D arrays, like the *'cx_uniform'*,
+    *'cx_blend'*, *'cx_simulated_binary'*, *'mut_flip_bit'* and
+    *'mut_gaussian'* operators do.
+
+    :param toolbox: A Toolbox which contains the evolution operators.
+    :param population: A list of individuals to evolve or a (individuals x genes)
+        matrix of genomes. A matrix is varied without the fitness bookkeeping.
+    :param cx_prob: The probability of mating two individuals.
+    :param mut_prob: The probability of mutating an individual.
+    :return: A list of evolved individuals or a matrix of evolved
+        genomes, if the **population** is a matrix.
+    """
+    err = "The {0} probability must be in the range of [0, 1]."
+    if not (0 <= cx_prob <= 1):
+        raise ValueError(err.format("crossover"))
+    if not (0 <= mut_prob <= 1):
+        raise ValueError(err.format("mutation"))
+
+    genomes = numpy.array(population)
+    size = len(genomes)
+
+    pairs = numpy.flatnonzero(numpy.random.random_sample(size // 2) < cx_prob) * 2
+    if len(pairs) > 0:
+        first, second = toolbox.mate(genomes[pairs], genomes[pairs + 1])
+        genomes[pairs], genomes[pairs + 1] = first, second
+
+    mutants = numpy.flatnonzero(numpy.random.random_sample(size) < mut_prob)
+    if len(mutants) > 0:
+        genomes[mutants], = toolbox.mutate(genomes[mutants])  # don't remove the comma!
+
+    if isinstance(population, numpy.ndarray):
+        return genomes
+
+    varied = numpy.zeros(size, dtype=bool)
+    varied[pairs] = varied[pairs + 1] = True
+    varied[mutants] = True
+
+    offspring = [toolbox.clone(ind) for ind in population]
+    for i in numpy.flatnonzero(varied):
+        offspring[i][:] = genomes[i]
+        del offspring[i].fitness.values
+
+    return offspring
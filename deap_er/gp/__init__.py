@@ -23,10 +23,14 @@
 #   SOFTWARE.                                                                            #
 #                                                                                        #
 # ====================================================================================== #
+from .cache import *
+from .compact import *
 from .crossover import *
+from .evaluation import *
 from .generators import *
 from .harm import *
 from .mutation import *
 from .primitives import *
 from .semantic import *
+from .simplify import *
 from .tools import *
@@ -0,0 +1,205 @@
+# ====================================================================================== #
+#                                                                                        #
+#   MIT License                                                                          #
+#                                                                                        #
+#   Copyright (c) 2022 - Mattias Aabmets, The DEAP Team and Other Contributors           #
+#                                                                                        #
+#   Permission is hereby granted, free of charge, to any person obtaining a copy         #
+#   of this software and associated documentation files (the "Software"), to deal        #
+#   in the Software without restriction, including without limitation the rights         #
+#   to use, copy, modify, merge, publish, distribute, sublicense, and/or sell            #
+#   copies of the Software, and to permit persons to whom the Software is                #
+#   furnished to do so, subject to the following conditions:                             #
+#                                                                                        #
+#   The above copyright notice and this permission notice shall be included in all       #
+#   copies or substantial portions of the Software.                                      #
+#                                                                                        #
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR           #
+#   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,             #
+#   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE          #
+#   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER               #
+#   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,        #
+#   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE        #
+#   SOFTWARE.                                                                            #
+#                                                                                        #
+# ====================================================================================== #
+from collections import OrderedDict
+from typing import Any, Optional
+import threading
+import sys
+
+
+__all__ = ['CompileCache', 'SemanticCache']
+
+
+# ====================================================================================== #
+class CompileCache:
+    """
+    A bounded least-recently-used cache of compiled expressions, which
+    is keyed by the Python code of the expression. Every primitive set
+    owns a cache, which is used transparently by the *'compile_tree'*
+    and the *'compile_adf_tree'* functions. The entries are not pickled.
+    The cache is safe to share between threads.
+
+    :param maxsize: The maximum number of cached entries, optional.
+        If zero, the caching is disabled. If None, the cache is unbounded.
+    """
+    # -------------------------------------------------------- #
+    def __init__(self, maxsize: Optional[int] = 1024) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    # -------------------------------------------------------- #
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # -------------------------------------------------------- #
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    # -------------------------------------------------------- #
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state['_entries'] = OrderedDict()
+        del state['_lock']
+        return state
+
+    # -------------------------------------------------------- #
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    # -------------------------------------------------------- #
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Returns the cached entry of the **key** and marks it as
+        the most recently used one. Updates the hit and miss counters.
+
+        :param key: The Python code of the expression.
+        :param default: The value to return on a miss, optional.
+        :return: The cached entry or the **default**.
+        """
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    # -------------------------------------------------------- #
+    def put(self, key: str, value: Any) -> None:
+        """
+        Stores the **value** under the **key** and evicts the
+        least recently used entries when the cache is full.
+
+        :param key: The Python code of the expression.
+        :param value: The compiled expression.
+        :return: Nothing.
+        """
+        if self.maxsize == 0:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if self.maxsize is not None:
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+
+    # -------------------------------------------------------- #
+    def clear(self) -> None:
+        """
+        Removes all the entries and resets the counters.
+
+        :return: Nothing.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+# ====================================================================================== #
+class SemanticCache:
+    """
+    A memory-bounded least-recently-used cache of the output vectors of
+    subtrees, which is keyed by the structure of the subtrees. The size of
+    an entry is the *'nbytes'* of the cached array. When the total size
+    exceeds the budget, the least recently used entries are evicted.
+
+    :param max_bytes: The memory budget of the cached outputs in bytes, optional.
+        If None, the cache is unbounded. The default is 256 MiB.
+    """
+    # -------------------------------------------------------- #
+    def __init__(self, max_bytes: Optional[int] = 1 << 28) -> None:
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    # -------------------------------------------------------- #
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # -------------------------------------------------------- #
+    def __contains__(self, key: Any) -> bool:
+        return key in self._entries
+
+    # -------------------------------------------------------- #
+    def get(self, key: Any, default: Any = None) -> Any:
+        """
+        Returns the cached output of the **key** and marks it as
+        the most recently used one. Updates the hit and miss counters.
+
+        :param key: The structural key of the subtree.
+        :param default: The value to return on a miss, optional.
+        :return: The cached output or the **default**.
+        """
+        try:
+            value, _ = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    # -------------------------------------------------------- #
+    def put(self, key: Any, value: Any) -> None:
+        """
+        Stores the **value** under the **key** and evicts the least
+        recently used entries while the memory budget is exceeded.
+
+        :param key: The structural key of the subtree.
+        :param value: The output of the subtree.
+        :return: Nothing.
+        """
+        size = getattr(value, 'nbytes', None) or sys.getsizeof(value)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        if key in self._entries:
+            self.nbytes -= self._entries.pop(key)[1]
+        self._entries[key] = (value, size)
+        self.nbytes += size
+        if self.max_bytes is not None:
+            while self.nbytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.nbytes -= evicted
+
+    # -------------------------------------------------------- #
+    def clear(self) -> None:
+        """
+        Removes all the entries and resets the counters.
+
+        :return: Nothing.
+        """
+        self._entries.clear()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
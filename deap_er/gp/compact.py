@@ -0,0 +1,378 @@
+# ====================================================================================== #
+#                                                                                        #
+#   MIT License                                                                          #
+#                                                                                        #
+#   Copyright (c) 2022 - Mattias Aabmets, The DEAP Team and Other Contributors           #
+#                                                                                        #
+#   Permission is hereby granted, free of charge, to any person obtaining a copy         #
+#   of this software and associated documentation files (the "Software"), to deal        #
+#   in the Software without restriction, including without limitation the rights         #
+#   to use, copy, modify, merge, publish, distribute, sublicense, and/or sell            #
+#   copies of the Software, and to permit persons to whom the Software is                #
+#   furnished to do so, subject to the following conditions:                             #
+#                                                                                        #
+#   The above copyright notice and this permission notice shall be included in all       #
+#   copies or substantial portions of the Software.                                      #
+#                                                                                        #
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR           #
+#   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,             #
+#   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE          #
+#   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER               #
+#   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,        #
+#   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE        #
+#   SOFTWARE.                                                                            #
+#                                                                                        #
+# ====================================================================================== #
+from __future__ import annotations
+from .primitives import *
+from typing import Iterable, Optional, Union
+from weakref import WeakKeyDictionary
+from array import array
+import threading
+import copy
+
+
+__all__ = ['CompactTree']
+
+
+_TABLES = WeakKeyDictionary()
+_TABLES_LOCK = threading.Lock()
+
+
+# ====================================================================================== #
+class _OpcodeTable:
+    """
+    Private table of the opcodes of the shared nodes and of the kinds of the
+    constant terminals. The table holds a reference to every node it has
+    encoded, so the identity of a node cannot be reused by another object
+    while its opcode is in use. New entries are added under a lock.
+    """
+    # -------------------------------------------------------- #
+    def __init__(self):
+        self.nodes = list()
+        self.arities = list()
+        self.kinds = list()
+        self._node_codes = dict()
+        self._kind_codes = dict()
+        self._lock = threading.Lock()
+
+    # -------------------------------------------------------- #
+    def __getstate__(self) -> dict:
+        return dict(nodes=self.nodes, kinds=self.kinds)
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__()
+        for node in state['nodes']:
+            self.node_code(node)
+        for kind in state['kinds']:
+            self.kind_code(kind)
+
+    # -------------------------------------------------------- #
+    def node_code(self, node) -> int:
+        code = self._node_codes.get(id(node))
+        if code is None:
+            with self._lock:
+                code = self._node_codes.get(id(node))
+                if code is None:
+                    code = len(self.nodes)
+                    self.nodes.append(node)
+                    self.arities.append(node.arity)
+                    self._node_codes[id(node)] = code
+        return code
+
+    # -------------------------------------------------------- #
+    def kind_code(self, kind: tuple) -> int:
+        code = self._kind_codes.get(kind)
+        if code is None:
+            with self._lock:
+                code = self._kind_codes.get(kind)
+                if code is None:
+                    code = len(self.kinds)
+                    self.kinds.append(kind)
+                    self._kind_codes[kind] = code
+        return code
+
+
+# -------------------------------------------------------------------------------------- #
+def _table_of(prim_set: PrimitiveSetTyped) -> _OpcodeTable:
+    with _TABLES_LOCK:
+        table = _TABLES.get(prim_set)
+        if table is None:
+            table = _TABLES[prim_set] = _OpcodeTable()
+        return table
+
+
+# ====================================================================================== #
+class CompactTree:
+    """
+    A memory-efficient alternative to the *'PrimitiveTree'*, which stores the
+    nodes as integer opcodes in an array. Primitives, arguments and named
+    terminals are shared objects, which are encoded by their identity, while
+    constant terminals, like ephemeral constants, are stored by their values
+    in a side table of the tree. Indexing the tree returns node objects,
+    so the tree supports the same GP operators, string conversion and
+    compilation as the *'PrimitiveTree'*. Copying the tree copies only the
+    arrays of opcodes and constant values.
+
+    The opcodes are looked up in a table which is shared by all the trees
+    that are built with the same primitive set and by all the copies of a
+    tree. The table of a primitive set is released together with the set.
+
+    :param content: List of primitives and terminals to be added to the tree.
+    :param prim_set: Primitive set of the nodes, optional. If not given,
+        the tree shares the opcode table of the **content** when it is
+        a *'CompactTree'*, otherwise the tree uses a table of its own.
+    """
+    _storage = ('codes', 'values', 'kinds', '_garbage', '_index', '_table')
+
+    # -------------------------------------------------------- #
+    def __init__(self, content: Iterable = (),
+                 prim_set: Optional[PrimitiveSetTyped] = None):
+        self.codes = array('i')
+        self.values = list()
+        self.kinds = array('i')
+        self._garbage = 0
+        self._index = None
+        if prim_set is not None:
+            self._table = _table_of(prim_set)
+        elif isinstance(content, CompactTree):
+            self._table = content._table
+        else:
+            self._table = _OpcodeTable()
+        if isinstance(content, CompactTree) and content._table is self._table:
+            self.codes = array('i', content.codes)
+            self.values = list(content.values)
+            self.kinds = array('i', content.kinds)
+            self._garbage = content._garbage
+            self._index = content._index
+        else:
+            self.codes = self._encode(content)
+
+    # -------------------------------------------------------- #
+    def __deepcopy__(self, memo: dict) -> CompactTree:
+        new = self.__class__.__new__(self.__class__)
+        state = {k: v for k, v in self.__dict__.items() if k not in self._storage}
+        new.__dict__.update(copy.deepcopy(state, memo))
+        new.codes = array('i', self.codes)
+        new.values = list(self.values)
+        new.kinds = array('i', self.kinds)
+        new._garbage = self._garbage
+        new._index = self._index
+        new._table = self._table
+        return new
+
+    # -------------------------------------------------------- #
+    def __reduce__(self) -> tuple:
+        return self.__class__, (), dict(self.__dict__)
+
+    # -------------------------------------------------------- #
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    # -------------------------------------------------------- #
+    def __iter__(self):
+        decode = self._decode
+        for code in self.codes:
+            yield decode(code)
+
+    # -------------------------------------------------------- #
+    def __reversed__(self):
+        decode = self._decode
+        for code in reversed(self.codes):
+            yield decode(code)
+
+    # -------------------------------------------------------- #
+    def __getitem__(self, key: Union[int, slice]):
+        if isinstance(key, slice):
+            decode = self._decode
+            return [decode(code) for code in self.codes[key]]
+        return self._decode(self.codes[key])
+
+    # -------------------------------------------------------- #
+    def __setitem__(self, key: Union[int, slice], val) -> None:
+        if isinstance(key, slice):
+            if key.start >= len(self):
+                raise IndexError(
+                    "Trying to set a slice larger than the size "
+                    "of the CompactTree is not allowed."
+                )
+            total = val[0].arity
+            for node in val[1:]:
+                total += node.arity - 1
+            if total != 0:
+                raise ValueError(
+                    "Insertion of a subtree with an arity smaller "
+                    "than the CompactTree is not allowed."
+                )
+            self._discard(self.codes[key])
+            self.codes[key] = self._encode(val)
+        else:
+            if val.arity != self[key].arity:
+                raise ValueError(
+                    "CompactTree node replacement with a node "
+                    "of a different arity is not allowed."
+                )
+            self._discard(self.codes[key:key + 1 or None])
+            self.codes[key] = self._encode([val])[0]
+        self._modified()
+
+    # -------------------------------------------------------- #
+    def __delitem__(self, key: Union[int, slice]) -> None:
+        if not isinstance(key, slice):
+            key = slice(key, key + 1 or None)
+        self._discard(self.codes[key])
+        del self.codes[key]
+        self._modified()
+
+    # -------------------------------------------------------- #
+    def insert(self, index: int, node) -> None:
+        self.codes[index:index] = self._encode([node])
+        self._modified()
+
+    def append(self, node) -> None:
+        self.codes.extend(self._encode([node]))
+        self._modified()
+
+    def extend(self, nodes: Iterable) -> None:
+        self.codes.extend(self._encode(nodes))
+        self._modified()
+
+    # -------------------------------------------------------- #
+    def __eq__(self, other) -> bool:
+        if isinstance(other, CompactTree):
+            other = list(other)
+        return list(self) == other
+
+    __hash__ = None
+
+    # -------------------------------------------------------- #
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({list(self)!r})'
+
+    # -------------------------------------------------------- #
+    def __str__(self) -> str:
+        return PrimitiveTree.__str__(self)
+
+    # -------------------------------------------------------- #
+    @classmethod
+    def from_string(cls, string: str, prim_set: PrimitiveSetTyped) -> CompactTree:
+        """
+        Converts a string expression into a CompactTree given a
+        PrimitiveSet **p_set**. The primitive set needs to contain
+        every primitive present in the expression.
+
+        :param string: String representation of a Python expression.
+        :param prim_set: Primitive set from which primitives are selected.
+        :return: CompactTree populated with the deserialized primitives.
+        """
+        return cls(PrimitiveTree.from_string(string, prim_set), prim_set)
+
+    # -------------------------------------------------------- #
+    @classmethod
+    def from_strings(cls, strings: Iterable[str],
+                     prim_set: PrimitiveSetTyped) -> list[CompactTree]:
+        """
+        Converts many string expressions into CompactTrees given
+        a PrimitiveSet **p_set**. See :meth:`PrimitiveTree.from_strings`.
+
+        :param strings: String representations of Python expressions.
+        :param prim_set: Primitive set from which primitives are selected.
+        :return: A list of CompactTrees in the order of the **strings**.
+        """
+        trees = PrimitiveTree.from_strings(strings, prim_set)
+        return [cls(tree, prim_set) for tree in trees]
+
+    # -------------------------------------------------------- #
+    def search_subtree(self, begin: int) -> slice:
+        """
+        Returns a slice object that corresponds to the
+        range of values that defines the subtree which
+        has the element with index 'begin' as its root.
+
+        :param begin: Index of the root of the subtree.
+        :return: Slice object that corresponds to the range
+            of values that defines the subtree.
+        """
+        ends, _ = self.subtree_index()
+        return slice(begin, ends[begin])
+
+    # -------------------------------------------------------- #
+    def subtree_index(self) -> tuple:
+        """
+        Returns a tuple of the subtree end positions and the node
+        depths, as in the *'subtree_index'* method of the *'PrimitiveTree'*.
+
+        :return: A tuple of the subtree end positions and the node depths.
+        """
+        if self._index is None:
+            ends, depths = [0] * len(self), [0] * len(self)
+            stack, arities = list(), self._table.arities
+            for i, code in enumerate(self.codes):
+                depths[i] = len(stack)
+                stack.append([i, arities[code] if code >= 0 else 0])
+                while stack and stack[-1][1] == 0:
+                    ends[stack.pop()[0]] = i + 1
+                    if not stack:
+                        break
+                    stack[-1][1] -= 1
+            self._index = (tuple(ends), tuple(depths))
+        return self._index
+
+    # -------------------------------------------------------- #
+    @property
+    def height(self) -> int:
+        """
+        The height of the tree or the depth of the deepest node.
+        """
+        _, depths = self.subtree_index()
+        return max(depths, default=0)
+
+    # -------------------------------------------------------- #
+    @property
+    def root(self):
+        """
+        The root of the tree (element 0 in the list).
+        """
+        return self[0]
+
+    # -------------------------------------------------------- #
+    def _encode(self, nodes: Iterable) -> array:
+        codes, table = array('i'), self._table
+        for node in nodes:
+            if isinstance(node, Terminal) and node.conv_fct is repr:
+                codes.append(-len(self.values) - 1)
+                self.values.append(node.value)
+                self.kinds.append(table.kind_code((type(node), node.ret)))
+            else:
+                codes.append(table.node_code(node))
+        return codes
+
+    # -------------------------------------------------------- #
+    def _decode(self, code: int):
+        if code >= 0:
+            return self._table.nodes[code]
+        index = -code - 1
+        cls, ret = self._table.kinds[self.kinds[index]]
+        node = cls.__new__(cls)
+        node.value = self.values[index]
+        node.name = str(node.value)
+        node.ret = ret
+        node.conv_fct = repr
+        return node
+
+    # -------------------------------------------------------- #
+    def _discard(self, codes: array) -> None:
+        self._garbage += sum(1 for code in codes if code < 0)
+
+    # -------------------------------------------------------- #
+    def _modified(self) -> None:
+        self._index = None
+        if self._garbage > 16 and self._garbage * 2 > len(self.values):
+            values, kinds = list(), array('i')
+            for i, code in enumerate(self.codes):
+                if code < 0:
+                    values.append(self.values[-code - 1])
+                    kinds.append(self.kinds[-code - 1])
+                    self.codes[i] = -len(values)
+            self.values, self.kinds = values, kinds
+            self._garbage = 0
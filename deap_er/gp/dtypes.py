@@ -24,6 +24,7 @@
 #                                                                                        #
 # ====================================================================================== #
 from .primitives import *
+from .compact import *
 from typing import Tuple, Union
 
 
@@ -33,7 +34,7 @@ __all__ = [
 ]
 
 
-GPIndividual = Union[list, PrimitiveTree]
+GPIndividual = Union[list, PrimitiveTree, CompactTree]
 """:meta private:"""
 
 GPMates = Tuple[GPIndividual, GPIndividual]
@@ -42,7 +43,7 @@ GPMates = Tuple[GPIndividual, GPIndividual]
 GPMutant = Tuple[GPIndividual]
 """:meta private:"""
 
-GPExprTypes = Union[str, PrimitiveTree]
+GPExprTypes = Union[str, PrimitiveTree, CompactTree]
 """:meta private:"""
 
 GPTypedSets = list[PrimitiveSetTyped]
@@ -0,0 +1,159 @@
+# ====================================================================================== #
+#                                                                                        #
+#   MIT License                                                                          #
+#                                                                                        #
+#   Copyright (c) 2022 - Mattias Aabmets, The DEAP Team and Other Contributors           #
+#                                                                                        #
+#   Permission is hereby granted, free of charge, to any person obtaining a copy         #
+#   of this software and associated documentation files (the "Software"), to deal        #
+#   in the Software without restriction, including without limitation the rights         #
+#   to use, copy, modify, merge, publish, distribute, sublicense, and/or sell            #
+#   copies of the Software, and to permit persons to whom the Software is                #
+#   furnished to do so, subject to the following conditions:                             #
+#                                                                                        #
+#   The above copyright notice and this permission notice shall be included in all       #
+#   copies or substantial portions of the Software.                                      #
+#                                                                                        #
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR           #
+#   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,             #
+#   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE          #
+#   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER               #
+#   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,        #
+#   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE        #
+#   SOFTWARE.                                                                            #
+#                                                                                        #
+# ====================================================================================== #
+from .dtypes import *
+from .primitives import *
+from .cache import SemanticCache
+from typing import Optional
+import numpy
+
+
+__all__ = ['DatasetEvaluator']
+
+
+# ====================================================================================== #
+class DatasetEvaluator:
+    """
+    Evaluates trees on a whole dataset at once, where every argument of the
+    primitive set is a column of the **data** and the primitives are expected
+    to operate on NumPy arrays. The result vectors of the subtrees are cached
+    by the structure of the subtrees in a :class:`SemanticCache`, so subtrees
+    that are shared between the individuals are computed only once. Since
+    crossover and mutation replace a single subtree, an offspring only
+    recomputes the path from the replaced subtree to the root.
+
+    :param prim_set: The primitive set of the trees.
+    :param data: A (samples x features) array, where the features
+        correspond to the arguments of the primitive set. A one-dimensional
+        array is accepted when the primitive set has a single argument.
+    :param max_bytes: The memory budget of the cached results in bytes,
+        optional. When the budget is exceeded, the least recently used
+        results are evicted. The default is 256 MiB.
+    """
+    _max_keys = 1 << 20
+
+    # -------------------------------------------------------- #
+    def __init__(self, prim_set: PrimitiveSetTyped, data: numpy.ndarray,
+                 max_bytes: Optional[int] = 1 << 28) -> None:
+        data = numpy.asarray(data)
+        if data.ndim == 1:
+            data = data.reshape(-1, 1)
+        if data.shape[1] != len(prim_set.arguments):
+            raise ValueError(
+                f'The data has {data.shape[1]} features, but the primitive '
+                f'set has {len(prim_set.arguments)} arguments.'
+            )
+        self.prim_set = prim_set
+        self.data = data
+        self.cache = SemanticCache(max_bytes)
+        self._columns = {
+            name: data[:, i] for i, name in enumerate(prim_set.arguments)
+        }
+        self._keys = dict()
+
+    # -------------------------------------------------------- #
+    def __call__(self, expr: GPIndividual) -> numpy.ndarray:
+        """
+        Evaluates the **expr** on the dataset.
+
+        :param expr: The tree to evaluate.
+        :return: A vector of the results of the tree for every sample.
+        """
+        if len(self._keys) > self._max_keys:
+            self.clear()
+        keys, ends = self._subtree_keys(expr)
+        visit, found = list(), dict()
+        i = 0
+        while i < len(expr):
+            visit.append(i)
+            if isinstance(expr[i], Primitive):
+                value = self.cache.get(keys[i])
+                if value is not None:
+                    found[i] = value
+                    i = ends[i]
+                    continue
+            i += 1
+
+        context = self.prim_set.context
+        stack = list()
+        for i in reversed(visit):
+            node = expr[i]
+            if i in found:
+                stack.append(found[i])
+            elif isinstance(node, Primitive):
+                args = [stack.pop() for _ in range(node.arity)]
+                value = context[node.name](*args)
+                self.cache.put(keys[i], value)
+                stack.append(value)
+            else:
+                stack.append(self._terminal(node))
+        return numpy.broadcast_to(stack[0], (len(self.data),))
+
+    # -------------------------------------------------------- #
+    def evaluate_population(self, population: list) -> list:
+        """
+        Evaluates all the individuals of the **population**. The cache is kept
+        between the calls, so the offspring reuse the results of their parents.
+
+        :param population: A list of trees to evaluate.
+        :return: A list of the result vectors of the individuals.
+        """
+        return [self(ind) for ind in population]
+
+    # -------------------------------------------------------- #
+    def clear(self) -> None:
+        """
+        Removes all the cached results and resets the counters.
+
+        :return: Nothing.
+        """
+        self._keys.clear()
+        self.cache.clear()
+
+    # -------------------------------------------------------- #
+    def _subtree_keys(self, expr: GPIndividual) -> tuple:
+        interned = self._keys
+        keys, ends = [0] * len(expr), [0] * len(expr)
+        stack = list()
+        for i in reversed(range(len(expr))):
+            node = expr[i]
+            if isinstance(node, Primitive):
+                children = [stack.pop() for _ in range(node.arity)]
+                ident = (node.name, *[keys[child] for child in children])
+                ends[i] = ends[children[-1]] if children else i + 1
+            else:
+                ident = (node.format(),)
+                ends[i] = i + 1
+            keys[i] = interned.setdefault(ident, len(interned))
+            stack.append(i)
+        return keys, ends
+
+    # -------------------------------------------------------- #
+    def _terminal(self, node: Terminal) -> object:
+        if node.conv_fct is str:
+            if node.value in self._columns:
+                return self._columns[node.value]
+            return self.prim_set.context[node.value]
+        return node.value
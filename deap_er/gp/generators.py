@@ -27,10 +27,9 @@ from .primitives import PrimitiveSetTyped
 from typing import Callable, Optional, Any
 from inspect import isclass
 import random
-import sys
 
 
-__all__ = ['generate', 'gen_full', 'gen_grow', 'gen_half_and_half']
+__all__ = ['generate', 'gen_full', 'gen_grow', 'gen_half_and_half', 'gen_batch']
 
 
 # ====================================================================================== #
@@ -42,6 +41,10 @@ def generate(prim_set: PrimitiveSetTyped, min_depth: int,
     The tree is built from the root to the leaves. It recursively grows each branch
     until the **condition** is fulfilled. The returned list can then be used to
     instantiate a 'PrimitiveTree' object to build the actual tree object.
+    The primitives are sampled only from the ones which can complete the
+    branch within the chosen height, as given by the precomputed tables of
+    the *'feasible_primitives'* method, so strongly typed sets do not fail on
+    types that have no terminals.
 
     :param prim_set: Primitive set from which primitives are selected.
     :param min_depth: Minimum depth of the random tree.
@@ -62,29 +65,32 @@ def generate(prim_set: PrimitiveSetTyped, min_depth: int,
     stack = [(0, ret_type)]
     while len(stack) != 0:
         depth, ret_type = stack.pop()
-        if condition(height, depth):
-            try:
-                term = random.choice(prim_set.terminals[ret_type])
-                if isclass(term):
-                    term = term()
-                expr.append(term)
-            except IndexError:
-                _, _, traceback = sys.exc_info()
-                raise IndexError(
-                    err_msg.format('terminal', ret_type)
-                ).with_traceback(traceback)
-        else:
-            try:
-                prim = prim_set.primitives[ret_type]
-                prim = random.choice(prim)
-                expr.append(prim)
-                for arg in reversed(prim.args):
-                    stack.append((depth + 1, arg))
-            except IndexError:
-                _, _, traceback = sys.exc_info()
-                raise IndexError(
-                    err_msg.format('primitive', ret_type)
-                ).with_traceback(traceback)
+        terms = prim_set.terminals[ret_type]
+        is_leaf = condition(height, depth)
+        if is_leaf and terms:
+            term = random.choice(terms)
+            if isclass(term):
+                term = term()
+            expr.append(term)
+            continue
+
+        prims = prim_set.feasible_primitives(ret_type, max(height - depth, 0))
+        if not prims and terms:
+            term = random.choice(terms)
+            if isclass(term):
+                term = term()
+            expr.append(term)
+            continue
+        if not prims:
+            shortest = prim_set.min_height(ret_type)
+            prims = prim_set.feasible_primitives(ret_type, shortest)
+        if not prims:
+            kind = 'terminal' if is_leaf else 'primitive'
+            raise IndexError(err_msg.format(kind, ret_type))
+        prim = random.choice(prims)
+        expr.append(prim)
+        for arg in reversed(prim.args):
+            stack.append((depth + 1, arg))
     return expr
 
 
@@ -144,3 +150,29 @@ def gen_half_and_half(prim_set: PrimitiveSetTyped, min_depth: int,
     choices = (gen_grow, gen_full)
     func = random.choice(choices)
     return func(prim_set, min_depth, max_depth, ret_type)
+
+
+# -------------------------------------------------------------------------------------- #
+def gen_batch(prim_set: PrimitiveSetTyped, count: int, min_depth: int,
+              max_depth: int, ret_type: Optional[Any] = None,
+              generator: Optional[Callable] = None) -> list:
+    """
+    Generates a batch of **count** expressions, for example to initialize
+    a population. The feasibility tables of the primitive set are built
+    once for every depth up to **max_depth** before the generation.
+
+    :param prim_set: Primitive set from which primitives are selected.
+    :param count: The number of expressions to generate.
+    :param min_depth: Minimum depth of the random trees.
+    :param max_depth: Maximum depth of the random trees.
+    :param ret_type: The type that should return the trees when called,
+        optional. If not provided, the type of 'p_set.ret' is used.
+    :param generator: The generator function of a single expression,
+        optional. The default is *'gen_half_and_half'*.
+    :return: A list of the generated expressions.
+    """
+    generator = generator or gen_half_and_half
+    for type_ in list(prim_set.primitives):
+        for budget in range(max_depth + 1):
+            prim_set.feasible_primitives(type_, budget)
+    return [generator(prim_set, min_depth, max_depth, ret_type) for _ in range(count)]
@@ -28,6 +28,7 @@ from deap_er.records import Logbook
 from deap_er.base import Toolbox
 from typing import Callable
 import random
+import heapq
 import math
 
 
@@ -96,7 +97,6 @@ def harm(toolbox: Toolbox,
 
     # -------------------------------------------------------- #
     def _harm_accept_func(s: int) -> bool:
-        prob_hist = [t / n if n > 0 else t for n, t in zip(natural_hist, target_hist)]
         prob = prob_hist[s] if s < len(prob_hist) else _harm_target_func(s)
         return random.random() <= prob
 
@@ -145,16 +145,13 @@ def harm(toolbox: Toolbox,
     logbook = Logbook()
     logbook.header = ['gen', 'nevals'] + (stats.fields if stats else [])
 
-    invalid_ind = [ind for ind in population if not ind.fitness.is_valid()]
-    fitness = toolbox.map(toolbox.evaluate, invalid_ind)
-    for ind, fit in zip(invalid_ind, fitness):
-        ind.fitness.values = fit
+    nevals = _evaluate(toolbox, population)
 
     if hof is not None:
         hof.update(population)
 
     record = stats.compile(population) if stats else {}
-    logbook.record(gen=0, nevals=len(invalid_ind), **record)
+    logbook.record(gen=0, nevals=nevals, **record)
 
     if verbose:
         print(logbook.stream)
@@ -175,9 +172,19 @@ def harm(toolbox: Toolbox,
                 natural_hist[ind_size - 2] += 0.1
 
         natural_hist = [val * len(population) / nb_model for val in natural_hist]
-        sorted_natural = sorted(natural_pop, key=lambda ind: ind.fitness)
-        cutoff_candidates = sorted_natural[int(len(population) * rho - 1):]
-        cutoff_size = max(min_cutoff, len(min(cutoff_candidates, key=len)))
+        nevals = _evaluate(toolbox, natural_pop)
+
+        worst = heapq.nsmallest(
+            int(len(population) * rho - 1),
+            range(len(natural_pop)),
+            key=lambda i: natural_pop[i].fitness.wvalues
+        )
+        excluded = set(worst)
+        smallest = min(
+            size for i, size in enumerate(natural_pop_sizes)
+            if i not in excluded
+        )
+        cutoff_size = max(min_cutoff, smallest)
 
         target_hist = list()
         for bin_idx in range(len(natural_hist)):
@@ -186,6 +193,7 @@ def harm(toolbox: Toolbox,
             else:
                 target = _harm_target_func(bin_idx)
                 target_hist.append(target)
+        prob_hist = [t / n if n > 0 else t for n, t in zip(natural_hist, target_hist)]
 
         offspring, _ = _harm_gen_pop(
             n=len(population),
@@ -193,19 +201,25 @@ def harm(toolbox: Toolbox,
             accept_func=_harm_accept_func
         )
 
-        invalid_ind = [ind for ind in offspring if not ind.fitness.is_valid()]
-        fitness = toolbox.map(toolbox.evaluate, invalid_ind)
-        for ind, fit in zip(invalid_ind, fitness):
-            ind.fitness.values = fit
+        nevals += _evaluate(toolbox, offspring)
 
         if hof is not None:
             hof.update(offspring)
 
         population[:] = offspring
         record = stats.compile(population) if stats else {}
-        logbook.record(gen=gen, nevals=len(invalid_ind), **record)
+        logbook.record(gen=gen, nevals=nevals, **record)
 
         if verbose:
             print(logbook.stream)
 
     return population, logbook
+
+
+# -------------------------------------------------------------------------------------- #
+def _evaluate(toolbox: Toolbox, individuals: list) -> int:
+    invalid_ind = [ind for ind in individuals if not ind.fitness.is_valid()]
+    fitness = toolbox.map(toolbox.evaluate, invalid_ind)
+    for ind, fit in zip(invalid_ind, fitness):
+        ind.fitness.values = fit
+    return len(invalid_ind)
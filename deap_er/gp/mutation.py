@@ -84,8 +84,7 @@ def mut_node_replacement(individual: GPIndividual,
             term = term()
         individual[index] = term
     else:
-        node_ret = prim_set.primitives[node.ret]
-        prims = [p for p in node_ret if p.args == node.args]
+        prims = prim_set.primitives_like(node.ret, node.args)
         individual[index] = random.choice(prims)
 
     return individual,
@@ -141,11 +140,7 @@ def mut_insert(individual: GPIndividual,
     slice_ = individual.search_subtree(index)
     choice = random.choice
 
-    primitives = list()
-    for p in prim_set.primitives[node.ret]:
-        if node.ret in p.args:
-            primitives.append(p)
-
+    primitives = prim_set.primitives_accepting(node.ret)
     if len(primitives) == 0:
         return individual,
 
@@ -24,11 +24,12 @@
 #                                                                                        #
 # ====================================================================================== #
 from __future__ import annotations
-from collections import defaultdict, deque
+from collections import defaultdict
 from typing import Union, Type, Callable, Iterable, Any
+from .cache import CompileCache
 import copy
 import abc
-import re
+import ast
 
 
 __all__ = [
@@ -139,13 +140,20 @@ class PrimitiveSetTyped:
     :param in_types: The list of input types.
     :param ret_type: The return type.
     :param prefix: The prefix of the primitive set.
+    :param engine: The execution engine of the compiled trees, optional.
+        The *'eval'* engine evaluates the generated Python code, while the
+        *'stack'* engine interprets the nodes of the trees with an explicit
+        value stack, which has no depth limit. The default is *'eval'*.
     """
     # -------------------------------------------------------- #
-    def __init__(self, name: str, in_types: list,
-                 ret_type: type, prefix: str = "ARG") -> None:
+    def __init__(self, name: str, in_types: list, ret_type: type,
+                 prefix: str = "ARG", engine: str = "eval") -> None:
+        if engine not in ("eval", "stack"):
+            raise ValueError(f'Unknown execution engine: \'{engine}\'.')
         self.name = name
         self.ins = in_types
         self.ret = ret_type
+        self.engine = engine
 
         self.terminals = defaultdict(list)
         self.primitives = defaultdict(list)
@@ -154,6 +162,12 @@ class PrimitiveSetTyped:
         self.mapping = dict()
         self.terms_count = 0
         self.prims_count = 0
+        self.compile_cache = CompileCache()
+        self.simplifier = None
+        self._heights = None
+        self._feasible = dict()
+        self._signatures = dict()
+        self._inserters = dict()
 
         for i, type_ in enumerate(in_types):
             arg_str = "{prefix}{index}".format(prefix=prefix, index=i)
@@ -176,6 +190,10 @@ class PrimitiveSetTyped:
 
     # -------------------------------------------------------- #
     def _add_prim(self, prim: Union[Primitive, Terminal, Type[Ephemeral]]) -> None:
+        self._heights = None
+        self._feasible.clear()
+        self._signatures.clear()
+        self._inserters.clear()
         self._add_type(self.primitives, prim.ret)
         self._add_type(self.terminals, prim.ret)
         self.mapping[prim.name] = prim
@@ -326,6 +344,100 @@ class PrimitiveSetTyped:
                 self.mapping[new_name].value = new_name
                 del self.mapping[old_name]
 
+    # -------------------------------------------------------- #
+    def min_height(self, ret_type: type) -> Union[int, float]:
+        """
+        Returns the minimum height of a tree that returns the **ret_type**.
+        The heights of all the types are computed once and then cached
+        until the set is modified.
+
+        :param ret_type: The return type of the tree.
+        :return: The minimum height of the tree or infinity,
+            if no finite tree can return the type.
+        """
+        if self._heights is None:
+            types = set(self.primitives) | set(self.terminals)
+            heights = {t: 0 if self.terminals[t] else float('inf') for t in types}
+            changed = True
+            while changed:
+                changed = False
+                for type_ in types:
+                    for prim in self.primitives[type_]:
+                        height = self._prim_height(prim, heights)
+                        if height < heights[type_]:
+                            heights[type_] = height
+                            changed = True
+            self._heights = heights
+        return self._heights.get(ret_type, float('inf'))
+
+    # -------------------------------------------------------- #
+    def feasible_primitives(self, ret_type: type, budget: int) -> list:
+        """
+        Returns the primitives of the **ret_type**, which can be completed into
+        a tree of at most the **budget** height. The lists are precomputed for
+        every type and budget on the first use and cached until the set is
+        modified. When every primitive fits into the budget, the list is the
+        same as the list of all the primitives of the type.
+
+        :param ret_type: The return type of the primitives.
+        :param budget: The maximum height of the subtree.
+        :return: A list of the feasible primitives, which may be empty.
+        """
+        key = (ret_type, budget)
+        if key not in self._feasible:
+            self.min_height(ret_type)
+            prims = self.primitives[ret_type]
+            heights = [self._prim_height(p, self._heights) for p in prims]
+            if all(h <= budget for h in heights):
+                self._feasible[key] = prims
+            else:
+                fits = [p for p, h in zip(prims, heights) if h <= budget]
+                self._feasible[key] = fits
+        return self._feasible[key]
+
+    # -------------------------------------------------------- #
+    def primitives_like(self, ret_type: type, args: list) -> list:
+        """
+        Returns the primitives of the **ret_type**, which have the same argument
+        types as the **args**. The lists are indexed by the argument signature
+        on the first use and cached until the set is modified.
+
+        :param ret_type: The return type of the primitives.
+        :param args: The list of the argument types of the primitives.
+        :return: A list of the primitives with the given signature.
+        """
+        key = (ret_type, tuple(args))
+        if key not in self._signatures:
+            table = defaultdict(list)
+            for prim in self.primitives[ret_type]:
+                table[tuple(prim.args)].append(prim)
+            for signature, prims in table.items():
+                self._signatures[(ret_type, signature)] = prims
+            self._signatures.setdefault(key, [])
+        return self._signatures[key]
+
+    # -------------------------------------------------------- #
+    def primitives_accepting(self, ret_type: type) -> list:
+        """
+        Returns the primitives of the **ret_type**, which also take an argument
+        of the **ret_type**, so that they can be inserted above a node of that
+        type. The lists are cached until the set is modified.
+
+        :param ret_type: The return type and the argument type of the primitives.
+        :return: A list of the primitives that accept the type.
+        """
+        if ret_type not in self._inserters:
+            prims = [p for p in self.primitives[ret_type] if ret_type in p.args]
+            self._inserters[ret_type] = prims
+        return self._inserters[ret_type]
+
+    # -------------------------------------------------------- #
+    @staticmethod
+    def _prim_height(prim: Primitive, heights: dict) -> Union[int, float]:
+        if not prim.args:
+            return 0
+        return 1 + max(heights.get(arg, float('inf')) for arg in prim.args)
+
     # -------------------------------------------------------- #
     @property
     def terminal_ratio(self):
@@ -344,11 +456,12 @@ class PrimitiveSet(PrimitiveSetTyped):
     :param name: The name of the primitive set.
     :param arity: The arity of the primitive set.
     :param prefix: The prefix of the primitive set.
+    :param engine: The execution engine of the compiled trees, optional.
     """
     # -------------------------------------------------------- #
-    def __init__(self, name: str, arity: int, prefix: str = "ARG"):
+    def __init__(self, name: str, arity: int, prefix: str = "ARG", engine: str = "eval"):
         args = [object] * arity
-        super().__init__(name, args, object, prefix)
+        super().__init__(name, args, object, prefix, engine)
 
     # -------------------------------------------------------- #
     def add_primitive(self, primitive: Callable, arity: int, name: str = None, *_, **__) -> None:
@@ -375,8 +488,15 @@ class PrimitiveTree(list):
     with a list of primitives and terminals. The nodes appended to the tree are
     required to have the *'arity'* attribute, which defines the arity of the primitive.
 
+    The end positions of the subtrees and the depths of the nodes are indexed
+    lazily in a single pass on the first query and the index is invalidated
+    by every modification of the tree, which makes the repeated calls of the
+    *'search_subtree'* method and the *'height'* property O(1) operations.
+
     :param content: List of primitives and terminals to be added to the tree.
     """
+    _index = None
+
     # -------------------------------------------------------- #
     def __init__(self, content: Iterable):
         super().__init__(content)
@@ -384,7 +504,9 @@ class PrimitiveTree(list):
     # -------------------------------------------------------- #
     def __deepcopy__(self, memo: dict):
         new = self.__class__(self)
-        new.__dict__.update(copy.deepcopy(self.__dict__, memo))
+        state = {k: v for k, v in self.__dict__.items() if k != '_index'}
+        new.__dict__.update(copy.deepcopy(state, memo))
+        new._index = self._index
         return new
 
     # -------------------------------------------------------- #
@@ -409,6 +531,52 @@ class PrimitiveTree(list):
                 "of a different arity is not allowed."
             )
         list.__setitem__(self, key, val)
+        self._index = None
+
+    # -------------------------------------------------------- #
+    def __delitem__(self, key):
+        list.__delitem__(self, key)
+        self._index = None
+
+    def __iadd__(self, other):
+        self._index = None
+        return list.__iadd__(self, other)
+
+    def __imul__(self, other):
+        self._index = None
+        return list.__imul__(self, other)
+
+    def append(self, node):
+        list.append(self, node)
+        self._index = None
+
+    def extend(self, nodes):
+        list.extend(self, nodes)
+        self._index = None
+
+    def insert(self, index, node):
+        list.insert(self, index, node)
+        self._index = None
+
+    def pop(self, index=-1):
+        self._index = None
+        return list.pop(self, index)
+
+    def remove(self, node):
+        list.remove(self, node)
+        self._index = None
+
+    def clear(self):
+        list.clear(self)
+        self._index = None
+
+    def reverse(self):
+        list.reverse(self)
+        self._index = None
+
+    def sort(self, *args, **kwargs):
+        list.sort(self, *args, **kwargs)
+        self._index = None
 
     # -------------------------------------------------------- #
     def __str__(self):
@@ -437,42 +605,24 @@ class PrimitiveTree(list):
         :param prim_set: Primitive set from which primitives are selected.
         :return: PrimitiveTree populated with the deserialized primitives.
         """
-        tokens = re.split("[ \t\n\r\f\v(),]", string)
-        expr = list()
-        ret_types = deque()
-        for token in tokens:
-            if token == '':
-                continue
-            if len(ret_types) != 0:
-                ret_type = ret_types.popleft()
-            else:
-                ret_type = None
+        return cls(_parse_expr(string, prim_set, dict()))
 
-            if token in prim_set.mapping:
-                primitive = prim_set.mapping[token]
-                if ret_type is not None and not issubclass(primitive.ret, ret_type):
-                    raise TypeError(
-                        f'Primitive {primitive} return type {primitive.ret} '
-                        f'does not match the expected one: {ret_type}.'
-                    )
-                expr.append(primitive)
-                if isinstance(primitive, Primitive):
-                    ret_types.extendleft(reversed(primitive.args))
-            else:
-                try:
-                    token = eval(token)
-                except NameError:
-                    raise TypeError(f'Unable to evaluate terminal: {token}.')
-                if ret_type is None:
-                    ret_type = type(token)
-                if not issubclass(type(token), ret_type):
-                    raise TypeError(
-                        f'Terminal {token} type {type(token)} does '
-                        f'not match the expected one: {ret_type}.'
-                    )
-                prim = Terminal(token, False, ret_type)
-                expr.append(prim)
-        return cls(expr)
+    # -------------------------------------------------------- #
+    @classmethod
+    def from_strings(cls, strings: Iterable[str],
+                     prim_set: PrimitiveSetTyped) -> list[PrimitiveTree]:
+        """
+        Converts many string expressions into PrimitiveTrees given
+        a PrimitiveSet **p_set**, for example when reloading a dump
+        of a hall of fame. The terminals parsed from the literals are
+        shared between the trees of the batch.
+
+        :param strings: String representations of Python expressions.
+        :param prim_set: Primitive set from which primitives are selected.
+        :return: A list of PrimitiveTrees in the order of the **strings**.
+        """
+        literals = dict()
+        return [cls(_parse_expr(s, prim_set, literals)) for s in strings]
 
     # -------------------------------------------------------- #
     def search_subtree(self, begin: int) -> slice:
@@ -485,12 +635,33 @@ class PrimitiveTree(list):
         :return: Slice object that corresponds to the range
             of values that defines the subtree.
         """
-        end = begin + 1
-        total = self[begin].arity
-        while total > 0:
-            total += self[end].arity - 1
-            end += 1
-        return slice(begin, end)
+        ends, _ = self.subtree_index()
+        return slice(begin, ends[begin])
+
+    # -------------------------------------------------------- #
+    def subtree_index(self) -> tuple:
+        """
+        Returns the index of the tree, which is built in a single pass
+        and cached until the tree is modified. The index consists of a
+        tuple of the end positions of the subtrees which are rooted at
+        each node and a tuple of the depths of the nodes. The size of
+        the subtree rooted at the node *'i'* is *'ends[i] - i'*.
+
+        :return: A tuple of the subtree end positions and the node depths.
+        """
+        if self._index is None:
+            ends, depths = [0] * len(self), [0] * len(self)
+            stack = list()
+            for i, node in enumerate(self):
+                depths[i] = len(stack)
+                stack.append([i, node.arity])
+                while stack and stack[-1][1] == 0:
+                    ends[stack.pop()[0]] = i + 1
+                    if not stack:
+                        break
+                    stack[-1][1] -= 1
+            self._index = (tuple(ends), tuple(depths))
+        return self._index
 
     # -------------------------------------------------------- #
     @property
@@ -498,13 +669,8 @@ class PrimitiveTree(list):
         """
         The height of the tree or the depth of the deepest node.
         """
-        stack = [0]
-        max_depth = 0
-        for elem in self:
-            depth = stack.pop()
-            max_depth = max(max_depth, depth)
-            stack.extend([depth + 1] * elem.arity)
-        return max_depth
+        _, depths = self.subtree_index()
+        return max(depths, default=0)
 
     # -------------------------------------------------------- #
     @property
@@ -513,3 +679,56 @@ class PrimitiveTree(list):
         The root of the tree (element 0 in the list).
         """
         return self[0]
+
+
+# ====================================================================================== #
+_DELIMITERS = str.maketrans("(),", "   ")
+
+
+# -------------------------------------------------------------------------------------- #
+def _parse_literal(token: str) -> Any:
+    for convert in (int, float):
+        try:
+            return convert(token)
+        except ValueError:
+            pass
+    try:
+        return ast.literal_eval(token)
+    except (ValueError, SyntaxError):
+        raise TypeError(f'Unable to evaluate terminal: {token}.')
+
+
+# -------------------------------------------------------------------------------------- #
+def _parse_expr(string: str, prim_set: PrimitiveSetTyped, literals: dict) -> list:
+    mapping = prim_set.mapping
+    expr = list()
+    ret_types = list()
+    for token in string.translate(_DELIMITERS).split():
+        ret_type = ret_types.pop() if ret_types else None
+        primitive = mapping.get(token)
+        if primitive is not None:
+            if ret_type is not None and not issubclass(primitive.ret, ret_type):
+                raise TypeError(
+                    f'Primitive {primitive} return type {primitive.ret} '
+                    f'does not match the expected one: {ret_type}.'
+                )
+            expr.append(primitive)
+            if isinstance(primitive, Primitive):
+                ret_types.extend(reversed(primitive.args))
+            continue
+
+        key = (token, ret_type)
+        terminal = literals.get(key)
+        if terminal is None:
+            value = _parse_literal(token)
+            if ret_type is None:
+                ret_type = type(value)
+            if not issubclass(type(value), ret_type):
+                raise TypeError(
+                    f'Terminal {value} type {type(value)} does '
+                    f'not match the expected one: {ret_type}.'
+                )
+            terminal = Terminal(value, False, ret_type)
+            literals[key] = terminal
+        expr.append(terminal)
+    return expr
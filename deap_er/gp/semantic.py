@@ -23,14 +23,21 @@
 #   SOFTWARE.                                                                            #
 #                                                                                        #
 # ====================================================================================== #
+from __future__ import annotations
 from .dtypes import *
 from .primitives import *
 from .generators import gen_grow
-from typing import Callable
+from .evaluation import DatasetEvaluator
+from typing import Callable, Optional, Any
 import random
+import copy
+import numpy
 
 
-__all__ = ['mut_semantic', 'cx_semantic']
+__all__ = [
+    'mut_semantic', 'cx_semantic',
+    'SemanticTree', 'GeometricSemantics'
+]
 
 
 # ====================================================================================== #
@@ -120,3 +127,200 @@ def _check(p_set: PrimitiveSetTyped, op: str) -> None:
             raise TypeError(
                 f'A \'{func}\' function is required to perform semantic \'{op}\'.'
             )
+
+
+# ====================================================================================== #
+class SemanticTree:
+    """
+    An individual of the geometric semantic GP, which is represented by its
+    semantics, the outputs on the training cases, and by a reference to the
+    way it was produced from its parents instead of the expanded expression.
+    The offspring share the structure of their parents, so their memory and
+    evaluation costs do not grow with the size of the equivalent tree.
+    Use the :class:`GeometricSemantics` to create and vary the individuals.
+
+    :param node: The derivation of the individual.
+    :param semantics: The outputs of the individual on the training cases.
+    """
+    # -------------------------------------------------------- #
+    def __init__(self, node: tuple, semantics: numpy.ndarray) -> None:
+        self.node = node
+        self.semantics = semantics
+
+    # -------------------------------------------------------- #
+    def __deepcopy__(self, memo: dict) -> SemanticTree:
+        new = self.__class__.__new__(self.__class__)
+        for key, value in self.__dict__.items():
+            if key not in ('node', 'semantics'):
+                value = copy.deepcopy(value, memo)
+            new.__dict__[key] = value
+        return new
+
+
+# ====================================================================================== #
+class GeometricSemantics:
+    """
+    Implements the geometric semantic mutation and crossover on the
+    :class:`SemanticTree` individuals. The semantics of the offspring
+    are computed from the cached semantics of the parents and of the
+    random trees in O(cases) time, while the equivalent expressions
+    of the :func:`mut_semantic` and :func:`cx_semantic` operators are
+    only built on demand by the :meth:`expand` method.
+
+    :param prim_set: The primitive set of the trees. The primitives are
+        expected to operate on NumPy arrays, see :class:`DatasetEvaluator`.
+    :param data: A (samples x features) array of the training cases.
+    :param min_depth: Minimum depth of the random trees, optional.
+    :param max_depth: Maximum depth of the random trees, optional.
+    :param gen_func: The function which generates the random trees, optional.
+        The default is *'gen_grow'*.
+    """
+    # -------------------------------------------------------- #
+    def __init__(self, prim_set: PrimitiveSetTyped, data: numpy.ndarray,
+                 min_depth: int = 2, max_depth: int = 6,
+                 gen_func: Callable = None) -> None:
+        self.prim_set = prim_set
+        self.evaluator = DatasetEvaluator(prim_set, data)
+        self.min_depth = min_depth
+        self.max_depth = max_depth
+        self.gen_func = gen_func or gen_grow
+
+    # -------------------------------------------------------- #
+    def make(self, container: type, generator: Callable) -> SemanticTree:
+        """
+        Creates an individual from a tree of the **generator**.
+
+        :param container: The type of the individual, a subclass
+            of the :class:`SemanticTree`.
+        :param generator: A function which generates the expression.
+        :return: The new individual.
+        """
+        tree = PrimitiveTree(generator())
+        return container(('tree', tree), self._semantics(tree))
+
+    # -------------------------------------------------------- #
+    def mutate(self, individual: SemanticTree,
+               mut_step: Optional[float] = None) -> tuple[SemanticTree]:
+        """
+        Performs the geometric semantic mutation. The semantics of the
+        mutant are *'s + step * (lf(r1) - lf(r2))'*, where *'lf'* is the
+        logistic function and *'r1'*, *'r2'* are two random trees.
+
+        :param individual: The individual to be mutated.
+        :param mut_step: The mutation step, optional. The default
+            is a random value between 0 and 2.
+        :return: The mutated individual.
+        """
+        if mut_step is None:
+            mut_step = random.uniform(0, 2)
+        tr1 = self._random_tree()
+        tr2 = self._random_tree()
+        diff = _logistic(self._semantics(tr1)) - _logistic(self._semantics(tr2))
+        semantics = individual.semantics + mut_step * diff
+        node = ('mut', individual.node, mut_step, tr1, tr2)
+        return type(individual)(node, semantics),
+
+    # -------------------------------------------------------- #
+    def mate(self, ind1: SemanticTree,
+             ind2: SemanticTree) -> tuple[SemanticTree, SemanticTree]:
+        """
+        Performs the geometric semantic crossover. The semantics of the
+        offspring are *'s1 * lf(r) + (1 - lf(r)) * s2'* and vice versa,
+        where *'lf'* is the logistic function and *'r'* is a random tree.
+
+        :param ind1: The first individual to be mated.
+        :param ind2: The second individual to be mated.
+        :return: Two mated individuals.
+        """
+        tree = self._random_tree()
+        weight = _logistic(self._semantics(tree))
+        sem1 = ind1.semantics * weight + (1 - weight) * ind2.semantics
+        sem2 = ind2.semantics * weight + (1 - weight) * ind1.semantics
+        new_ind1 = type(ind1)(('cx', ind1.node, ind2.node, tree), sem1)
+        new_ind2 = type(ind2)(('cx', ind2.node, ind1.node, tree), sem2)
+        return new_ind1, new_ind2
+
+    # -------------------------------------------------------- #
+    def predict(self, individual: SemanticTree, data: numpy.ndarray) -> numpy.ndarray:
+        """
+        Evaluates the **individual** on new data. Every ancestor shared in
+        the derivation of the individual is evaluated only once.
+
+        :param individual: The individual to evaluate.
+        :param data: A (samples x features) array of the cases.
+        :return: A vector of the outputs for every sample.
+        """
+        evaluator = DatasetEvaluator(self.prim_set, data)
+
+        def compute(node, values):
+            if node[0] == 'tree':
+                return evaluator(node[1])
+            elif node[0] == 'mut':
+                diff = _logistic(evaluator(node[3])) - _logistic(evaluator(node[4]))
+                return values[id(node[1])] + node[2] * diff
+            weight = _logistic(evaluator(node[3]))
+            return values[id(node[1])] * weight + (1 - weight) * values[id(node[2])]
+
+        return _walk(individual.node, compute)
+
+    # -------------------------------------------------------- #
+    def expand(self, individual: SemanticTree) -> PrimitiveTree:
+        """
+        Builds the expression equivalent to the **individual**, as produced
+        by the :func:`mut_semantic` and :func:`cx_semantic` operators. The
+        primitive set must contain the *'lf'*, *'mul'*, *'add'* and *'sub'*
+        primitives. Note that the size of the expression can grow
+        exponentially with the number of crossovers.
+
+        :param individual: The individual to expand.
+        :return: The equivalent tree.
+        """
+        _check(self.prim_set, 'expansion')
+        mapping = self.prim_set.mapping
+        lf, mul, add, sub = (mapping[k] for k in ('lf', 'mul', 'add', 'sub'))
+
+        def compute(node, values):
+            if node[0] == 'tree':
+                return list(node[1])
+            elif node[0] == 'mut':
+                step = Terminal(node[2], False, object)
+                return [add, *values[id(node[1])], mul, step, sub,
+                        lf, *node[3], lf, *node[4]]
+            one = Terminal(1.0, False, object)
+            return [add, mul, *values[id(node[1])], lf, *node[3],
+                    mul, sub, one, lf, *node[3], *values[id(node[2])]]
+
+        return PrimitiveTree(_walk(individual.node, compute))
+
+    # -------------------------------------------------------- #
+    def _random_tree(self) -> PrimitiveTree:
+        expr = self.gen_func(self.prim_set, self.min_depth, self.max_depth)
+        return PrimitiveTree(expr)
+
+    # -------------------------------------------------------- #
+    def _semantics(self, tree: PrimitiveTree) -> numpy.ndarray:
+        return numpy.array(self.evaluator(tree), dtype=float)
+
+
+# -------------------------------------------------------------------------------------- #
+def _logistic(values: numpy.ndarray) -> numpy.ndarray:
+    return numpy.exp(-numpy.logaddexp(0, -values))
+
+
+# -------------------------------------------------------------------------------------- #
+def _walk(root: tuple, compute: Callable) -> Any:
+    values = dict()
+    stack = [root]
+    while stack:
+        node = stack[-1]
+        if id(node) in values:
+            stack.pop()
+            continue
+        parents = dict(tree=(), mut=node[1:2], cx=node[1:3])[node[0]]
+        pending = [p for p in parents if id(p) not in values]
+        if pending:
+            stack.extend(pending)
+            continue
+        stack.pop()
+        values[id(node)] = compute(node, values)
+    return values[id(root)]
@@ -0,0 +1,236 @@
+# ====================================================================================== #
+#                                                                                        #
+#   MIT License                                                                          #
+#                                                                                        #
+#   Copyright (c) 2022 - Mattias Aabmets, The DEAP Team and Other Contributors           #
+#                                                                                        #
+#   Permission is hereby granted, free of charge, to any person obtaining a copy         #
+#   of this software and associated documentation files (the "Software"), to deal        #
+#   in the Software without restriction, including without limitation the rights         #
+#   to use, copy, modify, merge, publish, distribute, sublicense, and/or sell            #
+#   copies of the Software, and to permit persons to whom the Software is                #
+#   furnished to do so, subject to the following conditions:                             #
+#                                                                                        #
+#   The above copyright notice and this permission notice shall be included in all       #
+#   copies or substantial portions of the Software.                                      #
+#                                                                                        #
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR           #
+#   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,             #
+#   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE          #
+#   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER               #
+#   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,        #
+#   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE        #
+#   SOFTWARE.                                                                            #
+#                                                                                        #
+# ====================================================================================== #
+from .dtypes import *
+from .primitives import *
+from typing import Callable, Optional, Iterable, Union, Any
+from functools import partial
+import cmath
+
+
+__all__ = [
+    'Simplifier', 'rule_identity',
+    'rule_absorbing', 'rule_cancel'
+]
+
+
+# ====================================================================================== #
+class Simplifier:
+    """
+    Rewrites trees into smaller equivalent trees before they are compiled.
+    The algebraic rules declared for the primitives are applied bottom-up
+    and, optionally, the calls of the pure primitives whose arguments are
+    all constant terminals, including the ephemeral constants, are folded
+    into a single terminal of their result.
+    A rule is a callable, which receives the primitive node and the list of
+    its already simplified argument subtrees, and returns either a subtree,
+    which replaces the node, or None to leave the node unchanged.
+
+    When the simplifier is assigned to the *'simplifier'* attribute of its
+    primitive set, the :func:`compile_tree` function compiles the simplified
+    trees, while the individuals themselves are left unchanged.
+
+    :param prim_set: The primitive set of the trees.
+    :param fold_constants: The names of the pure primitives, whose calls
+        on constant arguments are evaluated and replaced by their results,
+        optional. If True, all the primitives are treated as pure, which
+        changes the semantics of the sets with stateful or random primitives.
+        The default is False, which disables the folding.
+    """
+    # -------------------------------------------------------- #
+    def __init__(self, prim_set: PrimitiveSetTyped,
+                 fold_constants: Union[bool, Iterable[str]] = False) -> None:
+        if not isinstance(fold_constants, bool):
+            fold_constants = frozenset(fold_constants)
+            for name in fold_constants:
+                if not isinstance(prim_set.mapping.get(name), Primitive):
+                    raise ValueError(
+                        f'The primitive set has no primitive named \'{name}\'.'
+                    )
+        self.prim_set = prim_set
+        self.fold_constants = fold_constants
+        self.rules = dict()
+
+    # -------------------------------------------------------- #
+    def add_rule(self, name: str, rule: Callable) -> None:
+        """
+        Declares an algebraic rule for the primitive of the given name.
+        The rules of a primitive are tried in the order of declaration
+        and the first one that returns a subtree is applied.
+
+        :param name: The name of the primitive.
+        :param rule: The rule, which is called with the primitive node
+            and the list of its argument subtrees.
+        :return: Nothing.
+        """
+        node = self.prim_set.mapping.get(name)
+        if not isinstance(node, Primitive):
+            raise ValueError(f'The primitive set has no primitive named \'{name}\'.')
+        self.rules.setdefault(name, list()).append(rule)
+
+    # -------------------------------------------------------- #
+    def __call__(self, expr: GPExprTypes, in_place: Optional[bool] = False) -> GPIndividual:
+        """
+        Simplifies the **expr**.
+
+        :param expr: The expression to simplify.
+        :param in_place: If True, the nodes of the **expr** are replaced
+            with the simplified nodes, optional. The default is False.
+        :return: The simplified tree.
+
+        :type expr: :ref:`Expression <datatypes>`
+        """
+        if isinstance(expr, str):
+            expr = PrimitiveTree.from_string(expr, self.prim_set)
+        stack = list()
+        for node in reversed(expr):
+            if isinstance(node, Primitive):
+                args = [stack.pop() for _ in range(node.arity)]
+                stack.append(self._simplify(node, args))
+            else:
+                stack.append([node])
+        if not in_place:
+            return type(expr)(stack[0])
+        expr[0:len(expr)] = stack[0]
+        return expr
+
+    # -------------------------------------------------------- #
+    def _simplify(self, node: Primitive, args: list) -> list:
+        if self._is_pure(node) and args and all(map(_is_constant, args)):
+            folded = self._fold(node, args)
+            if folded is not None:
+                return folded
+        for rule in self.rules.get(node.name, ()):
+            result = rule(node, args)
+            if result is not None:
+                return list(result)
+        nodes = [node]
+        for arg in args:
+            nodes.extend(arg)
+        return nodes
+
+    # -------------------------------------------------------- #
+    def _is_pure(self, node: Primitive) -> bool:
+        if isinstance(self.fold_constants, bool):
+            return self.fold_constants
+        return node.name in self.fold_constants
+
+    # -------------------------------------------------------- #
+    def _fold(self, node: Primitive, args: list) -> Optional[list]:
+        func = self.prim_set.context[node.name]
+        try:
+            value = func(*[arg[0].value for arg in args])
+        except Exception:
+            return None
+        if not _is_literal(value) or not isinstance(value, node.ret):
+            return None
+        return [Terminal(value, False, node.ret)]
+
+
+# ====================================================================================== #
+def rule_identity(value: Any, positions: Optional[tuple] = None) -> Callable:
+    """
+    Returns a rule, which replaces the primitive with its other argument
+    when one of its arguments is the identity element **value**, for
+    example *'add(x, 0)'* or *'mul(1, x)'*. The rule applies to binary
+    primitives only.
+
+    :param value: The identity element of the primitive.
+    :param positions: The argument positions, in which the **value** is
+        neutral, optional. For example, *'(1,)'* for the subtraction.
+        The default is both positions.
+    :return: The rule.
+    """
+    return partial(_identity, value=value, positions=positions or (0, 1))
+
+
+# -------------------------------------------------------------------------------------- #
+def rule_absorbing(value: Any) -> Callable:
+    """
+    Returns a rule, which replaces the primitive with the absorbing
+    element **value** when any of its arguments is equal to it,
+    for example *'mul(x, 0)'*.
+
+    :param value: The absorbing element of the primitive.
+    :return: The rule.
+    """
+    return partial(_absorbing, value=value)
+
+
+# -------------------------------------------------------------------------------------- #
+def rule_cancel(value: Any) -> Callable:
+    """
+    Returns a rule, which replaces a binary primitive with the constant
+    **value** when both of its arguments are identical subtrees,
+    for example *'sub(x, x)'* or *'div(x, x)'*.
+
+    :param value: The result of the primitive on identical arguments.
+    :return: The rule.
+    """
+    return partial(_cancel, value=value)
+
+
+# -------------------------------------------------------------------------------------- #
+def _identity(node: Primitive, args: list, value: Any, positions: tuple) -> Optional[list]:
+    if node.arity != 2:
+        return None
+    for pos in positions:
+        if _equals(args[pos], value):
+            return args[1 - pos]
+    return None
+
+
+# -------------------------------------------------------------------------------------- #
+def _absorbing(node: Primitive, args: list, value: Any) -> Optional[list]:
+    if any(_equals(arg, value) for arg in args):
+        return [Terminal(value, False, node.ret)]
+    return None
+
+
+# -------------------------------------------------------------------------------------- #
+def _cancel(node: Primitive, args: list, value: Any) -> Optional[list]:
+    if node.arity == 2 and args[0] == args[1]:
+        return [Terminal(value, False, node.ret)]
+    return None
+
+
+# -------------------------------------------------------------------------------------- #
+def _is_constant(arg: list) -> bool:
+    return len(arg) == 1 and getattr(arg[0], 'conv_fct', None) is repr
+
+
+# -------------------------------------------------------------------------------------- #
+def _equals(arg: list, value: Any) -> bool:
+    if not _is_constant(arg):
+        return False
+    other = arg[0].value
+    return isinstance(other, bool) == isinstance(value, bool) and other == value
+
+
+# -------------------------------------------------------------------------------------- #
+def _is_literal(value: Any) -> bool:
+    if isinstance(value, (float, complex)):
+        return cmath.isfinite(value)
+    return isinstance(value, (bool, int, str))
@@ -25,6 +25,7 @@
 # ====================================================================================== #
 from .dtypes import *
 from .primitives import *
+from .compact import CompactTree
 from typing import Any, Callable, Union
 from functools import wraps
 from copy import deepcopy
@@ -38,10 +39,17 @@ __all__ = [
 ]
 
 
+_CONST, _ARG, _CALL = 'const', 'arg', 'call'
+
+
 # ====================================================================================== #
 def compile_tree(expr: GPExprTypes, prim_set: PrimitiveSetTyped) -> Any:
     """
-    Evaluates the expression on the given primitive set.
+    Evaluates the expression on the given primitive set. The callables
+    are cached in the *'compile_cache'* of the primitive set by their
+    code, so recompiling an equal expression skips the *'eval'* call.
+    If the primitive set has a *'simplifier'*, the simplified expression
+    is compiled instead, while the **expr** itself is left unchanged.
 
     :param expr: The expression to compile. It can be a string,
         a PrimitiveTree or any object which produces a valid
@@ -52,10 +60,33 @@ def compile_tree(expr: GPExprTypes, prim_set: PrimitiveSetTyped) -> Any:
 
     :type expr: :ref:`Expression <datatypes>`
     """
+    return _compile_branch(expr, prim_set, dict())
+
+
+# -------------------------------------------------------------------------------------- #
+def _compile_branch(expr: GPExprTypes, prim_set: PrimitiveSetTyped, adfs: dict) -> Any:
+    if prim_set.simplifier is not None:
+        expr = prim_set.simplifier(expr)
+    if prim_set.engine == "stack":
+        return _compile_stack(expr, prim_set, adfs)
     code = str(expr)
-    if len(prim_set.arguments) > 0:
+    if len(prim_set.arguments) != 0:
         args = ",".join(arg for arg in prim_set.arguments)
         code = "lambda {args}: {code}".format(args=args, code=code)
+    if len(adfs) != 0:
+        names = ",".join(adfs)
+        code = "lambda {names}: {code}".format(names=names, code=code)
+    elif len(prim_set.arguments) == 0:
+        return _eval_code(code, prim_set)
+    func = prim_set.compile_cache.get(code)
+    if func is None:
+        func = _eval_code(code, prim_set)
+        prim_set.compile_cache.put(code, func)
+    return func(*adfs.values()) if adfs else func
+
+
+# -------------------------------------------------------------------------------------- #
+def _eval_code(code: str, prim_set: PrimitiveSetTyped) -> Any:
     try:
         return eval(code, prim_set.context, {})
     except MemoryError:
@@ -66,13 +97,59 @@ def compile_tree(expr: GPExprTypes, prim_set: PrimitiveSetTyped) -> Any:
         ).with_traceback(traceback)
 
 
+# -------------------------------------------------------------------------------------- #
+def _compile_stack(expr: GPExprTypes, prim_set: PrimitiveSetTyped, adfs: dict) -> Any:
+    if isinstance(expr, str):
+        expr = PrimitiveTree.from_string(expr, prim_set)
+    context = {**prim_set.context, **adfs} if adfs else prim_set.context
+    arguments = {name: i for i, name in enumerate(prim_set.arguments)}
+    program = list()
+    for node in reversed(expr):
+        if isinstance(node, Primitive):
+            program.append((_CALL, context[node.name], node.arity))
+        elif node.conv_fct is str and node.value in arguments:
+            program.append((_ARG, arguments[node.value], 0))
+        elif node.conv_fct is str:
+            program.append((_CONST, context[node.value], 0))
+        else:
+            program.append((_CONST, node.value, 0))
+
+    def execute(*args):
+        stack = list()
+        for kind, item, arity in program:
+            if kind is _CONST:
+                stack.append(item)
+            elif kind is _ARG:
+                stack.append(args[item])
+            elif arity == 1:
+                stack[-1] = item(stack[-1])
+            elif arity == 2:
+                first = stack.pop()
+                stack[-1] = item(first, stack[-1])
+            elif arity == 0:
+                stack.append(item())
+            else:
+                values = stack[:-arity - 1:-1]
+                del stack[-arity:]
+                stack.append(item(*values))
+        return stack[0]
+
+    if len(prim_set.arguments) == 0:
+        return execute()
+    return execute
+
+
 # -------------------------------------------------------------------------------------- #
 def compile_adf_tree(expr: GPExprTypes, prim_sets: GPTypedSets) -> Any:
     """
     Compiles the expression represented by a list of trees.
     The first element of the list is the main tree, and the
     following elements are automatically defined functions
-    that can be called by the first tree.
+    that can be called by the first tree. The ADFs are passed
+    to the compiled branches as arguments, so the contexts of the
+    primitive sets are not modified and the function is safe to
+    call from multiple threads. The compiled branches are cached
+    by their code, so identical branches are compiled only once.
 
     :param expr: The expression to compile. It can be a string,
         a PrimitiveTree or any object which produces a valid
@@ -91,9 +168,8 @@ def compile_adf_tree(expr: GPExprTypes, prim_sets: GPTypedSets) -> Any:
     adf_dict = dict()
     func = None
     for prim_set, sub_expr in reversed(list(zip(prim_sets, expr))):
-        prim_set.context.update(adf_dict)
-        func = compile_tree(sub_expr, prim_set)
-        adf_dict.update({prim_set.name: func})
+        func = _compile_branch(sub_expr, prim_set, adf_dict)
+        adf_dict[prim_set.name] = func
     return func
 
 
@@ -138,7 +214,9 @@ def static_limit(limiter: Callable, max_value: Union[int, float]) -> Callable:
     Provides a decorator to limit the production of offspring.
     It may be used to decorate both crossover and mutation operators.
     When an invalid child is generated, it is replaced by one of its
-    parents, which is randomly selected.
+    parents, which is randomly selected. Only the node sequences of
+    the parents are saved before the variation and a parent is copied
+    only when it is needed as a replacement.
 
     :param limiter: The function which obtains the measurement from an individual.
     :param max_value: The maximum value allowed for the given measurement.
@@ -147,11 +225,30 @@ def static_limit(limiter: Callable, max_value: Union[int, float]) -> Callable:
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            keep_inds = [deepcopy(ind) for ind in args]
+            keep_inds = [(ind, _snapshot(ind)) for ind in args if _is_tree(ind)]
             new_inds = list(func(*args, **kwargs))
             for i, ind in enumerate(new_inds):
                 if keep_inds and limiter(ind) > max_value:
-                    new_inds[i] = random.choice(keep_inds)
+                    new_inds[i] = _restore(*random.choice(keep_inds))
             return new_inds
         return wrapper
     return decorator
+
+
+# -------------------------------------------------------------------------------------- #
+def _is_tree(ind: Any) -> bool:
+    return isinstance(ind, (list, CompactTree))
+
+
+# -------------------------------------------------------------------------------------- #
+def _snapshot(ind: GPIndividual) -> GPIndividual:
+    if isinstance(ind, CompactTree):
+        return CompactTree(ind)
+    return list.copy(ind)
+
+
+# -------------------------------------------------------------------------------------- #
+def _restore(ind: GPIndividual, nodes: GPIndividual) -> GPIndividual:
+    parent = deepcopy(ind)
+    parent[0:len(parent)] = nodes
+    return parent
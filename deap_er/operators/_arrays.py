@@ -0,0 +1,54 @@
+# ====================================================================================== #
+#                                                                                        #
+#   MIT License                                                                          #
+#                                                                                        #
+#   Copyright (c) 2022 - Mattias Aabmets, The DEAP Team and Other Contributors           #
+#                                                                                        #
+#   Permission is hereby granted, free of charge, to any person obtaining a copy         #
+#   of this software and associated documentation files (the "Software"), to deal        #
+#   in the Software without restriction, including without limitation the rights         #
+#   to use, copy, modify, merge, publish, distribute, sublicense, and/or sell            #
+#   copies of the Software, and to permit persons to whom the Software is                #
+#   furnished to do so, subject to the following conditions:                             #
+#                                                                                        #
+#   The above copyright notice and this permission notice shall be included in all       #
+#   copies or substantial portions of the Software.                                      #
+#                                                                                        #
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR           #
+#   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,             #
+#   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE          #
+#   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER               #
+#   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,        #
+#   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE        #
+#   SOFTWARE.                                                                            #
+#                                                                                        #
+# ====================================================================================== #
+from deap_er.base.dtypes import *
+import numpy
+
+
+__all__ = []
+
+
+# ====================================================================================== #
+def _pre_process_array(name: str, var: NumOrSeq, size: int) -> numpy.ndarray:
+    if numpy.ndim(var) == 0:
+        return numpy.asarray(var)
+    var = numpy.asarray(var)
+    if len(var) < size:
+        raise ValueError(
+            f'Argument \'{name}\' must be at least the '
+            f'size of the individual: {len(var)} < {size}'
+        )
+    return var[:size]
+
+
+# -------------------------------------------------------------------------------------- #
+def _masked(var: numpy.ndarray, mask: numpy.ndarray) -> numpy.ndarray:
+    return numpy.broadcast_to(var, mask.shape)[mask]
+
+
+# -------------------------------------------------------------------------------------- #
+def _array_views(ind1: numpy.ndarray, ind2: numpy.ndarray) -> tuple:
+    size = min(ind1.shape[-1], ind2.shape[-1])
+    return ind1[..., :size], ind2[..., :size]
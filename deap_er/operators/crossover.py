@@ -27,7 +27,9 @@ from __future__ import annotations
 from deap_er.base.dtypes import *
 from collections.abc import Sequence
 from itertools import repeat
+from ._arrays import _pre_process_array, _masked, _array_views
 import random
+import numpy
 
 
 __all__ = [
@@ -277,6 +279,8 @@ def cx_blend(ind1: Individual, ind2: Individual, alpha: float) -> Mates:
     """
     Executes a blend crossover on the two
     individuals, who are modified in-place.
+    NumPy arrays, including matrices of pairs
+    of individuals, are crossed at once.
 
     :param ind1: The first individual.
     :param ind2: The second individual.
@@ -289,6 +293,15 @@ def cx_blend(ind1: Individual, ind2: Individual, alpha: float) -> Mates:
     :type ind2: :ref:`Individual <datatypes>`
     :rtype: :ref:`Mates <datatypes>`
     """
+    if isinstance(ind1, numpy.ndarray) and isinstance(ind2, numpy.ndarray):
+        x1, x2 = _array_views(ind1, ind2)
+        gamma = (1. + 2. * alpha) * numpy.random.random_sample(x1.shape) - alpha
+        x1[...], x2[...] = (
+            (1. - gamma) * x1 + gamma * x2,
+            gamma * x1 + (1. - gamma) * x2
+        )
+        return ind1, ind2
+
     for i, (x1, x2) in enumerate(zip(ind1, ind2)):
         gamma = (1. + 2. * alpha) * random.random() - alpha
         ind1[i] = (1. - gamma) * x1 + gamma * x2
@@ -334,6 +347,8 @@ def cx_simulated_binary(ind1: Individual, ind2: Individual, eta: float) -> Mates
     """
     Executes a simulated binary crossover on the
     two individuals, who are modified in-place.
+    Like :func:`cx_blend`, it is vectorized for
+    NumPy arrays and matrices of individuals.
 
     :param ind1: The first individual.
     :param ind2: The second individual.
@@ -347,6 +362,17 @@ def cx_simulated_binary(ind1: Individual, ind2: Individual, eta: float) -> Mates
     :type ind2: :ref:`Individual <datatypes>`
     :rtype: :ref:`Mates <datatypes>`
     """
+    if isinstance(ind1, numpy.ndarray) and isinstance(ind2, numpy.ndarray):
+        x1, x2 = _array_views(ind1, ind2)
+        rand = numpy.random.random_sample(x1.shape)
+        beta = numpy.where(rand <= 0.5, 2. * rand, 1. / (2. * (1. - rand)))
+        beta **= 1. / (eta + 1.)
+        x1[...], x2[...] = (
+            0.5 * (((1 + beta) * x1) + ((1 - beta) * x2)),
+            0.5 * (((1 - beta) * x1) + ((1 + beta) * x2))
+        )
+        return ind1, ind2
+
     for i, (x1, x2) in enumerate(zip(ind1, ind2)):
         rand = random.random()
 
@@ -367,7 +393,11 @@ def cx_simulated_binary_bounded(ind1: Individual, ind2: Individual, eta: float,
                                 low: NumOrSeq, up: NumOrSeq) -> Mates:
     """
     Executes a simulated binary bounded crossover on
-    the two individuals, who are modified in-place.
+    the two individuals, who are modified in-place,
+    following the reference NSGA-II implementation.
+    NumPy arrays, or matrices of pairs of individuals,
+    are crossed at once. For these, the bounds can be
+    given as precomputed arrays, which are not copied.
 
     :param ind1: The first individual.
     :param ind2: The second individual.
@@ -385,41 +415,27 @@ def cx_simulated_binary_bounded(ind1: Individual, ind2: Individual, eta: float,
     :type up: :ref:`NumOrSeq <datatypes>`
     :rtype: :ref:`Mates <datatypes>`
     """
-    def check_bounds(name: str, var: NumOrSeq) -> Sequence:
-        if not isinstance(var, Sequence):
-            var = repeat(var, size)
-        elif isinstance(var, Sequence) and len(var) < size:
-            raise ValueError(
-                f'{name} must be at least the size of the '
-                f'shorter individual: {len(var)} < {size}'
-            )
-        return var
-
-    def calc_c(diff: float) -> float:
-        beta = 1.0 + (2.0 * diff / (x2 - x1))
-        alpha = 2.0 - beta ** -(eta + 1)
-        if rand <= 1.0 / alpha:
-            beta_q = (rand * alpha) ** (1.0 / (eta + 1))
-        else:
-            beta_q = (1.0 / (2.0 - rand * alpha)) ** (1.0 / (eta + 1))
-        c = 0.5 * (x1 + x2 - beta_q * (x2 - x1))
-        return c
+    if isinstance(ind1, numpy.ndarray) and isinstance(ind2, numpy.ndarray):
+        return _sbx_bounded_array(ind1, ind2, eta, low, up)
 
     size = min(len(ind1), len(ind2))
-    low = check_bounds('low', low)
-    up = check_bounds('up', up)
+    low = _check_bounds('low', low, size)
+    up = _check_bounds('up', up, size)
 
     for i, xl, xu in zip(list(range(size)), low, up):
         if random.random() <= 0.5:
             if abs(ind1[i] - ind2[i]) > 1e-14:
                 x1 = min(ind1[i], ind2[i])
                 x2 = max(ind1[i], ind2[i])
+                diff = x2 - x1
                 rand = random.random()
 
-                c1 = calc_c(x1 - xl)
+                beta_q = _sbx_beta_q(1.0 + 2.0 * (x1 - xl) / diff, rand, eta)
+                c1 = 0.5 * (x1 + x2 - beta_q * diff)
                 c1 = min(max(c1, xl), xu)
 
-                c2 = calc_c(xu - x2)
+                beta_q = _sbx_beta_q(1.0 + 2.0 * (xu - x2) / diff, rand, eta)
+                c2 = 0.5 * (x1 + x2 + beta_q * diff)
                 c2 = min(max(c2, xl), xu)
 
                 if random.random() <= 0.5:
@@ -432,11 +448,69 @@ def cx_simulated_binary_bounded(ind1: Individual, ind2: Individual, eta: float,
     return ind1, ind2
 
 
+# -------------------------------------------------------------------------------------- #
+def _check_bounds(name: str, var: NumOrSeq, size: int) -> Sequence:
+    if not isinstance(var, Sequence):
+        var = repeat(var, size)
+    elif isinstance(var, Sequence) and len(var) < size:
+        raise ValueError(
+            f'{name} must be at least the size of the '
+            f'shorter individual: {len(var)} < {size}'
+        )
+    return var
+
+
+# -------------------------------------------------------------------------------------- #
+def _sbx_beta_q(beta: float, rand: float, eta: float) -> float:
+    alpha = 2.0 - beta ** -(eta + 1)
+    if rand <= 1.0 / alpha:
+        return (rand * alpha) ** (1.0 / (eta + 1))
+    return (1.0 / (2.0 - rand * alpha)) ** (1.0 / (eta + 1))
+
+
+# -------------------------------------------------------------------------------------- #
+def _sbx_bounded_array(ind1: numpy.ndarray, ind2: numpy.ndarray, eta: float,
+                       low: NumOrSeq, up: NumOrSeq) -> Mates:
+    view1, view2 = _array_views(ind1, ind2)
+    size = view1.shape[-1]
+    low = _pre_process_array('low', low, size)
+    up = _pre_process_array('up', up, size)
+
+    mask = numpy.random.random_sample(view1.shape) <= 0.5
+    mask &= numpy.abs(view1 - view2) > 1e-14
+    x1 = numpy.minimum(view1[mask], view2[mask])
+    x2 = numpy.maximum(view1[mask], view2[mask])
+    xl, xu = _masked(low, mask), _masked(up, mask)
+    diff = x2 - x1
+    rand = numpy.random.random_sample(x1.shape)
+
+    def beta_q(beta: numpy.ndarray) -> numpy.ndarray:
+        alpha = 2.0 - beta ** -(eta + 1)
+        return numpy.where(
+            rand <= 1.0 / alpha,
+            rand * alpha,
+            1.0 / (2.0 - rand * alpha)
+        ) ** (1.0 / (eta + 1))
+
+    c1 = 0.5 * (x1 + x2 - beta_q(1.0 + 2.0 * (x1 - xl) / diff) * diff)
+    c2 = 0.5 * (x1 + x2 + beta_q(1.0 + 2.0 * (xu - x2) / diff) * diff)
+    c1 = numpy.minimum(numpy.maximum(c1, xl), xu)
+    c2 = numpy.minimum(numpy.maximum(c2, xl), xu)
+
+    swap = numpy.random.random_sample(x1.shape) <= 0.5
+    view1[mask] = numpy.where(swap, c2, c1)
+    view2[mask] = numpy.where(swap, c1, c2)
+    return ind1, ind2
+
+
 # -------------------------------------------------------------------------------------- #
 def cx_uniform(ind1: Individual, ind2: Individual, cx_prob: float) -> Mates:
     """
     Executes a uniform crossover on the two
-    individuals, who are modified in-place.
+    individuals, who are modified in-place. When both
+    individuals are NumPy arrays, the traits are swapped
+    at once with a mask drawn from :mod:`numpy.random`,
+    which also crosses two matrices of individuals row-wise.
 
     :param ind1: The first individual.
     :param ind2: The second individual.
@@ -447,6 +521,14 @@ def cx_uniform(ind1: Individual, ind2: Individual, cx_prob: float) -> Mates:
     :type ind2: :ref:`Individual <datatypes>`
     :rtype: :ref:`Mates <datatypes>`
     """
+    if isinstance(ind1, numpy.ndarray) and isinstance(ind2, numpy.ndarray):
+        view1, view2 = _array_views(ind1, ind2)
+        mask = numpy.random.random_sample(view1.shape) < cx_prob
+        temp = view1[mask]
+        view1[mask] = view2[mask]
+        view2[mask] = temp
+        return ind1, ind2
+
     size = min(len(ind1), len(ind2))
     for i in range(size):
         if random.random() < cx_prob:
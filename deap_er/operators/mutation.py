@@ -26,7 +26,9 @@
 from deap_er.base.dtypes import *
 from collections.abc import Sequence
 from itertools import repeat
+from ._arrays import _pre_process_array, _masked
 import random
+import numpy
 import math
 
 
@@ -53,7 +55,10 @@ def mut_gaussian(individual: Individual, mu: NumOrSeq,
                  sigma: NumOrSeq, mut_prob: float) -> Mutant:
     """
     Applies a gaussian mutation of mean **mu** and standard
-    deviation **sigma** on the input individual.
+    deviation **sigma** on the input individual. NumPy array
+    individuals are mutated at once with a vectorized mask drawn
+    from :mod:`numpy.random`, and a 2-D array is mutated as a
+    matrix of individuals, one per row.
 
     :param individual: The individual to be mutated.
     :param mu: The mean value of the gaussian mutation.
@@ -66,6 +71,15 @@ def mut_gaussian(individual: Individual, mu: NumOrSeq,
     :type sigma: :ref:`NumOrSeq <datatypes>`
     :rtype: :ref:`Mutant <datatypes>`
     """
+    if isinstance(individual, numpy.ndarray):
+        size = individual.shape[-1]
+        mu = _pre_process_array('mu', mu, size)
+        sigma = _pre_process_array('sigma', sigma, size)
+        mask = numpy.random.random_sample(individual.shape) < mut_prob
+        noise = numpy.random.normal(_masked(mu, mask), _masked(sigma, mask))
+        individual[mask] = individual[mask] + noise
+        return individual,
+
     size = len(individual)
     mu = _pre_process('mu', mu, size)
     sigma = _pre_process('sigma', sigma, size)
@@ -84,7 +98,8 @@ def mut_polynomial_bounded(individual: Individual,
                            up: NumOrSeq, mut_prob: float) -> Mutant:
     """
     Applies a polynomial mutation with a crowding
-    degree of **eta** on the input individual.
+    degree of **eta** on the input individual. Like
+    :func:`mut_gaussian`, it is vectorized for NumPy arrays.
 
     :param individual: The individual to be mutated.
     :param eta: The crowding degree of the crossover.
@@ -101,6 +116,9 @@ def mut_polynomial_bounded(individual: Individual,
     :type up: :ref:`NumOrSeq <datatypes>`
     :rtype: :ref:`Mutant <datatypes>`
     """
+    if isinstance(individual, numpy.ndarray):
+        return _polynomial_bounded_array(individual, eta, low, up, mut_prob),
+
     size = len(individual)
     low = _pre_process('low', low, size)
     up = _pre_process('up', up, size)
@@ -130,6 +148,33 @@ def mut_polynomial_bounded(individual: Individual,
     return individual,
 
 
+# -------------------------------------------------------------------------------------- #
+def _polynomial_bounded_array(individual: numpy.ndarray, eta: float,
+                              low: NumOrSeq, up: NumOrSeq,
+                              mut_prob: float) -> numpy.ndarray:
+    size = individual.shape[-1]
+    mask = numpy.random.random_sample(individual.shape) <= mut_prob
+    xl = _masked(_pre_process_array('low', low, size), mask)
+    xu = _masked(_pre_process_array('up', up, size), mask)
+    x = individual[mask]
+    rand = numpy.random.random_sample(x.shape)
+    mut_pow = 1.0 / (eta + 1.)
+
+    lower = rand < 0.5
+    delta = numpy.where(lower, x - xl, xu - x) / (xu - xl)
+    xy = (1.0 - delta) ** (eta + 1)
+    val = numpy.where(
+        lower,
+        2.0 * rand + (1.0 - 2.0 * rand) * xy,
+        2.0 * (1.0 - rand) + 2.0 * (rand - 0.5) * xy
+    ) ** mut_pow
+    delta_q = numpy.where(lower, val - 1.0, 1.0 - val)
+
+    x = x + delta_q * (xu - xl)
+    individual[mask] = numpy.minimum(numpy.maximum(x, xl), xu)
+    return individual
+
+
 # -------------------------------------------------------------------------------------- #
 def mut_shuffle_indexes(individual: Individual, mut_prob: float) -> Mutant:
     """
@@ -158,6 +203,8 @@ def mut_shuffle_indexes(individual: Individual, mut_prob: float) -> Mutant:
 def mut_flip_bit(individual: Individual, mut_prob: float) -> Mutant:
     """
     Flips the values of random attributes of the input individual.
+    The attributes of NumPy arrays, or rows of a 2-D array, are
+    flipped at once with a mask drawn from :mod:`numpy.random`.
 
     :param individual: The individual to be mutated.
     :param mut_prob: The probability of mutating each attribute.
@@ -166,6 +213,11 @@ def mut_flip_bit(individual: Individual, mut_prob: float) -> Mutant:
     :type individual: :ref:`Individual <datatypes>`
     :rtype: :ref:`Mutant <datatypes>`
     """
+    if isinstance(individual, numpy.ndarray):
+        mask = numpy.random.random_sample(individual.shape) < mut_prob
+        individual[mask] = numpy.logical_not(individual[mask])
+        return individual,
+
     for i in range(len(individual)):
         if random.random() < mut_prob:
             individual[i] = type(individual[i])(not individual[i])
@@ -180,6 +232,7 @@ def mut_uniform_int(individual: Individual,
     """
     | Mutates an individual by replacing attribute values with integers
     | chosen uniformly between the **low** and **up**, inclusively.
+    | NumPy arrays are mutated at once, as in :func:`mut_gaussian`.
 
     :param individual: The individual to be mutated.
     :param low: The lower bound of the search space.
@@ -190,6 +243,14 @@ def mut_uniform_int(individual: Individual,
     :type individual: :ref:`Individual <datatypes>`
     :rtype: :ref:`Mutant <datatypes>`
     """
+    if isinstance(individual, numpy.ndarray):
+        size = individual.shape[-1]
+        low = _pre_process_array('low', low, size)
+        up = _pre_process_array('up', up, size)
+        mask = numpy.random.random_sample(individual.shape) < mut_prob
+        individual[mask] = numpy.random.randint(_masked(low, mask), _masked(up, mask) + 1)
+        return individual,
+
     size = len(individual)
     low = _pre_process('low', low, size)
     up = _pre_process('up', up, size)
@@ -24,6 +24,7 @@
 #                                                                                        #
 # ====================================================================================== #
 from .hall_of_fame import *
+from .pareto_archive import *
 from .history import *
 from .logbook import *
 from .statistics import *
@@ -24,6 +24,7 @@
 #                                                                                        #
 # ====================================================================================== #
 from .hall_of_fame import *
+from .pareto_archive import *
 from .statistics import *
 from .logbook import *
 from typing import Union, Tuple
@@ -32,7 +33,7 @@ from typing import Union, Tuple
 __all__ = ['Hof', 'Stats', 'AlgoResult']
 
 
-Hof = Union[HallOfFame, ParetoFront]
+Hof = Union[HallOfFame, HashedHallOfFame, ParetoFront, ParetoArchive]
 """:meta private:"""
 
 Stats = Union[Statistics, MultiStatistics]
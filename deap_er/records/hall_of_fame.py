@@ -24,13 +24,17 @@
 #                                                                                        #
 # ====================================================================================== #
 from deap_er.base.dtypes import *
-from typing import Callable, Optional
+from typing import Callable, Hashable, Optional
+from collections import defaultdict
 from bisect import bisect_right
+from itertools import count
 from copy import deepcopy
 from operator import eq
+import heapq
+import numpy
 
 
-__all__ = ['HallOfFame', 'ParetoFront']
+__all__ = ['HallOfFame', 'HashedHallOfFame', 'ParetoFront']
 
 
 # ====================================================================================== #
@@ -142,6 +146,162 @@ class HallOfFame(_BaseClass):
                     self.insert(ind)
 
 
+# ====================================================================================== #
+def _genome_digest(individual: Individual) -> Hashable:
+    if isinstance(individual, numpy.ndarray):
+        return individual.tobytes()
+    try:
+        digest = tuple(individual)
+        hash(digest)
+        return digest
+    except TypeError:
+        return str(individual)
+
+
+# -------------------------------------------------------------------------------------- #
+def _lex_greater(values: numpy.ndarray, threshold: tuple) -> numpy.ndarray:
+    greater = numpy.zeros(len(values), dtype=bool)
+    equal = numpy.ones(len(values), dtype=bool)
+    for column, bound in zip(values.T, threshold):
+        greater |= equal & (column > bound)
+        equal &= column == bound
+    return greater
+
+
+# ====================================================================================== #
+class HashedHallOfFame:
+    """
+    A hall of fame that keeps the same individuals as the HallOfFame, but is
+    built for large populations and large hall of fame sizes. The members are
+    bucketed by a digest of their genome, so that the **similar** function is
+    only called on members with an equal digest, and the worst member is found
+    from a heap keyed on the fitness. When the hall of fame is full, the whole
+    population is first filtered with a vectorized comparison against the
+    fitness of the current worst member. The accepted individuals are deep
+    copied once at the end of the update, if they have not been evicted
+    by later individuals of the same population.
+
+    :param maxsize: The maximum number of individuals to store in the hall of fame.
+    :param similar: A function to compare two individuals, optional.
+    :param digest: A function that returns a hashable digest of the genome of an
+        individual, optional. Individuals that are similar must have equal digests.
+        The default digest is the raw bytes of numpy arrays and the tuple of genes
+        or the string representation of other individuals.
+    """
+    # -------------------------------------------------------- #
+    def __init__(self, maxsize: int, similar: Optional[Callable] = eq,
+                 digest: Optional[Callable] = None):
+        self.maxsize = maxsize
+        self.similar = similar
+        self.digest = digest if digest else _genome_digest
+        self._heap = list()
+        self._buckets = defaultdict(list)
+        self._counter = count()
+        self._items = None
+
+    # -------------------------------------------------------- #
+    def update(self, population: list) -> None:
+        """
+        Updates the hall of fame with the **population** by replacing the
+        worst individuals with the best individuals from the **population**.
+        The size of the hall of fame is kept constant.
+
+        :param population: A list of individual with a fitness
+            attribute to update the hall of fame with.
+        :return: Nothing.
+        """
+        if self.maxsize <= 0 or len(population) == 0:
+            return
+        if len(self._heap) >= self.maxsize:
+            wvalues = numpy.array([ind.fitness.wvalues for ind in population])
+            mask = _lex_greater(wvalues, self._heap[0][0])
+            population = [population[i] for i in numpy.flatnonzero(mask)]
+
+        added = dict()
+        for ind in population:
+            wvalues = ind.fitness.wvalues
+            is_full = len(self._heap) >= self.maxsize
+            if is_full and not wvalues > self._heap[0][0]:
+                continue
+            digest = self.digest(ind)
+            bucket = self._buckets[digest]
+            if any(self.similar(ind, entry[2]) for entry in bucket):
+                continue
+
+            entry = [wvalues, next(self._counter), ind, digest]
+            bucket.append(entry)
+            added[id(entry)] = entry
+            if is_full:
+                evicted = heapq.heapreplace(self._heap, entry)
+                self._discard(evicted)
+                added.pop(id(evicted), None)
+            else:
+                heapq.heappush(self._heap, entry)
+
+        for entry in added.values():
+            entry[2] = deepcopy(entry[2])
+        if added:
+            self._items = None
+
+    # -------------------------------------------------------- #
+    def _discard(self, entry: list) -> None:
+        bucket = self._buckets[entry[3]]
+        for i, member in enumerate(bucket):
+            if member is entry:
+                del bucket[i]
+                break
+        if not bucket:
+            del self._buckets[entry[3]]
+
+    # -------------------------------------------------------- #
+    def clear(self) -> None:
+        """
+        Clears the hall of fame.
+
+        :return: Nothing.
+        """
+        self._heap.clear()
+        self._buckets.clear()
+        self._items = None
+
+    # -------------------------------------------------------- #
+    @property
+    def items(self) -> list:
+        """
+        The members of the hall of fame, sorted from
+        the best to the worst as in the HallOfFame.
+        """
+        if self._items is None:
+            entries = sorted(self._heap, key=lambda e: (e[0], e[1]), reverse=True)
+            self._items = [entry[2] for entry in entries]
+        return self._items
+
+    # -------------------------------------------------------- #
+    @property
+    def keys(self) -> list:
+        """
+        The fitnesses of the members of the hall of
+        fame, sorted from the worst to the best.
+        """
+        return [ind.fitness for ind in reversed(self.items)]
+
+    # -------------------------------------------------------- #
+    def __len__(self):
+        return len(self._heap)
+
+    def __getitem__(self, i):
+        return self.items[i]
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __reversed__(self):
+        return reversed(self.items)
+
+    def __str__(self):
+        return str(self.items)
+
+
 # ====================================================================================== #
 class ParetoFront(_BaseClass):
     """
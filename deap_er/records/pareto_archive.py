@@ -0,0 +1,370 @@
+# ====================================================================================== #
+#                                                                                        #
+#   MIT License                                                                          #
+#                                                                                        #
+#   Copyright (c) 2022 - Mattias Aabmets, The DEAP Team and Other Contributors           #
+#                                                                                        #
+#   Permission is hereby granted, free of charge, to any person obtaining a copy         #
+#   of this software and associated documentation files (the "Software"), to deal        #
+#   in the Software without restriction, including without limitation the rights         #
+#   to use, copy, modify, merge, publish, distribute, sublicense, and/or sell            #
+#   copies of the Software, and to permit persons to whom the Software is                #
+#   furnished to do so, subject to the following conditions:                             #
+#                                                                                        #
+#   The above copyright notice and this permission notice shall be included in all       #
+#   copies or substantial portions of the Software.                                      #
+#                                                                                        #
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR           #
+#   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,             #
+#   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE          #
+#   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER               #
+#   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,        #
+#   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE        #
+#   SOFTWARE.                                                                            #
+#                                                                                        #
+# ====================================================================================== #
+from deap_er.base.dtypes import *
+from typing import Callable, Iterator, Optional
+from bisect import bisect_left, bisect_right
+from copy import deepcopy
+from operator import eq
+
+
+__all__ = ['ParetoArchive']
+
+
+# ====================================================================================== #
+def _dominates(wvalues1: tuple, wvalues2: tuple) -> bool:
+    not_equal = False
+    for self_wvalue, other_wvalue in zip(wvalues1, wvalues2):
+        if self_wvalue < other_wvalue:
+            return False
+        elif self_wvalue > other_wvalue:
+            not_equal = True
+    return not_equal
+
+
+def _covers(wvalues1: tuple, wvalues2: tuple) -> bool:
+    for self_wvalue, other_wvalue in zip(wvalues1, wvalues2):
+        if self_wvalue < other_wvalue:
+            return False
+    return True
+
+
+def _distance(wvalues1: tuple, wvalues2: tuple) -> float:
+    return sum((a - b) ** 2 for a, b in zip(wvalues1, wvalues2))
+
+
+# ====================================================================================== #
+class _SortedFront:
+    """
+    Private index of a bi-objective Pareto front. The members are kept
+    in a list that is sorted by the first objective in descending order,
+    which makes the second objective ascending, so that both the dominance
+    test and the removal of dominated members are binary searches.
+    """
+    # -------------------------------------------------------- #
+    def __init__(self):
+        self.keys = list()
+        self.values = list()
+        self.entries = list()
+
+    # -------------------------------------------------------- #
+    def update(self, wvalues: tuple, individual: Individual, similar: Callable,
+               copier: Callable) -> bool:
+        first, second = wvalues
+        i = bisect_right(self.keys, -first)
+        if i > 0:
+            last_wvalues = self.entries[i - 1][0]
+            if last_wvalues == wvalues:
+                j = i - 1
+                while j >= 0 and self.entries[j][0] == wvalues:
+                    if similar(individual, self.entries[j][1]):
+                        return False
+                    j -= 1
+                self._insert(i, wvalues, copier(individual))
+                return True
+            if last_wvalues[1] >= second:
+                return False
+
+        j = bisect_left(self.keys, -first)
+        k = bisect_right(self.values, second, lo=j)
+        del self.keys[j:k]
+        del self.values[j:k]
+        del self.entries[j:k]
+        self._insert(j, wvalues, copier(individual))
+        return True
+
+    # -------------------------------------------------------- #
+    def _insert(self, index: int, wvalues: tuple, individual: Individual) -> None:
+        self.keys.insert(index, -wvalues[0])
+        self.values.insert(index, wvalues[1])
+        self.entries.insert(index, (wvalues, individual))
+
+    # -------------------------------------------------------- #
+    def __len__(self):
+        return len(self.entries)
+
+    def __iter__(self):
+        return (ind for _, ind in self.entries)
+
+
+# ====================================================================================== #
+class _TreeNode:
+    """
+    Private node of the ND-Tree. Leaf nodes hold the archive entries,
+    internal nodes hold the child nodes. Both store the ideal and the
+    nadir points that bound the entries in their subtree.
+    """
+    __slots__ = ('ideal', 'nadir', 'entries', 'children')
+
+    # -------------------------------------------------------- #
+    def __init__(self, entries: list):
+        points = [wvalues for wvalues, _ in entries]
+        self.ideal = tuple(map(max, *points)) if len(points) > 1 else points[0]
+        self.nadir = tuple(map(min, *points)) if len(points) > 1 else points[0]
+        self.entries = entries
+        self.children = None
+
+    # -------------------------------------------------------- #
+    def center(self) -> tuple:
+        return tuple((a + b) / 2 for a, b in zip(self.ideal, self.nadir))
+
+    # -------------------------------------------------------- #
+    def count(self) -> int:
+        if self.children is None:
+            return len(self.entries)
+        return sum(child.count() for child in self.children)
+
+    # -------------------------------------------------------- #
+    def expand(self, wvalues: tuple) -> None:
+        self.ideal = tuple(map(max, self.ideal, wvalues))
+        self.nadir = tuple(map(min, self.nadir, wvalues))
+
+
+# ====================================================================================== #
+class _NDTree:
+    """
+    Private index of a Pareto front with three or more objectives, based
+    on the ND-Tree of Jaszkiewicz and Lust. The ideal and nadir points of
+    the nodes allow whole subtrees to be skipped, rejected or removed without
+    comparing the candidate against every member of the archive.
+    """
+    # -------------------------------------------------------- #
+    def __init__(self, leaf_size: int, branching: int):
+        self.leaf_size = leaf_size
+        self.branching = branching
+        self.root = None
+        self.size = 0
+
+    # -------------------------------------------------------- #
+    def update(self, wvalues: tuple, individual: Individual, similar: Callable,
+               copier: Callable) -> bool:
+        if self.root is not None:
+            if self._is_rejected(wvalues, individual, similar):
+                return False
+            if self._prune(self.root, wvalues):
+                self.root = None
+        self._insert(wvalues, copier(individual))
+        return True
+
+    # -------------------------------------------------------- #
+    def _is_rejected(self, wvalues: tuple, individual: Individual,
+                     similar: Callable) -> bool:
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if _dominates(node.nadir, wvalues):
+                return True
+            if not _covers(node.ideal, wvalues):
+                continue
+            if node.children is not None:
+                stack.extend(node.children)
+                continue
+            for member_wvalues, member in node.entries:
+                if _dominates(member_wvalues, wvalues):
+                    return True
+                if member_wvalues == wvalues and similar(individual, member):
+                    return True
+        return False
+
+    # -------------------------------------------------------- #
+    def _prune(self, node: _TreeNode, wvalues: tuple) -> bool:
+        if _dominates(wvalues, node.ideal):
+            self.size -= node.count()
+            return True
+        if not _covers(wvalues, node.nadir):
+            return False
+
+        if node.children is None:
+            entries = [e for e in node.entries if not _dominates(wvalues, e[0])]
+            self.size -= len(node.entries) - len(entries)
+            node.entries = entries
+            return len(entries) == 0
+
+        children = [c for c in node.children if not self._prune(c, wvalues)]
+        if len(children) == 0:
+            return True
+        if len(children) == 1:
+            child = children[0]
+            node.ideal, node.nadir = child.ideal, child.nadir
+            node.entries, node.children = child.entries, child.children
+        else:
+            node.children = children
+        return False
+
+    # -------------------------------------------------------- #
+    def _insert(self, wvalues: tuple, individual: Individual) -> None:
+        self.size += 1
+        entry = (wvalues, individual)
+        if self.root is None:
+            self.root = _TreeNode([entry])
+            return
+
+        node = self.root
+        while node.children is not None:
+            node.expand(wvalues)
+            node = min(
+                node.children,
+                key=lambda c: _distance(c.center(), wvalues)
+            )
+        node.expand(wvalues)
+        node.entries.append(entry)
+        if len(node.entries) > self.leaf_size:
+            self._split(node)
+
+    # -------------------------------------------------------- #
+    def _split(self, node: _TreeNode) -> None:
+        entries = node.entries
+        points = [wvalues for wvalues, _ in entries]
+        distances = [[_distance(p1, p2) for p2 in points] for p1 in points]
+
+        seeds = [max(range(len(points)), key=lambda i: sum(distances[i]))]
+        while len(seeds) < min(self.branching, len(points)):
+            candidates = [i for i in range(len(points)) if i not in seeds]
+            seeds.append(max(
+                candidates,
+                key=lambda i: sum(distances[i][s] for s in seeds)
+            ))
+
+        groups = {seed: [entries[seed]] for seed in seeds}
+        for i, entry in enumerate(entries):
+            if i not in groups:
+                seed = min(seeds, key=lambda s: distances[i][s])
+                groups[seed].append(entry)
+
+        node.children = [_TreeNode(group) for group in groups.values()]
+        node.entries = None
+
+    # -------------------------------------------------------- #
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        stack = [self.root] if self.root is not None else []
+        while stack:
+            node = stack.pop()
+            if node.children is None:
+                yield from (ind for _, ind in node.entries)
+            else:
+                stack.extend(reversed(node.children))
+
+
+# ====================================================================================== #
+class ParetoArchive:
+    """
+    The Pareto archive hall of fame contains all the non-dominated individuals
+    that ever lived in the population, just like the ParetoFront hall of fame,
+    but the members are indexed for fast dominance queries. For two objectives
+    the members are kept in a sorted list and for three or more objectives they
+    are kept in an ND-Tree. Each update processes the population as a batch in
+    the order of decreasing sum of weighted fitness values, so that dominating
+    individuals are accepted before the individuals they dominate, which are
+    then rejected without ever being copied into the archive.
+
+    :param similar: A function to compare two individuals, optional.
+    :param copy: If False, the archive stores references to the accepted
+        individuals instead of deep copies, optional. The default is True.
+    :param leaf_size: The maximum number of individuals
+        in a leaf node of the ND-Tree, optional.
+    :param branching: The number of children of an internal node of the
+        ND-Tree, optional. The default is the number of objectives plus one.
+    """
+    # -------------------------------------------------------- #
+    def __init__(self, similar: Optional[Callable] = eq, copy: bool = True,
+                 leaf_size: int = 20, branching: Optional[int] = None):
+        self.similar = similar
+        self.copy = copy
+        self.leaf_size = leaf_size
+        self.branching = branching
+        self._index = None
+        self._items = None
+
+    # -------------------------------------------------------- #
+    def update(self, population: list) -> None:
+        """
+        Updates the Pareto archive with the **population** by adding
+        the individuals from the population that are not dominated by the
+        archive. If any individual in the archive is dominated, it is removed.
+
+        :param population: A list of individual with a fitness
+            attribute to update the archive with.
+        :return: Nothing.
+        """
+        candidates = [ind for ind in population if hasattr(ind, 'fitness')]
+        if not candidates:
+            return
+        candidates.sort(key=lambda ind: sum(ind.fitness.wvalues), reverse=True)
+
+        if self._index is None:
+            obj_count = len(candidates[0].fitness.wvalues)
+            if obj_count == 2:
+                self._index = _SortedFront()
+            else:
+                branching = self.branching or obj_count + 1
+                self._index = _NDTree(self.leaf_size, max(branching, 2))
+
+        copier = deepcopy if self.copy else (lambda ind: ind)
+        for ind in candidates:
+            wvalues = tuple(ind.fitness.wvalues)
+            if self._index.update(wvalues, ind, self.similar, copier):
+                self._items = None
+
+    # -------------------------------------------------------- #
+    def clear(self) -> None:
+        """
+        Clears the Pareto archive.
+
+        :return: Nothing.
+        """
+        self._index = None
+        self._items = None
+
+    # -------------------------------------------------------- #
+    @property
+    def items(self) -> list:
+        """
+        The members of the archive, sorted by their
+        fitness in the same order as in the ParetoFront.
+        """
+        if self._items is None:
+            members = list(self._index) if self._index is not None else []
+            members.sort(key=lambda ind: ind.fitness, reverse=True)
+            self._items = members
+        return self._items
+
+    # -------------------------------------------------------- #
+    def __len__(self):
+        return len(self._index) if self._index is not None else 0
+
+    def __getitem__(self, i):
+        return self.items[i]
+
+    def __iter__(self) -> Iterator:
+        return iter(self.items)
+
+    def __reversed__(self):
+        return reversed(self.items)
+
+    def __str__(self):
+        return str(self.items)
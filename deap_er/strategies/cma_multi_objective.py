@@ -71,6 +71,11 @@ class StrategyMultiObjective:
        * mp_pool - *(object)*
           * Any multiprocessing *Pool* object, which has a :code:`map` method.
           * *Default:* None
+       * hv_samples - *(int)*
+          * If set, the hypervolume contributions are estimated by Monte Carlo
+            sampling with this many samples per individual instead of being
+            computed exactly. Recommended for many objectives.
+          * *Default:* None
     """
     # -------------------------------------------------------- #
     def __init__(self, population: list, sigma: float, **kwargs: Optional):
@@ -87,6 +92,7 @@ class StrategyMultiObjective:
         self.cm_learn_rate = kwargs.get("cm_learn_rate", 2.0 / (self.dim ** 2 + 6.0))
         self.thresh_sr = kwargs.get("thresh_sr", 0.44)
         self.mp_pool = kwargs.get("mp_pool", None)
+        self.hv_samples = kwargs.get("hv_samples", None)
 
         self.sigmas = [sigma] * pop_size
         self.big_a = [numpy.identity(self.dim) for _ in range(pop_size)]
@@ -126,11 +132,12 @@ class StrategyMultiObjective:
                 if callable(self.mp_pool.map):
                     mapper = self.mp_pool.map
 
-            for _ in range(len(mid_front) - k):
-                idx = utils.least_contrib(mid_front, ref, mapper)
-                not_chosen.append(mid_front.pop(idx))
+            count = len(mid_front) - k
+            removed = utils.least_contribs(mid_front, count, ref, mapper, self.hv_samples)
+            not_chosen += [mid_front[idx] for idx in removed]
+            removed = set(removed)
 
-            chosen += mid_front
+            chosen += [ind for i, ind in enumerate(mid_front) if i not in removed]
 
         return chosen, not_chosen
 
@@ -24,4 +24,7 @@
 #                                                                                        #
 # ====================================================================================== #
 from .hypervolume import *
+from .engines import *
+from .contributions import *
+from .approximate import *
 from .least_contrib import *
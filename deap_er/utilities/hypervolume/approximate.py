@@ -0,0 +1,193 @@
+# ====================================================================================== #
+#                                                                                        #
+#   MIT License                                                                          #
+#                                                                                        #
+#   Copyright (c) 2022 - Mattias Aabmets, The DEAP Team and Other Contributors           #
+#                                                                                        #
+#   Permission is hereby granted, free of charge, to any person obtaining a copy         #
+#   of this software and associated documentation files (the "Software"), to deal        #
+#   in the Software without restriction, including without limitation the rights         #
+#   to use, copy, modify, merge, publish, distribute, sublicense, and/or sell            #
+#   copies of the Software, and to permit persons to whom the Software is                #
+#   furnished to do so, subject to the following conditions:                             #
+#                                                                                        #
+#   The above copyright notice and this permission notice shall be included in all       #
+#   copies or substantial portions of the Software.                                      #
+#                                                                                        #
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR           #
+#   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,             #
+#   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE          #
+#   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER               #
+#   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,        #
+#   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE        #
+#   SOFTWARE.                                                                            #
+#                                                                                        #
+# ====================================================================================== #
+from .engines import _relevant
+from statistics import NormalDist
+from typing import Optional
+import numpy
+
+
+__all__ = ['hv_approx', 'hv_approx_contributions']
+
+
+# ====================================================================================== #
+def hv_approx(point_set: numpy.ndarray, ref_point: numpy.ndarray,
+              samples: int = 100000, confidence: float = 0.95,
+              rel_tol: Optional[float] = None) -> tuple:
+    """
+    Estimates the hypervolume that is dominated by the **point_set** by
+    Monte Carlo sampling in the bounding box of the points. The samples are
+    tested against all the points at once in batches. The number of samples
+    does not depend on the number of objectives, which makes the estimate
+    usable for many-objective problems. Minimization is implicitly assumed.
+
+    :param point_set: The set of points that are to be evaluated.
+    :param ref_point: The reference point for the hypervolume calculation.
+    :param samples: The maximum number of samples to draw, optional.
+    :param confidence: The confidence level of the bounds, optional.
+    :param rel_tol: If set, the sampling stops early when the half-width of
+        the confidence interval is smaller than this fraction of the estimate.
+    :return: A tuple of the estimate and the lower
+        and the upper confidence bounds.
+    """
+    points, ref = _relevant(point_set, ref_point)
+    if len(points) == 0:
+        return 0.0, 0.0, 0.0
+
+    lower = points.min(axis=0)
+    volume = float(numpy.prod(ref - lower))
+    z_score = _z_score(confidence)
+    batch = _batch_size(len(ref))
+    points = _by_volume(points, lower, ref)
+
+    hits, drawn = 0, 0
+    while drawn < samples:
+        size = min(batch, samples - drawn)
+        sample = lower + numpy.random.random_sample((size, len(ref))) * (ref - lower)
+        hits += int(numpy.count_nonzero(_is_dominated(points, sample)))
+        drawn += size
+        if rel_tol is not None:
+            low, high = _wilson(hits, drawn, z_score)
+            if (high - low) / 2 <= rel_tol * hits / drawn:
+                break
+
+    low, high = _wilson(hits, drawn, z_score)
+    return volume * hits / drawn, volume * low, volume * high
+
+
+# -------------------------------------------------------------------------------------- #
+def hv_approx_contributions(point_set: numpy.ndarray, ref_point: numpy.ndarray,
+                            samples: int = 10000, confidence: float = 0.95,
+                            indices: Optional[numpy.ndarray] = None) -> tuple:
+    """
+    Estimates the exclusive hypervolume contributions of the points in
+    the **point_set** by Monte Carlo sampling. The samples of each point are
+    drawn from the smallest box that contains its exclusive hypervolume and
+    are tested only against the points that can dominate a part of that box.
+    Minimization is implicitly assumed.
+
+    :param point_set: The set of points that are to be evaluated.
+    :param ref_point: The reference point for the hypervolume calculation.
+    :param samples: The number of samples to draw for each point, optional.
+    :param confidence: The confidence level of the bounds, optional.
+    :param indices: The indices of the points to estimate, optional.
+        The estimates of the other points are set to zero.
+    :return: A tuple of arrays of the estimates and the
+        lower and the upper confidence bounds.
+    """
+    points = numpy.asarray(point_set, dtype=float)
+    ref = numpy.asarray(ref_point, dtype=float).ravel()
+    points = points.reshape(-1, len(ref))
+    values, lows, highs = (numpy.zeros(len(points)) for _ in range(3))
+    if indices is None:
+        indices = numpy.arange(len(points))
+
+    z_score = _z_score(confidence)
+    uppers = _exclusive_bounds(points, ref)
+    for i in indices:
+        lower, upper = points[i], uppers[i]
+        if not numpy.all(lower < upper):
+            continue
+        others = numpy.delete(points, i, axis=0)
+        others = others[numpy.all(others < upper, axis=1)]
+        volume = float(numpy.prod(upper - lower))
+        if len(others) == 0:
+            values[i] = lows[i] = highs[i] = volume
+            continue
+
+        batch = _batch_size(len(ref))
+        others = _by_volume(others, lower, upper)
+        hits, drawn = 0, 0
+        while drawn < samples:
+            size = min(batch, samples - drawn)
+            sample = lower + numpy.random.random_sample((size, len(ref))) * (upper - lower)
+            hits += size - int(numpy.count_nonzero(_is_dominated(others, sample)))
+            drawn += size
+
+        low, high = _wilson(hits, drawn, z_score)
+        values[i] = volume * hits / drawn
+        lows[i], highs[i] = volume * low, volume * high
+
+    return values, lows, highs
+
+
+# ====================================================================================== #
+def _exclusive_bounds(points: numpy.ndarray, ref: numpy.ndarray,
+                      chunk: int = 128) -> numpy.ndarray:
+    dims = len(ref)
+    uppers = numpy.tile(ref, (len(points), 1))
+    for start in range(0, len(points), chunk):
+        block = points[start:start + chunk]
+        not_worse = points[None, :, :] <= block[:, None, :]
+        count = not_worse.sum(axis=2)
+        for k in range(dims):
+            limits = count - not_worse[:, :, k] == dims - 1
+            limits[numpy.arange(len(block)), numpy.arange(start, start + len(block))] = False
+            candidates = numpy.where(limits, points[None, :, k], numpy.inf)
+            bound = candidates.min(axis=1)
+            uppers[start:start + chunk, k] = numpy.minimum(ref[k], bound)
+    return numpy.maximum(uppers, points)
+
+
+# -------------------------------------------------------------------------------------- #
+def _is_dominated(points: numpy.ndarray, samples: numpy.ndarray) -> numpy.ndarray:
+    alive = numpy.arange(len(samples))
+    for point in points:
+        covered = numpy.all(samples[alive] >= point, axis=1)
+        alive = alive[~covered]
+        if len(alive) == 0:
+            break
+    dominated = numpy.ones(len(samples), dtype=bool)
+    dominated[alive] = False
+    return dominated
+
+
+# -------------------------------------------------------------------------------------- #
+def _by_volume(points: numpy.ndarray, lower: numpy.ndarray,
+               upper: numpy.ndarray) -> numpy.ndarray:
+    volumes = numpy.prod(upper - numpy.maximum(points, lower), axis=1)
+    return points[numpy.argsort(-volumes, kind='stable')]
+
+
+# -------------------------------------------------------------------------------------- #
+def _batch_size(dims: int, budget: int = 1 << 20) -> int:
+    return max(1, budget // dims)
+
+
+# -------------------------------------------------------------------------------------- #
+def _z_score(confidence: float) -> float:
+    return NormalDist().inv_cdf(0.5 + confidence / 2)
+
+
+# -------------------------------------------------------------------------------------- #
+def _wilson(hits: int, drawn: int, z_score: float) -> tuple:
+    if drawn == 0:
+        return 0.0, 1.0
+    ratio = hits / drawn
+    z2 = z_score ** 2
+    center = (ratio + z2 / (2 * drawn)) / (1 + z2 / drawn)
+    spread = z_score * numpy.sqrt(ratio * (1 - ratio) / drawn + z2 / (4 * drawn ** 2))
+    spread /= 1 + z2 / drawn
+    return max(0.0, center - spread), min(1.0, center + spread)
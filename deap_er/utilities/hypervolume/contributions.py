@@ -0,0 +1,370 @@
+# ====================================================================================== #
+#                                                                                        #
+#   MIT License                                                                          #
+#                                                                                        #
+#   Copyright (c) 2022 - Mattias Aabmets, The DEAP Team and Other Contributors           #
+#                                                                                        #
+#   Permission is hereby granted, free of charge, to any person obtaining a copy         #
+#   of this software and associated documentation files (the "Software"), to deal        #
+#   in the Software without restriction, including without limitation the rights         #
+#   to use, copy, modify, merge, publish, distribute, sublicense, and/or sell            #
+#   copies of the Software, and to permit persons to whom the Software is                #
+#   furnished to do so, subject to the following conditions:                             #
+#                                                                                        #
+#   The above copyright notice and this permission notice shall be included in all       #
+#   copies or substantial portions of the Software.                                      #
+#                                                                                        #
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR           #
+#   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,             #
+#   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE          #
+#   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER               #
+#   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,        #
+#   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE        #
+#   SOFTWARE.                                                                            #
+#                                                                                        #
+# ====================================================================================== #
+from .engines import hv_exact
+from bisect import bisect_left, bisect_right
+from typing import Callable, Optional
+from multiprocessing import shared_memory
+from functools import partial
+import numpy
+import sys
+
+
+__all__ = ['hv_contributions', 'HvContributions']
+
+
+# ====================================================================================== #
+def hv_contributions(point_set: numpy.ndarray, ref_point: numpy.ndarray,
+                     map_func: Optional[Callable] = map) -> numpy.ndarray:
+    """
+    Computes the exclusive hypervolume contributions of all the points in
+    the **point_set** at once. The contribution of a point is the hypervolume
+    that is dominated only by that point. Mutually non-dominated point sets are
+    handled in O(n*log(n)) time in 2-D and 3-D, all the other point sets are
+    handled by computing the contributions one at a time from the limit sets.
+    Minimization is implicitly assumed and the **point_set** is not modified.
+
+    :param point_set: The set of points that are to be evaluated.
+    :param ref_point: The reference point for the hypervolume calculation.
+    :param map_func: Any map function which maps an iterable to a callable,
+        optional. It is used only for the one at a time computations. When it
+        is not the builtin map, the points are placed into shared memory once
+        and only the indices of the points are sent to the workers.
+    :return: An array of the exclusive contributions of the points.
+    """
+    points = numpy.asarray(point_set, dtype=float)
+    ref = numpy.asarray(ref_point, dtype=float).ravel()
+    points = points.reshape(-1, len(ref))
+    contribs = numpy.zeros(len(points))
+    relevant = numpy.flatnonzero(numpy.all(points < ref, axis=1))
+    if len(relevant) == 0:
+        return contribs
+
+    unique, inverse, counts = numpy.unique(
+        points[relevant], axis=0,
+        return_inverse=True,
+        return_counts=True
+    )
+    inverse = inverse.ravel()
+    values = None
+    if len(ref) == 2:
+        values = _contributions_2d(unique, ref)
+    elif len(ref) == 3:
+        values = _contributions_3d(unique, ref)
+
+    if values is None:
+        values = _contributions_any(points[relevant], ref, map_func)
+    else:
+        values[counts > 1] = 0.0
+        values = values[inverse]
+    contribs[relevant] = values
+    return contribs
+
+
+# ====================================================================================== #
+class HvContributions:
+    """
+    Maintains the exclusive hypervolume contributions of a **point_set**
+    while the points are removed from it one at a time. For mutually
+    non-dominated points, the contributions are updated from the neighbours
+    of the removed point in O(1) time in 2-D and recomputed with the
+    O(n*log(n)) sweep in 3-D. Otherwise, only the contributions that share
+    a part of their exclusive hypervolume with the removed point are updated.
+    Minimization is implicitly assumed.
+
+    :param point_set: The set of points that are to be evaluated.
+    :param ref_point: The reference point for the hypervolume calculation.
+    :param map_func: Any map function which maps an iterable to a callable,
+        optional. It is used only for the initial contributions.
+    """
+    # -------------------------------------------------------- #
+    def __init__(self, point_set: numpy.ndarray, ref_point: numpy.ndarray,
+                 map_func: Optional[Callable] = map):
+        self.ref_point = numpy.asarray(ref_point, dtype=float).ravel()
+        self.points = numpy.asarray(point_set, dtype=float).reshape(-1, len(self.ref_point))
+        self.values = hv_contributions(self.points, self.ref_point, map_func)
+        self.alive = numpy.ones(len(self.points), dtype=bool)
+        self._relevant = numpy.all(self.points < self.ref_point, axis=1)
+        self._chain = self._build_chain()
+        self._sweep = self._chain is None and self._is_sweepable()
+
+    # -------------------------------------------------------- #
+    def least(self) -> int:
+        """
+        Returns the index of the remaining point with the least contribution.
+        On ties, the point with the lowest index is returned.
+
+        :return: The index of the point in the original point set.
+        """
+        values = numpy.where(self.alive, self.values, numpy.inf)
+        return int(numpy.argmin(values))
+
+    # -------------------------------------------------------- #
+    def remove(self, index: int) -> None:
+        """
+        Removes the point at **index** from the point set and
+        updates the contributions of the remaining points.
+
+        :param index: The index of the point in the original point set.
+        :return: Nothing.
+        """
+        if not self.alive[index]:
+            return
+        self.alive[index] = False
+        self.values[index] = 0.0
+        if not self._relevant[index]:
+            return
+        elif self._chain is not None:
+            self._remove_from_chain(index)
+        elif self._sweep:
+            self._remove_from_sweep()
+        else:
+            self._remove_any(index)
+
+    # -------------------------------------------------------- #
+    def _build_chain(self) -> Optional[dict]:
+        if len(self.ref_point) != 2:
+            return None
+        relevant = numpy.flatnonzero(self._relevant)
+        order = relevant[numpy.lexsort(self.points[relevant].T[::-1])]
+        xs, ys = self.points[order, 0], self.points[order, 1]
+        if numpy.any(numpy.diff(xs) <= 0) or numpy.any(numpy.diff(ys) >= 0):
+            return None
+        order = order.tolist()
+        prev = dict(zip(order, [None] + order[:-1]))
+        succ = dict(zip(order, order[1:] + [None]))
+        return dict(prev=prev, next=succ)
+
+    # -------------------------------------------------------- #
+    def _is_sweepable(self) -> bool:
+        if len(self.ref_point) != 3:
+            return False
+        points = self.points[self._relevant]
+        if len(numpy.unique(points, axis=0)) != len(points):
+            return False
+        return _contributions_3d(points, self.ref_point) is not None
+
+    # -------------------------------------------------------- #
+    def _remove_from_sweep(self) -> None:
+        remaining = numpy.flatnonzero(self.alive & self._relevant)
+        if len(remaining):
+            points = self.points[remaining]
+            self.values[remaining] = _contributions_3d(points, self.ref_point)
+
+    # -------------------------------------------------------- #
+    def _remove_from_chain(self, index: int) -> None:
+        prev, succ = self._chain['prev'], self._chain['next']
+        left, right = prev.pop(index), succ.pop(index)
+        if left is not None:
+            succ[left] = right
+        if right is not None:
+            prev[right] = left
+        for i in (left, right):
+            if i is not None:
+                self.values[i] = self._chain_value(i)
+
+    # -------------------------------------------------------- #
+    def _chain_value(self, index: int) -> float:
+        left, right = self._chain['prev'][index], self._chain['next'][index]
+        x, y = self.points[index]
+        right_x = self.ref_point[0] if right is None else self.points[right, 0]
+        left_y = self.ref_point[1] if left is None else self.points[left, 1]
+        return float((right_x - x) * (left_y - y))
+
+    # -------------------------------------------------------- #
+    def _remove_any(self, index: int, chunk: int = 256) -> None:
+        others = numpy.flatnonzero(self.alive)
+        points = self.points[others]
+        meets = numpy.maximum(points, self.points[index])
+        inside = numpy.all(meets < self.ref_point, axis=1)
+        for start in range(0, len(others), chunk):
+            stop = min(start + chunk, len(others))
+            block = numpy.arange(start, stop)[inside[start:stop]]
+            if len(block) == 0:
+                continue
+            covered = numpy.all(points[None, :, :] <= meets[block, None, :], axis=2)
+            covered[numpy.arange(len(block)), block] = False
+            for i in block[~covered.any(axis=1)]:
+                rest = numpy.delete(points, i, axis=0)
+                self.values[others[i]] += _exclusive(meets[i], rest, self.ref_point)
+
+
+# ====================================================================================== #
+_SHARED = dict()
+
+
+# -------------------------------------------------------------------------------------- #
+def _exclusive(point: numpy.ndarray, others: numpy.ndarray, ref: numpy.ndarray) -> float:
+    volume = float(numpy.prod(ref - point))
+    if len(others):
+        volume -= hv_exact(numpy.maximum(others, point), ref)
+    return volume
+
+
+# -------------------------------------------------------------------------------------- #
+def _exclusive_at(index: int, points: numpy.ndarray, ref: numpy.ndarray) -> float:
+    point = points[index]
+    meets = numpy.maximum(points, point)
+    meets[index] = ref
+    return float(numpy.prod(ref - point)) - hv_exact(meets, ref)
+
+
+# -------------------------------------------------------------------------------------- #
+def _exclusive_shared(index: int, name: str, shape: tuple, ref: numpy.ndarray) -> float:
+    if name not in _SHARED:
+        _detach()
+        _SHARED[name] = _attach(name)
+    points = numpy.ndarray(shape, dtype=float, buffer=_SHARED[name].buf)
+    return _exclusive_at(index, points, ref)
+
+
+# -------------------------------------------------------------------------------------- #
+def _attach(name: str) -> shared_memory.SharedMemory:
+    # The block is owned and unlinked by the process which created it. Workers
+    # must not unregister it from the resource tracker, which is shared with
+    # the parent, otherwise the final unlink of the parent fails in the tracker.
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    return shared_memory.SharedMemory(name=name)
+
+
+# -------------------------------------------------------------------------------------- #
+def _detach() -> None:
+    while _SHARED:
+        _, block = _SHARED.popitem()
+        block.close()
+
+
+# -------------------------------------------------------------------------------------- #
+def _contributions_any(points: numpy.ndarray, ref: numpy.ndarray,
+                       map_func: Callable) -> numpy.ndarray:
+    indices = range(len(points))
+    if map_func is map:
+        values = (_exclusive_at(i, points, ref) for i in indices)
+        return numpy.fromiter(values, dtype=float, count=len(points))
+
+    block = shared_memory.SharedMemory(create=True, size=points.nbytes)
+    _SHARED[block.name] = block
+    try:
+        shared = numpy.ndarray(points.shape, dtype=float, buffer=block.buf)
+        shared[:] = points
+        del shared
+        func = partial(_exclusive_shared, name=block.name, shape=points.shape, ref=ref)
+        values = map_func(func, indices)
+        return numpy.fromiter(values, dtype=float, count=len(points))
+    finally:
+        del _SHARED[block.name]
+        block.close()
+        block.unlink()
+
+
+# -------------------------------------------------------------------------------------- #
+def _contributions_2d(points: numpy.ndarray, ref: numpy.ndarray) -> Optional[numpy.ndarray]:
+    order = numpy.lexsort((points[:, 1], points[:, 0]))
+    xs, ys = points[order, 0], points[order, 1]
+    if numpy.any(numpy.diff(ys) >= 0):
+        return None
+    right = numpy.append(xs[1:], ref[0])
+    left = numpy.insert(ys[:-1], 0, ref[1])
+    values = numpy.empty(len(points))
+    values[order] = (right - xs) * (left - ys)
+    return values
+
+
+# -------------------------------------------------------------------------------------- #
+class _Underlay:
+    """
+    Private 2-D staircase of the points that were removed from the
+    sweep front by a newly inserted point. The prefix sums allow the
+    area of the staircase inside any upper-right bound to be computed
+    with two binary searches.
+    """
+    __slots__ = ('xs', 'neg_ys', 'ys', 'sum_w', 'sum_wy')
+
+    # -------------------------------------------------------- #
+    def __init__(self, xs: list, ys: list):
+        self.xs, self.ys = xs, ys
+        self.neg_ys = [-y for y in ys]
+        self.sum_w, self.sum_wy = [0.0], [0.0]
+        for i in range(len(xs) - 1):
+            width = xs[i + 1] - xs[i]
+            self.sum_w.append(self.sum_w[-1] + width)
+            self.sum_wy.append(self.sum_wy[-1] + width * ys[i])
+
+    # -------------------------------------------------------- #
+    def area(self, bound_x: float, bound_y: float) -> float:
+        a = bisect_right(self.neg_ys, -bound_y)
+        b = bisect_left(self.xs, bound_x)
+        if a >= b:
+            return 0.0
+        area = bound_y * (self.sum_w[b - 1] - self.sum_w[a])
+        area -= self.sum_wy[b - 1] - self.sum_wy[a]
+        area += (bound_x - self.xs[b - 1]) * (bound_y - self.ys[b - 1])
+        return area
+
+
+# -------------------------------------------------------------------------------------- #
+def _contributions_3d(points: numpy.ndarray, ref: numpy.ndarray) -> Optional[numpy.ndarray]:
+    order = numpy.lexsort((points[:, 1], points[:, 0], points[:, 2]))
+    ref_x, ref_y, ref_z = ref.tolist()
+    coords = points.tolist()
+    contribs = [0.0] * len(points)
+    areas = [0.0] * len(points)
+    since = [0.0] * len(points)
+    under = [None] * len(points)
+    xs, ys, ids = [], [], []
+
+    def refresh(pos: int, z: float) -> None:
+        idx = ids[pos]
+        bound_x = xs[pos + 1] if pos + 1 < len(xs) else ref_x
+        bound_y = ys[pos - 1] if pos > 0 else ref_y
+        area = (bound_x - xs[pos]) * (bound_y - ys[pos])
+        if under[idx] is not None:
+            area -= under[idx].area(bound_x, bound_y)
+        contribs[idx] += areas[idx] * (z - since[idx])
+        areas[idx], since[idx] = area, z
+
+    for idx in order.tolist():
+        x, y, z = coords[idx]
+        i = bisect_right(xs, x)
+        if i > 0 and ys[i - 1] <= y:
+            return None
+        j = k = bisect_left(xs, x)
+        while k < len(ys) and ys[k] >= y:
+            removed = ids[k]
+            contribs[removed] += areas[removed] * (z - since[removed])
+            areas[removed] = 0.0
+            k += 1
+        if k > j:
+            under[idx] = _Underlay(xs[j:k], ys[j:k])
+        xs[j:k], ys[j:k], ids[j:k] = [x], [y], [idx]
+        since[idx] = z
+        for pos in (j - 1, j, j + 1):
+            if 0 <= pos < len(xs):
+                refresh(pos, z)
+
+    for idx in ids:
+        contribs[idx] += areas[idx] * (ref_z - since[idx])
+    return numpy.array(contribs)
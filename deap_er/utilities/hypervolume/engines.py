@@ -0,0 +1,227 @@
+# ====================================================================================== #
+#                                                                                        #
+#   MIT License                                                                          #
+#                                                                                        #
+#   Copyright (c) 2022 - Mattias Aabmets, The DEAP Team and Other Contributors           #
+#                                                                                        #
+#   Permission is hereby granted, free of charge, to any person obtaining a copy         #
+#   of this software and associated documentation files (the "Software"), to deal        #
+#   in the Software without restriction, including without limitation the rights         #
+#   to use, copy, modify, merge, publish, distribute, sublicense, and/or sell            #
+#   copies of the Software, and to permit persons to whom the Software is                #
+#   furnished to do so, subject to the following conditions:                             #
+#                                                                                        #
+#   The above copyright notice and this permission notice shall be included in all       #
+#   copies or substantial portions of the Software.                                      #
+#                                                                                        #
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR           #
+#   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,             #
+#   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE          #
+#   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER               #
+#   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,        #
+#   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE        #
+#   SOFTWARE.                                                                            #
+#                                                                                        #
+# ====================================================================================== #
+from bisect import bisect_left, bisect_right
+import numpy
+
+
+__all__ = ['hv_exact', 'hv_2d', 'hv_3d', 'hv_4d', 'hv_wfg']
+
+
+# ====================================================================================== #
+def hv_exact(point_set: numpy.ndarray, ref_point: numpy.ndarray) -> float:
+    """
+    Computes the exact hypervolume that is dominated by the **point_set**
+    with the fastest available engine for the number of dimensions.
+    The 2-D and 3-D sweeps are used for two and three dimensions, HV4D
+    for four dimensions and WFG for five or more dimensions. Minimization
+    is implicitly assumed and the **point_set** is not modified.
+
+    :param point_set: The set of points that are to be evaluated.
+    :param ref_point: The reference point for the hypervolume calculation.
+    :return: The hypervolume of the given point set.
+    """
+    points, ref = _relevant(point_set, ref_point)
+    if len(points) == 0:
+        return 0.0
+    elif len(ref) == 1:
+        return float(ref[0] - points[:, 0].min())
+    elif len(ref) == 2:
+        return _hv_2d(points, ref)
+    elif len(ref) == 3:
+        return _hv_3d(points, ref)
+    elif len(ref) == 4:
+        return _hv_4d(points, ref)
+    return _hv_wfg(_non_dominated(points), ref)
+
+
+# -------------------------------------------------------------------------------------- #
+def hv_2d(point_set: numpy.ndarray, ref_point: numpy.ndarray) -> float:
+    """
+    Computes the hypervolume of a 2-D **point_set** with an
+    O(n*log(n)) sweep. Minimization is implicitly assumed.
+
+    :param point_set: The set of points that are to be evaluated.
+    :param ref_point: The reference point for the hypervolume calculation.
+    :return: The hypervolume of the given point set.
+    """
+    points, ref = _relevant(point_set, ref_point)
+    return _hv_2d(points, ref) if len(points) else 0.0
+
+
+# -------------------------------------------------------------------------------------- #
+def hv_3d(point_set: numpy.ndarray, ref_point: numpy.ndarray) -> float:
+    """
+    Computes the hypervolume of a 3-D **point_set** with the HV3D+
+    algorithm, which sweeps the points along the third objective and
+    maintains the area of the 2-D front in a sorted staircase in
+    O(n*log(n)) time. Minimization is implicitly assumed.
+
+    :param point_set: The set of points that are to be evaluated.
+    :param ref_point: The reference point for the hypervolume calculation.
+    :return: The hypervolume of the given point set.
+    """
+    points, ref = _relevant(point_set, ref_point)
+    return _hv_3d(points, ref) if len(points) else 0.0
+
+
+# -------------------------------------------------------------------------------------- #
+def hv_4d(point_set: numpy.ndarray, ref_point: numpy.ndarray) -> float:
+    """
+    Computes the hypervolume of a 4-D **point_set** with the HV4D
+    algorithm, which sweeps the points along the fourth objective and
+    updates the 3-D hypervolume of the swept points with the exclusive
+    contribution of each new point. Minimization is implicitly assumed.
+
+    :param point_set: The set of points that are to be evaluated.
+    :param ref_point: The reference point for the hypervolume calculation.
+    :return: The hypervolume of the given point set.
+    """
+    points, ref = _relevant(point_set, ref_point)
+    return _hv_4d(points, ref) if len(points) else 0.0
+
+
+# -------------------------------------------------------------------------------------- #
+def hv_wfg(point_set: numpy.ndarray, ref_point: numpy.ndarray) -> float:
+    """
+    Computes the hypervolume of a **point_set** of any dimension with the
+    WFG algorithm of While, Bradstreet and Barone, which sums the exclusive
+    contributions of the points computed from their non-dominated limit sets.
+    Minimization is implicitly assumed.
+
+    :param point_set: The set of points that are to be evaluated.
+    :param ref_point: The reference point for the hypervolume calculation.
+    :return: The hypervolume of the given point set.
+    """
+    points, ref = _relevant(point_set, ref_point)
+    if len(points) == 0:
+        return 0.0
+    elif len(ref) == 1:
+        return float(ref[0] - points[:, 0].min())
+    return _hv_wfg(_non_dominated(points), ref)
+
+
+# ====================================================================================== #
+def _relevant(point_set: numpy.ndarray, ref_point: numpy.ndarray) -> tuple:
+    ref = numpy.asarray(ref_point, dtype=float).ravel()
+    points = numpy.asarray(point_set, dtype=float).reshape(-1, len(ref))
+    mask = numpy.all(points < ref, axis=1)
+    return points[mask], ref
+
+
+# -------------------------------------------------------------------------------------- #
+def _non_dominated(points: numpy.ndarray, chunk: int = 256) -> numpy.ndarray:
+    if len(points) < 2:
+        return points
+    points = numpy.unique(points, axis=0)
+    keep = numpy.ones(len(points), dtype=bool)
+    for start in range(0, len(points), chunk):
+        block = points[start:start + chunk]
+        covered = numpy.all(block[:, None, :] >= points[None, :, :], axis=2)
+        covered[numpy.arange(len(block)), numpy.arange(start, start + len(block))] = False
+        keep[start:start + chunk] = ~covered.any(axis=1)
+    return points[keep]
+
+
+# -------------------------------------------------------------------------------------- #
+def _hv_2d(points: numpy.ndarray, ref: numpy.ndarray) -> float:
+    order = numpy.lexsort((points[:, 1], points[:, 0]))
+    x, y = points[order, 0], points[order, 1]
+    low = numpy.minimum.accumulate(y)
+    high = numpy.concatenate(([ref[1]], low[:-1]))
+    return float(numpy.sum((ref[0] - x) * (high - low)))
+
+
+# -------------------------------------------------------------------------------------- #
+def _hv_3d(points: numpy.ndarray, ref: numpy.ndarray) -> float:
+    order = numpy.lexsort((points[:, 1], points[:, 0], points[:, 2]))
+    ref_x, ref_y, ref_z = ref.tolist()
+    xs, ys = [], []
+    area, volume = 0.0, 0.0
+    last_z = points[order[0], 2]
+
+    for x, y, z in points[order].tolist():
+        volume += area * (z - last_z)
+        last_z = z
+        i = bisect_right(xs, x)
+        if i > 0 and ys[i - 1] <= y:
+            continue
+        j = k = bisect_left(xs, x)
+        cur_x, cur_y = x, ys[j - 1] if j > 0 else ref_y
+        while k < len(xs) and ys[k] >= y:
+            area += (xs[k] - cur_x) * (cur_y - y)
+            cur_x, cur_y = xs[k], ys[k]
+            k += 1
+        right = xs[k] if k < len(xs) else ref_x
+        area += (right - cur_x) * (cur_y - y)
+        xs[j:k] = [x]
+        ys[j:k] = [y]
+
+    return volume + area * (ref_z - last_z)
+
+
+# -------------------------------------------------------------------------------------- #
+def _hv_4d(points: numpy.ndarray, ref: numpy.ndarray) -> float:
+    points = points[numpy.argsort(points[:, 3], kind='stable')]
+    ref_3d = ref[:3]
+    swept = numpy.empty((0, 3))
+    hv_3d, volume = 0.0, 0.0
+    last_w = points[0, 3]
+
+    for point in points:
+        volume += hv_3d * (point[3] - last_w)
+        last_w = point[3]
+        head = point[:3]
+        if numpy.any(numpy.all(swept <= head, axis=1)):
+            continue
+        contrib = numpy.prod(ref_3d - head)
+        if len(swept):
+            contrib -= _hv_3d(numpy.maximum(swept, head), ref_3d)
+            swept = swept[~numpy.all(swept >= head, axis=1)]
+        hv_3d += contrib
+        swept = numpy.vstack((swept, head))
+
+    return float(volume + hv_3d * (ref[3] - last_w))
+
+
+# -------------------------------------------------------------------------------------- #
+def _hv_wfg(points: numpy.ndarray, ref: numpy.ndarray) -> float:
+    if len(points) == 0:
+        return 0.0
+    elif len(ref) == 2:
+        return _hv_2d(points, ref)
+    elif len(ref) == 3:
+        return _hv_3d(points, ref)
+
+    points = points[numpy.argsort(-points[:, -1], kind='stable')]
+    heads, ref_head = points[:, :-1], ref[:-1]
+    volume = 0.0
+    for i in range(len(points)):
+        contrib = numpy.prod(ref_head - heads[i])
+        if i + 1 < len(points):
+            limit = numpy.maximum(heads[i + 1:], heads[i])
+            contrib -= _hv_wfg(_non_dominated(limit), ref_head)
+        volume += contrib * (ref[-1] - points[i, -1])
+    return float(volume)
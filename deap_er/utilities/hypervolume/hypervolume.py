@@ -24,8 +24,7 @@
 #                                                                                        #
 # ====================================================================================== #
 from typing import Optional
-from .multi_list import MultiList
-from .node import Node
+from .engines import hv_exact
 import numpy
 
 
@@ -35,8 +34,9 @@ __all__ = ['hypervolume', 'HyperVolume']
 # ====================================================================================== #
 def hypervolume(population: list, ref_point: Optional[list] = None) -> float:
     """
-    Returns the hypervolume of a **population**.
-    Minimization is implicitly assumed.
+    Returns the hypervolume of a **population**. The computation
+    is dispatched on the number of objectives to the fastest exact
+    engine, as in :func:`hv_exact`. Minimization is implicitly assumed.
 
     :param population: A list of non-dominated individuals,
         where each individual has a Fitness attribute.
@@ -50,19 +50,21 @@ def hypervolume(population: list, ref_point: Optional[list] = None) -> float:
         ref_point = numpy.max(wvals, axis=0) + 1
     else:
         ref_point = numpy.array(ref_point)
-    hv = HyperVolume(ref_point)
-    return hv.compute(wvals)
+    return hv_exact(wvals, ref_point)
 
 
 # ====================================================================================== #
 class HyperVolume:
     """
     Creates a new HyperVolume object with the **ref_point**.
+    The dimension-sweep algorithm of Fonseca et al. is run over
+    index arrays: every point is a row index, the doubly linked
+    lists of each dimension are stored as arrays of the next and
+    previous row indices, and the partial areas and volumes of
+    the points are stored as matrices. The last row is the sentinel.
 
     :param ref_point: The reference point for the hypervolume calculation.
     """
-    multi_list: MultiList
-
     # -------------------------------------------------------- #
     def __init__(self, ref_point: numpy.ndarray) -> None:
         self.ref_point = ref_point
@@ -72,99 +74,130 @@ class HyperVolume:
     def compute(self, point_set: numpy.ndarray) -> float:
         """
         Computes the hypervolume that is dominated by the non-dominated
-        **point_set**. Minimization is implicitly assumed.
+        **point_set**. Minimization is implicitly assumed. The point set
+        is not modified.
 
         :param point_set: The set of points that are to be evaluated.
         :return: The hypervolume of the given point set.
         """
-        self._pre_process(point_set)
+        points = numpy.asarray(point_set, dtype=float)
+        if points.size == 0 or self.dims == 0:
+            return 0.0
+        points = points.reshape(len(points), -1)
+        self._pre_process(points)
         return self._hv_recursive(
             self.dims - 1,
-            len(point_set),
+            len(points),
             self.dims * [-1.0e308]
         )
 
     # -------------------------------------------------------- #
-    def _pre_process(self, point_set: numpy.ndarray) -> None:
-        if any(self.ref_point):
-            point_set -= self.ref_point
-        node_list = MultiList(self.dims)
-        nodes = [Node(self.dims, point) for point in point_set]
-        for i in range(self.dims):
-            decorated = [(node.cargo[i], node) for node in nodes]
-            decorated.sort()
-            nodes[:] = [node for _, node in decorated]
-            node_list.extend(nodes, i)
-        self.multi_list = node_list
+    def _pre_process(self, points: numpy.ndarray) -> None:
+        size, dims = len(points), self.dims
+        cargo = numpy.full((size + 1, points.shape[1]), numpy.nan)
+        cargo[:size] = points - numpy.asarray(self.ref_point, dtype=float)
+
+        nxt = numpy.empty((dims, size + 1), dtype=int)
+        prv = numpy.empty((dims, size + 1), dtype=int)
+        order = numpy.arange(size)
+        for i in range(dims):
+            order = order[numpy.argsort(cargo[order, i], kind='stable')]
+            chain = numpy.concatenate(([size], order, [size]))
+            nxt[i, chain[:-1]] = chain[1:]
+            prv[i, chain[1:]] = chain[:-1]
+
+        self.sentinel = size
+        self.cargo = cargo.tolist()
+        self.next = nxt.tolist()
+        self.prev = prv.tolist()
+        self.ignore = [0] * (size + 1)
+        self.area = numpy.zeros((size + 1, dims)).tolist()
+        self.volume = numpy.zeros((size + 1, dims)).tolist()
 
     # -------------------------------------------------------- #
-    def _hv_recursive(self, dim_index: int, length: int, bounds: list) -> float:
-        sentinel = self.multi_list.sentinel
-        reinsert = self.multi_list.reinsert
-        remove = self.multi_list.remove
-
-        def inception():
-            q.volume[dim_index] = hvol
-            if q.ignore >= dim_index:
-                q.area[dim_index] = q.prev[dim_index].area[dim_index]
-            else:
-                q.area[dim_index] = self._hv_recursive(dim_index - 1, length, bounds)
-                if q.area[dim_index] <= q.prev[dim_index].area[dim_index]:
-                    q.ignore = dim_index
+    def _remove(self, node: int, dim_index: int, bounds: list) -> None:
+        cargo = self.cargo[node]
+        for i in range(dim_index):
+            nxt, prv = self.next[i], self.prev[i]
+            predecessor, successor = prv[node], nxt[node]
+            nxt[predecessor] = successor
+            prv[successor] = predecessor
+            if bounds[i] > cargo[i]:
+                bounds[i] = cargo[i]
+
+    # -------------------------------------------------------- #
+    def _reinsert(self, node: int, dim_index: int, bounds: list) -> None:
+        cargo = self.cargo[node]
+        for i in range(dim_index):
+            nxt, prv = self.next[i], self.prev[i]
+            nxt[prv[node]] = node
+            prv[nxt[node]] = node
+            if bounds[i] > cargo[i]:
+                bounds[i] = cargo[i]
 
-        def in_bounds():
-            a = q.prev[dim_index].cargo[dim_index] >= bounds[dim_index]
-            b = q.cargo[dim_index] > bounds[dim_index]
-            return True if a or b else False
+    # -------------------------------------------------------- #
+    def _hv_recursive(self, dim_index: int, length: int, bounds: list) -> float:
+        sentinel, cargo = self.sentinel, self.cargo
+        area, volume, ignore = self.area, self.volume, self.ignore
 
         hvol = 0.0
         if length == 0:
             return hvol
         elif dim_index == 0:
-            return -sentinel.next[0].cargo[0]
+            return -cargo[self.next[0][sentinel]][0]
         elif dim_index == 1:
-            q = sentinel.next[1]
-            h = q.cargo[0]
-            p = q.next[1]
-            while p is not sentinel:
-                hvol += h * (q.cargo[1] - p.cargo[1])
-                if p.cargo[0] < h:
-                    h = p.cargo[0]
+            nxt = self.next[1]
+            q = nxt[sentinel]
+            h = cargo[q][0]
+            p = nxt[q]
+            while p != sentinel:
+                hvol += h * (cargo[q][1] - cargo[p][1])
+                if cargo[p][0] < h:
+                    h = cargo[p][0]
                 q = p
-                p = q.next[1]
-            hvol += h * q.cargo[1]
+                p = nxt[q]
+            hvol += h * cargo[q][1]
             return hvol
+
+        nxt, prv = self.next[dim_index], self.prev[dim_index]
+        p = sentinel
+        q = prv[p]
+        while q != sentinel:
+            if ignore[q] < dim_index:
+                ignore[q] = 0
+            q = prv[q]
+        q = prv[p]
+        while length > 1 and (cargo[prv[q]][dim_index] >= bounds[dim_index]
+                              or cargo[q][dim_index] > bounds[dim_index]):
+            p = q
+            self._remove(p, dim_index, bounds)
+            q = prv[p]
+            length -= 1
+        if length > 1:
+            hvol = cargo[q][dim_index] - cargo[prv[q]][dim_index]
+            hvol *= area[prv[q]][dim_index]
+            hvol += volume[prv[q]][dim_index]
         else:
-            p = sentinel
-            q = p.prev[dim_index]
-            while q.cargo is not None:
-                if q.ignore < dim_index:
-                    q.ignore = 0
-                q = q.prev[dim_index]
-            q = p.prev[dim_index]
-            while length > 1 and in_bounds():
-                p = q
-                remove(p, dim_index, bounds)
-                q = p.prev[dim_index]
-                length -= 1
-            if length > 1:
-                hvol = q.cargo[dim_index] - q.prev[dim_index].cargo[dim_index]
-                hvol *= q.prev[dim_index].area[dim_index]
-                hvol += q.prev[dim_index].volume[dim_index]
+            q_area, q_cargo = area[q], cargo[q]
+            q_area[0] = 1
+            q_area[1: dim_index + 1] = [
+                q_area[i] * -q_cargo[i] for i in range(dim_index)
+            ]
+        while True:
+            volume[q][dim_index] = hvol
+            if ignore[q] >= dim_index:
+                area[q][dim_index] = area[prv[q]][dim_index]
             else:
-                q.area[0] = 1
-                q.area[1: dim_index + 1] = [
-                    q.area[i] * -q.cargo[i] for i in range(dim_index)
-                ]
-            inception()
-            while p is not sentinel:
-                new_point = p.cargo[dim_index] - q.cargo[dim_index]
-                hvol += q.area[dim_index] * new_point
-                bounds[dim_index] = p.cargo[dim_index]
-                reinsert(p, dim_index, bounds)
-                length += 1
-                q = p
-                p = p.next[dim_index]
-                inception()
-            hvol -= q.area[dim_index] * q.cargo[dim_index]
-            return hvol
+                area[q][dim_index] = self._hv_recursive(dim_index - 1, length, bounds)
+                if area[q][dim_index] <= area[prv[q]][dim_index]:
+                    ignore[q] = dim_index
+            if p == sentinel:
+                break
+            hvol += area[q][dim_index] * (cargo[p][dim_index] - cargo[q][dim_index])
+            bounds[dim_index] = cargo[p][dim_index]
+            self._reinsert(p, dim_index, bounds)
+            length += 1
+            q = p
+            p = nxt[p]
+        hvol -= area[q][dim_index] * cargo[q][dim_index]
+        return hvol
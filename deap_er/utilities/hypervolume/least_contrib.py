@@ -23,24 +23,30 @@
 #   SOFTWARE.                                                                            #
 #                                                                                        #
 # ====================================================================================== #
-from .hypervolume import HyperVolume
+from .contributions import hv_contributions, HvContributions
+from .approximate import hv_approx_contributions, _exclusive_bounds
 from typing import Callable, Optional, Union
 import numpy
 
 
-__all__ = ['least_contrib']
+__all__ = ['least_contrib', 'least_contribs']
 
 
 # ====================================================================================== #
-def _compute_hv(data: tuple) -> float:
-    point_set, ref_point = data[0], data[1]
-    hv = HyperVolume(ref_point)
-    return hv.compute(point_set)
+def _prepare(population: list, ref_point: Optional[list]) -> tuple:
+    wvals = [ind.fitness.wvalues for ind in population]
+    wvals = numpy.array(wvals) * -1
+    if ref_point is None:
+        ref_point = numpy.max(wvals, axis=0) + 1
+    else:
+        ref_point = numpy.array(ref_point)
+    return wvals, ref_point
 
 
 # -------------------------------------------------------------------------------------- #
 def least_contrib(population: list, ref_point: Optional[list] = None,
-                  map_func: Optional[Callable] = map) -> Union[int, numpy.ndarray]:
+                  map_func: Optional[Callable] = map,
+                  samples: Optional[int] = None) -> Union[int, numpy.ndarray]:
     """
     Returns the index of the individual with the least hypervolume
     contribution. Minimization is implicitly assumed.
@@ -51,21 +57,81 @@ def least_contrib(population: list, ref_point: Optional[list] = None,
     :param map_func: Any map function which maps an iterable to a callable,
         optional. This can be used to speed up the computation by providing
         a multiprocess mapping function which is associated to a pool of
-        workers. The default is the regular single-process map function.
+        workers. It is used when the contributions are computed one at a time,
+        which is the case for more than three objectives. The default is the
+        regular single-process map function.
+    :param samples: If set, the contributions are estimated by Monte Carlo
+        sampling with this many samples for each individual instead of being
+        computed exactly. This is useful for many-objective problems, where
+        the exact computation is prohibitively slow. Optional.
     :return: The index of the individual with the least hypervolume contribution.
     """
-    wvals = [ind.fitness.wvalues for ind in population]
-    wvals = numpy.array(wvals) * -1
-    if ref_point is None:
-        ref_point = numpy.max(wvals, axis=0) + 1
-    else:
-        ref_point = numpy.array(ref_point)
+    wvals, ref_point = _prepare(population, ref_point)
+    if samples is not None:
+        contrib_values, _, _ = hv_approx_contributions(wvals, ref_point, samples)
+        return numpy.argmin(contrib_values)
+    contrib_values = hv_contributions(wvals, ref_point, map_func)
+    return numpy.argmin(contrib_values)
 
-    data = []
-    for i in range(len(population)):
-        point_set = (wvals[:i], wvals[i + 1:])
-        point_set = numpy.concatenate(point_set)
-        data.append((point_set, ref_point))
 
-    contrib_values = list(map_func(_compute_hv, data))
-    return numpy.argmax(contrib_values)
+# -------------------------------------------------------------------------------------- #
+def least_contribs(population: list, count: int, ref_point: Optional[list] = None,
+                   map_func: Optional[Callable] = map,
+                   samples: Optional[int] = None) -> list:
+    """
+    Returns the indices of the **count** individuals that are removed one
+    at a time as the individual with the least hypervolume contribution.
+    The contributions are computed once and then updated after each
+    removal. Minimization is implicitly assumed.
+
+    :param population: A list of non-dominated individuals,
+        where each individual has a Fitness attribute.
+    :param count: The number of individuals to remove.
+    :param ref_point: The reference point for the hypervolume, optional.
+    :param map_func: Any map function which maps an iterable to a callable,
+        optional. It is used for the initial contributions in the same
+        way as in the *'least_contrib'* function.
+    :param samples: If set, the contributions are estimated by Monte Carlo
+        sampling with this many samples for each individual. After each
+        removal, only the individuals whose exclusive region could have
+        grown are estimated again. Optional.
+    :return: The indices of the removed individuals in the order of removal.
+    """
+    if count <= 0 or len(population) == 0:
+        return []
+    wvals, ref_point = _prepare(population, ref_point)
+    if samples is not None:
+        return _approx_least_contribs(wvals, ref_point, count, samples)
+    contribs = HvContributions(wvals, ref_point, map_func)
+    removed = list()
+    for _ in range(min(count, len(population))):
+        index = contribs.least()
+        contribs.remove(index)
+        removed.append(index)
+    return removed
+
+
+# -------------------------------------------------------------------------------------- #
+def _approx_least_contribs(wvals: numpy.ndarray, ref_point: numpy.ndarray,
+                           count: int, samples: int) -> list:
+    remaining = numpy.arange(len(wvals))
+    values, _, _ = hv_approx_contributions(wvals, ref_point, samples)
+    uppers = _exclusive_bounds(wvals, ref_point)
+    removed = list()
+    for _ in range(min(count, len(wvals))):
+        pos = int(numpy.argmin(values))
+        index = int(remaining[pos])
+        removed.append(index)
+        point = wvals[index]
+        remaining = numpy.delete(remaining, pos)
+        values = numpy.delete(values, pos)
+        uppers = numpy.delete(uppers, pos, axis=0)
+        if len(remaining) == 0:
+            break
+        stale = numpy.flatnonzero(numpy.all(point <= uppers, axis=1))
+        if len(stale) > 0:
+            points = wvals[remaining]
+            new_values, _, _ = hv_approx_contributions(points, ref_point, samples, indices=stale)
+            values[stale] = new_values[stale]
+            uppers[stale] = _exclusive_bounds(points, ref_point)[stale]
+    return removed
@@ -24,21 +24,27 @@
 #                                                                                        #
 # ====================================================================================== #
 from collections import defaultdict
-from typing import Callable, Sequence
-from operator import itemgetter
 import bisect
+import numpy
 
 
 __all__ = ['sort_log_non_dominated']
 
 
+# ====================================================================================== #
+_SORT = 0
+_SWEEP = 1
+
+
 # ====================================================================================== #
 def sort_log_non_dominated(individuals: list, sel_count: int,
                            ffo: bool = False) -> list:
     """
     Sorts **individuals** in pareto non-dominated fronts
     using the Generalized Reduced Run-Time Complexity
-    Non-Dominated Sorting Algorithm.
+    Non-Dominated Sorting Algorithm. The divide-and-conquer
+    steps are processed with an explicit stack over arrays
+    of indices, so the recursion limit is never reached.
 
     :param individuals: A list of individuals to sort.
     :param sel_count: The number of individuals to select.
@@ -46,24 +52,19 @@ def sort_log_non_dominated(individuals: list, sel_count: int,
     :return: A list of Pareto fronts, where the
         first element is the true Pareto front.
     """
-    if sel_count == 0:
+    if sel_count == 0 or len(individuals) == 0:
         return []
 
     unique_fits = defaultdict(list)
-    for i, ind in enumerate(individuals):
+    for ind in individuals:
         unique_fits[ind.fitness.wvalues].append(ind)
 
-    obj = len(individuals[0].fitness.wvalues) - 1
-    fitness = list(unique_fits.keys())
-    front = dict.fromkeys(fitness, 0)
-
-    fitness.sort(reverse=True)
-    _sorting_helper_1(fitness, obj, front)
+    fitness = sorted(unique_fits.keys(), reverse=True)
+    front = _rank_fronts(numpy.array(fitness, dtype=float))
 
-    nb_fronts = max(front.values())+1
+    nb_fronts = max(front) + 1
     pareto_fronts = [[] for _ in range(nb_fronts)]
-    for fit in fitness:
-        index = front[fit]
+    for fit, index in zip(fitness, front):
         pareto_fronts[index].extend(unique_fits[fit])
 
     if not ffo:
@@ -78,162 +79,176 @@ def sort_log_non_dominated(individuals: list, sel_count: int,
 
 
 # -------------------------------------------------------------------------------------- #
-def _is_dominated(wvalues1: Sequence, wvalues2: Sequence) -> bool:
-    not_equal = False
-    for self_wvalue, other_wvalue in zip(wvalues1, wvalues2):
-        if self_wvalue > other_wvalue:
-            return False
-        elif self_wvalue < other_wvalue:
-            not_equal = True
-    return not_equal
+def _rank_fronts(fits: numpy.ndarray) -> list:
+    count, n_obj = fits.shape
+    if n_obj == 1:
+        return list(range(count))
+
+    front = numpy.zeros(count, dtype=int)
+    stack = [(_SORT, numpy.arange(count), None, n_obj - 1)]
+    while stack:
+        task, best, worst, obj = stack.pop()
+        if task == _SORT:
+            _sorting_helper_1(fits, front, stack, best, obj)
+        else:
+            _sorting_helper_2(fits, front, stack, best, worst, obj)
+    return front.tolist()
 
 
 # -------------------------------------------------------------------------------------- #
-def _median(seq: Sequence, key: Callable = None) -> float:
-    key = key if key else lambda x: x
-    sorted_seq = sorted(seq, key=key)
-    length = len(seq)
+def _median(values: numpy.ndarray) -> float:
+    length = len(values)
+    half = length // 2
     if length % 2 == 1:
-        return key(sorted_seq[(length - 1) // 2])
-    else:
-        temp1 = key(sorted_seq[(length - 1) // 2])
-        temp2 = key(sorted_seq[length // 2])
-        return (temp1 + temp2) / 2.0
+        return numpy.partition(values, half)[half]
+    parts = numpy.partition(values, [half - 1, half])
+    return (parts[half - 1] + parts[half]) / 2.0
 
 
 # -------------------------------------------------------------------------------------- #
-def _splitter(seq: Sequence, obj: int, median: float) -> tuple:
-    seq_1, seq_2, seq_3, seq_4 = [], [], [], []
-
-    for fit in seq:
-        if fit[obj] > median:
-            seq_1.append(fit)
-            seq_3.append(fit)
-        elif fit[obj] < median:
-            seq_2.append(fit)
-            seq_4.append(fit)
-        else:
-            seq_1.append(fit)
-            seq_4.append(fit)
-
-    return seq_1, seq_2, seq_3, seq_4
-
-
-# -------------------------------------------------------------------------------------- #
-def _sorting_helper_1(fitness: Sequence, obj: int, front: dict) -> None:
-    if len(fitness) < 2:
+def _sorting_helper_1(fits: numpy.ndarray, front: numpy.ndarray,
+                      stack: list, idx: numpy.ndarray, obj: int) -> None:
+    if len(idx) < 2:
         return
-    elif len(fitness) == 2:
-        s1, s2 = fitness[0], fitness[1]
-        if _is_dominated(s2[:obj + 1], s1[:obj + 1]):
+    elif len(idx) == 2:
+        s1, s2 = idx
+        fit1, fit2 = fits[s1, :obj + 1], fits[s2, :obj + 1]
+        if (fit2 <= fit1).all() and (fit2 < fit1).any():
             front[s2] = max(front[s2], front[s1] + 1)
     elif obj == 1:
-        _sweep_a(fitness, front)
-    elif len(frozenset(list(map(itemgetter(obj), fitness)))) == 1:
-        _sorting_helper_1(fitness, obj - 1, front)
+        _sweep_a(fits, front, idx)
     else:
-        best, worst = _split_a(fitness, obj)
-        _sorting_helper_1(best, obj, front)
-        _sorting_helper_2(best, worst, obj - 1, front)
-        _sorting_helper_1(worst, obj, front)
+        values = fits[idx, obj]
+        if values.min() == values.max():
+            stack.append((_SORT, idx, None, obj - 1))
+            return
+        best, worst = _split_a(idx, values)
+        stack.append((_SORT, worst, None, obj))
+        stack.append((_SWEEP, best, worst, obj - 1))
+        stack.append((_SORT, best, None, obj))
 
 
 # -------------------------------------------------------------------------------------- #
-def _split_a(fitness: Sequence, obj: int):
-    median_ = _median(fitness, itemgetter(obj))
-    best_a, worst_a, best_b, worst_b = _splitter(fitness, obj, median_)
+def _split_a(idx: numpy.ndarray, values: numpy.ndarray) -> tuple:
+    median = _median(values)
+    above = values > median
+    below = values < median
+
+    length = len(values)
+    nb_above = numpy.count_nonzero(above)
+    nb_below = numpy.count_nonzero(below)
 
-    balance_a = abs(len(best_a) - len(worst_a))
-    balance_b = abs(len(best_b) - len(worst_b))
+    balance_a = abs(length - 2 * nb_below)
+    balance_b = abs(2 * nb_above - length)
 
     if balance_a <= balance_b:
-        return best_a, worst_a
+        return idx[~below], idx[below]
     else:
-        return best_b, worst_b
+        return idx[above], idx[~above]
 
 
 # -------------------------------------------------------------------------------------- #
-def _sweep_a(fitness: Sequence, front: dict) -> None:
-    stairs = [-fitness[0][1]]
-    f_stairs = [fitness[0]]
-    for fit in fitness[1:]:
-        idx = bisect.bisect_right(stairs, -fit[1])
-        if 0 < idx <= len(stairs):
-            f_stair = max(f_stairs[:idx], key=front.__getitem__)
-            front[fit] = max(front[fit], front[f_stair]+1)
-        for i, f_stair in enumerate(f_stairs[idx:], idx):
-            if front[f_stair] == front[fit]:
-                del stairs[i]
-                del f_stairs[i]
+def _sweep_a(fits: numpy.ndarray, front: numpy.ndarray, idx: numpy.ndarray) -> None:
+    second = fits[idx, 1].tolist()
+    ranks = front[idx].tolist()
+    stairs = [-second[0]]
+    f_stairs = [0]
+    for i in range(1, len(second)):
+        pos = bisect.bisect_right(stairs, -second[i])
+        if pos > 0:
+            top = max(ranks[j] for j in f_stairs[:pos])
+            ranks[i] = max(ranks[i], top + 1)
+        for k in range(pos, len(f_stairs)):
+            if ranks[f_stairs[k]] == ranks[i]:
+                del stairs[k]
+                del f_stairs[k]
                 break
-        stairs.insert(idx, -fit[1])
-        f_stairs.insert(idx, fit)
+        stairs.insert(pos, -second[i])
+        f_stairs.insert(pos, i)
+    front[idx] = ranks
 
 
 # -------------------------------------------------------------------------------------- #
-def _sorting_helper_2(best: Sequence, worst: Sequence, obj: int, front: dict) -> None:
-    key = itemgetter(obj)
+def _sorting_helper_2(fits: numpy.ndarray, front: numpy.ndarray, stack: list,
+                      best: numpy.ndarray, worst: numpy.ndarray, obj: int) -> None:
     if len(worst) == 0 or len(best) == 0:
         return
     elif len(best) == 1 or len(worst) == 1:
-        for hi in worst:
-            for li in best:
-                cond_1 = _is_dominated(hi[:obj + 1], li[:obj + 1])
-                cond_2 = hi[:obj + 1] == li[:obj + 1]
-                if cond_1 or cond_2:
-                    front[hi] = max(front[hi], front[li] + 1)
+        best_fits = fits[best, :obj + 1]
+        worst_fits = fits[worst, :obj + 1]
+        covered = (worst_fits[:, None, :] <= best_fits[None, :, :]).all(axis=2)
+        ranks = numpy.where(covered, front[best][None, :] + 1, 0).max(axis=1)
+        front[worst] = numpy.maximum(front[worst], ranks)
     elif obj == 1:
-        _sweep_b(best, worst, front)
-    elif key(min(best, key=key)) >= key(max(worst, key=key)):
-        _sorting_helper_2(best, worst, obj - 1, front)
-    elif key(max(best, key=key)) >= key(min(worst, key=key)):
-        best1, best2, worst1, worst2 = _split_b(best, worst, obj)
-        _sorting_helper_2(best1, worst1, obj, front)
-        _sorting_helper_2(best1, worst2, obj - 1, front)
-        _sorting_helper_2(best2, worst2, obj, front)
+        _sweep_b(fits, front, best, worst)
+    else:
+        best_values = fits[best, obj]
+        worst_values = fits[worst, obj]
+        if best_values.min() >= worst_values.max():
+            stack.append((_SWEEP, best, worst, obj - 1))
+        elif best_values.max() >= worst_values.min():
+            best1, best2, worst1, worst2 = _split_b(
+                best, worst, best_values, worst_values
+            )
+            stack.append((_SWEEP, best2, worst2, obj))
+            stack.append((_SWEEP, best1, worst2, obj - 1))
+            stack.append((_SWEEP, best1, worst1, obj))
 
 
 # -------------------------------------------------------------------------------------- #
-def _split_b(best: Sequence, worst: Sequence, obj: int):
+def _split_b(best: numpy.ndarray, worst: numpy.ndarray,
+             best_values: numpy.ndarray, worst_values: numpy.ndarray) -> tuple:
     if len(best) > len(worst):
-        median_ = _median(best)
+        median = _median(best_values)
     else:
-        median_ = _median(worst, itemgetter(obj))
+        median = _median(worst_values)
+
+    best_above = best_values > median
+    best_below = best_values < median
+    worst_above = worst_values > median
+    worst_below = worst_values < median
 
-    best1_a, best2_a, best1_b, best2_b = _splitter(best, obj, median_)
-    worst1_a, worst2_a, worst1_b, worst2_b = _splitter(worst, obj, median_)
+    length = len(best) + len(worst)
+    nb_above = numpy.count_nonzero(best_above) + numpy.count_nonzero(worst_above)
+    nb_below = numpy.count_nonzero(best_below) + numpy.count_nonzero(worst_below)
 
-    balance_a = abs(len(best1_a) - len(best2_a) + len(worst1_a) - len(worst2_a))
-    balance_b = abs(len(best1_b) - len(best2_b) + len(worst1_b) - len(worst2_b))
+    balance_a = abs(length - 2 * nb_below)
+    balance_b = abs(2 * nb_above - length)
 
     if balance_a <= balance_b:
-        return best1_a, best2_a, worst1_a, worst2_a
+        return best[~best_below], best[best_below], worst[~worst_below], worst[worst_below]
     else:
-        return best1_b, best2_b, worst1_b, worst2_b
+        return best[best_above], best[~best_above], worst[worst_above], worst[~worst_above]
 
 
 # -------------------------------------------------------------------------------------- #
-def _sweep_b(best, worst, front):
+def _sweep_b(fits: numpy.ndarray, front: numpy.ndarray,
+             best: numpy.ndarray, worst: numpy.ndarray) -> None:
+    best_fits = fits[best, :2].tolist()
+    worst_fits = fits[worst, :2].tolist()
+    best_ranks = front[best].tolist()
+    worst_ranks = front[worst].tolist()
+
     stairs, f_stairs = [], []
-    iter_best = iter(best)
-    next_best = next(iter_best, False)
-    for h in worst:
-        while next_best and h[:2] <= next_best[:2]:
+    nb_best, next_best = len(best_fits), 0
+    for i, fit in enumerate(worst_fits):
+        while next_best < nb_best and fit <= best_fits[next_best]:
             insert = True
-            for i, f_stair in enumerate(f_stairs):
-                if front[f_stair] == front[next_best]:
-                    if f_stair[1] > next_best[1]:
+            for k, f_stair in enumerate(f_stairs):
+                if best_ranks[f_stair] == best_ranks[next_best]:
+                    if best_fits[f_stair][1] > best_fits[next_best][1]:
                         insert = False
                     else:
-                        del stairs[i], f_stairs[i]
+                        del stairs[k], f_stairs[k]
                     break
             if insert:
-                idx = bisect.bisect_right(stairs, -next_best[1])
-                stairs.insert(idx, -next_best[1])
-                f_stairs.insert(idx, next_best)
-            next_best = next(iter_best, False)
-
-        idx = bisect.bisect_right(stairs, -h[1])
-        if 0 < idx <= len(stairs):
-            f_stair = max(f_stairs[:idx], key=front.__getitem__)
-            front[h] = max(front[h], front[f_stair]+1)
+                pos = bisect.bisect_right(stairs, -best_fits[next_best][1])
+                stairs.insert(pos, -best_fits[next_best][1])
+                f_stairs.insert(pos, next_best)
+            next_best += 1
+
+        pos = bisect.bisect_right(stairs, -fit[1])
+        if pos > 0:
+            top = max(best_ranks[j] for j in f_stairs[:pos])
+            worst_ranks[i] = max(worst_ranks[i], top + 1)
+    front[worst] = worst_ranks
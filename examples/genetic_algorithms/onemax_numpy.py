@@ -6,6 +6,7 @@ import numpy
 
 
 random.seed(1234)  # disables randomization
+numpy.random.seed(1234)
 
 
 def setup():
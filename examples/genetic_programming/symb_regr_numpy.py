@@ -20,9 +20,8 @@ def safe_div(left, right):
     return x
 
 
-def evaluate(individual, toolbox, samples, values):
-    func = toolbox.compile(expr=individual)
-    diff = numpy.sum((func(samples) - values)**2)
+def evaluate(individual, evaluator, values):
+    diff = numpy.sum((evaluator(individual) - values)**2)
     return diff,
 
 
@@ -48,8 +47,8 @@ def setup():
     toolbox.register("expr", gp.gen_half_and_half, prim_set=pset, min_depth=1, max_depth=2)
     toolbox.register("individual", tools.init_iterate, creator.Individual, toolbox.expr)
     toolbox.register("population", tools.init_repeat, list, toolbox.individual)
-    toolbox.register("compile", gp.compile_tree, prim_set=pset)
-    toolbox.register("evaluate", evaluate, toolbox=toolbox, samples=samples, values=values)
+    evaluator = gp.DatasetEvaluator(pset, samples)
+    toolbox.register("evaluate", evaluate, evaluator=evaluator, values=values)
     toolbox.register("select", tools.sel_tournament, contestants=3)
     toolbox.register("mate", gp.cx_one_point)
     toolbox.register("expr_mut", gp.gen_full, min_depth=0, max_depth=2)
@@ -250,3 +250,28 @@ def test_nsga3():
         assert not (any(numpy.asarray(ind) < bound_low) or any(numpy.asarray(ind) > bound_up))
 
     teardown_func()
+
+
+def test_var_and_batch():
+    setup_func_multi_obj_numpy()
+    numpy.random.seed(0)
+
+    toolbox = base.Toolbox()
+    toolbox.register("mate", tools.cx_uniform, cx_prob=0.5)
+    toolbox.register("mutate", tools.mut_flip_bit, mut_prob=0.5)
+
+    pop = [creator.__dict__[INDCLSNAME]([i % 2] * 20) for i in range(200)]
+    for ind in pop:
+        ind.fitness.values = (1.0, 1.0)
+    offspring = tools.var_and_batch(toolbox, pop, 0.5, 0.0)
+
+    varied = [i for i, ind in enumerate(offspring) if not ind.fitness.is_valid()]
+    assert 0 < len(varied) < len(pop)
+    for i, ind in enumerate(offspring):
+        assert i in varied or numpy.array_equal(ind, pop[i])
+        assert numpy.array_equal(ind + offspring[i ^ 1], [1] * 20)
+
+    matrix = tools.var_and_batch(toolbox, numpy.zeros((50, 10)), 0.0, 1.0)
+    assert 0.3 < matrix.mean() < 0.7
+
+    teardown_func()
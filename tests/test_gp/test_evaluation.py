@@ -0,0 +1,87 @@
+# ====================================================================================== #
+#                                                                                        #
+#   MIT License                                                                          #
+#                                                                                        #
+#   Copyright (c) 2022 - Mattias Aabmets, The DEAP Team and Other Contributors           #
+#                                                                                        #
+#   Permission is hereby granted, free of charge, to any person obtaining a copy         #
+#   of this software and associated documentation files (the "Software"), to deal        #
+#   in the Software without restriction, including without limitation the rights         #
+#   to use, copy, modify, merge, publish, distribute, sublicense, and/or sell            #
+#   copies of the Software, and to permit persons to whom the Software is                #
+#   furnished to do so, subject to the following conditions:                             #
+#                                                                                        #
+#   The above copyright notice and this permission notice shall be included in all       #
+#   copies or substantial portions of the Software.                                      #
+#                                                                                        #
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR           #
+#   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,             #
+#   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE          #
+#   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER               #
+#   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,        #
+#   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE        #
+#   SOFTWARE.                                                                            #
+#                                                                                        #
+# ====================================================================================== #
+from deap_er.gp import PrimitiveSet, PrimitiveTree, DatasetEvaluator
+from deap_er.gp import compile_tree
+import pickle
+import numpy
+
+
+def make_pset():
+    pset = PrimitiveSet("main", 2)
+    pset.add_primitive(numpy.add, 2, name="vadd")
+    pset.add_primitive(numpy.multiply, 2, name="vmul")
+    pset.add_primitive(numpy.sin, 1, name="vsin")
+    pset.add_terminal(2.0)
+    return pset
+
+
+# ====================================================================================== #
+class TestDatasetEvaluator:
+
+    def test_population(self):
+        pset = make_pset()
+        data = numpy.random.default_rng(0).normal(size=(50, 2))
+        population = [
+            PrimitiveTree.from_string(code, pset) for code in (
+                "vadd(vsin(vmul(ARG0, ARG1)), 2.0)",
+                "vmul(vsin(vmul(ARG0, ARG1)), ARG0)",
+                "vsin(vmul(ARG0, ARG1))",
+                "2.0"
+            )
+        ]
+        evaluator = DatasetEvaluator(pset, data)
+        results = evaluator.evaluate_population(population)
+        for ind, result in zip(population, results):
+            expected = compile_tree(ind, pset)(data[:, 0], data[:, 1])
+            assert numpy.allclose(result, expected)
+        assert evaluator.cache.hits == 2
+        assert evaluator.cache.misses == 4
+
+    # -------------------------------------------------------------------------------------- #
+    def test_offspring_reuse(self):
+        pset = make_pset()
+        data = numpy.random.default_rng(1).normal(size=(50, 2))
+        parent = "vadd(vsin(vmul(ARG0, ARG1)), vmul(ARG0, 2.0))"
+        child = "vadd(vsin(vmul(ARG0, ARG1)), vmul(ARG1, 2.0))"
+        evaluator = DatasetEvaluator(pset, data)
+        evaluator(PrimitiveTree.from_string(parent, pset))
+        evaluator.cache.hits = evaluator.cache.misses = 0
+        result = evaluator(PrimitiveTree.from_string(child, pset))
+        expected = numpy.sin(data[:, 0] * data[:, 1]) + data[:, 1] * 2.0
+        assert numpy.allclose(result, expected)
+        assert (evaluator.cache.hits, evaluator.cache.misses) == (1, 2)
+
+    # -------------------------------------------------------------------------------------- #
+    def test_pickle(self):
+        pset = make_pset()
+        data = numpy.random.default_rng(2).normal(size=(20, 2))
+        tree = PrimitiveTree.from_string("vadd(vsin(ARG0), vmul(ARG1, 2.0))", pset)
+        evaluator = DatasetEvaluator(pset, data)
+        expected = evaluator(tree)
+        clone = pickle.loads(pickle.dumps(evaluator))
+        assert len(clone.cache) == len(evaluator.cache)
+        assert numpy.allclose(clone(tree), expected)
+
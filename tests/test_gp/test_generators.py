@@ -0,0 +1,66 @@
+# ====================================================================================== #
+#                                                                                        #
+#   MIT License                                                                          #
+#                                                                                        #
+#   Copyright (c) 2022 - Mattias Aabmets, The DEAP Team and Other Contributors           #
+#                                                                                        #
+#   Permission is hereby granted, free of charge, to any person obtaining a copy         #
+#   of this software and associated documentation files (the "Software"), to deal        #
+#   in the Software without restriction, including without limitation the rights         #
+#   to use, copy, modify, merge, publish, distribute, sublicense, and/or sell            #
+#   copies of the Software, and to permit persons to whom the Software is                #
+#   furnished to do so, subject to the following conditions:                             #
+#                                                                                        #
+#   The above copyright notice and this permission notice shall be included in all       #
+#   copies or substantial portions of the Software.                                      #
+#                                                                                        #
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR           #
+#   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,             #
+#   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE          #
+#   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER               #
+#   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,        #
+#   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE        #
+#   SOFTWARE.                                                                            #
+#                                                                                        #
+# ====================================================================================== #
+from deap_er.gp import PrimitiveSetTyped, PrimitiveTree
+from deap_er.gp import gen_full, gen_grow, gen_batch
+import operator
+import random
+
+
+def if_then_else(cond, out1, out2):
+    return out1 if cond else out2
+
+
+def make_pset():
+    pset = PrimitiveSetTyped("main", [float, float], bool)
+    pset.add_primitive(operator.lt, [float, float], bool)
+    pset.add_primitive(operator.and_, [bool, bool], bool)
+    pset.add_primitive(operator.add, [float, float], float)
+    pset.add_primitive(if_then_else, [bool, float, float], float)
+    pset.add_terminal(1.0, float)
+    return pset
+
+
+# ====================================================================================== #
+class TestTypedGeneration:
+
+    def test_tables(self):
+        pset = make_pset()
+        assert pset.min_height(float) == 0
+        assert pset.min_height(bool) == 1
+        assert [p.name for p in pset.feasible_primitives(float, 1)] == ["add"]
+        assert len(pset.feasible_primitives(float, 2)) == 2
+
+    # -------------------------------------------------------------------------------------- #
+    def test_no_bool_terminals(self):
+        pset = make_pset()
+        random.seed(0)
+        for gen in (gen_full, gen_grow):
+            for _ in range(200):
+                tree = PrimitiveTree(gen(pset, 1, 4))
+                assert 1 <= tree.height <= 4
+                assert tree.root.ret is bool
+        trees = gen_batch(pset, 50, 2, 3)
+        assert all(PrimitiveTree(expr).height <= 3 for expr in trees)
@@ -0,0 +1,153 @@
+# ====================================================================================== #
+#                                                                                        #
+#   MIT License                                                                          #
+#                                                                                        #
+#   Copyright (c) 2022 - Mattias Aabmets, The DEAP Team and Other Contributors           #
+#                                                                                        #
+#   Permission is hereby granted, free of charge, to any person obtaining a copy         #
+#   of this software and associated documentation files (the "Software"), to deal        #
+#   in the Software without restriction, including without limitation the rights         #
+#   to use, copy, modify, merge, publish, distribute, sublicense, and/or sell            #
+#   copies of the Software, and to permit persons to whom the Software is                #
+#   furnished to do so, subject to the following conditions:                             #
+#                                                                                        #
+#   The above copyright notice and this permission notice shall be included in all       #
+#   copies or substantial portions of the Software.                                      #
+#                                                                                        #
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR           #
+#   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,             #
+#   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE          #
+#   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER               #
+#   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,        #
+#   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE        #
+#   SOFTWARE.                                                                            #
+#                                                                                        #
+# ====================================================================================== #
+from deap_er.gp import PrimitiveSet, PrimitiveTree, CompactTree
+from deap_er.gp import compile_tree, cx_one_point
+from multiprocessing.pool import ThreadPool
+import operator
+import weakref
+import pickle
+import random
+import copy
+
+
+def make_pset():
+    pset = PrimitiveSet("main", 2)
+    pset.add_primitive(operator.add, 2)
+    pset.add_primitive(operator.neg, 1)
+    pset.add_terminal(0.5)
+    return pset
+
+
+# ====================================================================================== #
+class TestSubtreeIndex:
+
+    def test_index(self):
+        pset = make_pset()
+        tree = PrimitiveTree.from_string("add(neg(ARG0), add(ARG1, ARG0))", pset)
+        ends, depths = tree.subtree_index()
+        assert ends == (6, 3, 3, 6, 5, 6)
+        assert depths == (0, 1, 2, 1, 2, 2)
+        assert tree.search_subtree(3) == slice(3, 6)
+        assert tree.height == 2
+
+    # -------------------------------------------------------------------------------------- #
+    def test_invalidation(self):
+        pset = make_pset()
+        tree = PrimitiveTree.from_string("add(neg(ARG0), ARG1)", pset)
+        clone = copy.deepcopy(tree)
+        assert tree.height == 2
+        tree[1:3] = [pset.mapping["ARG1"]]
+        assert tree.height == 1
+        assert tree.search_subtree(0) == slice(0, 3)
+        assert clone.height == 2
+
+
+# ====================================================================================== #
+class TestCompactTree:
+
+    def test_round_trip(self):
+        pset = make_pset()
+        code = "add(neg(ARG0), add(0.5, ARG1))"
+        tree = CompactTree.from_string(code, pset)
+        assert str(tree) == code
+        assert list(tree) == list(PrimitiveTree.from_string(code, pset))
+        assert compile_tree(tree, pset)(1, 2) == 1.5
+        assert pickle.loads(pickle.dumps(tree)) == tree
+        assert copy.deepcopy(tree) == tree
+
+    # -------------------------------------------------------------------------------------- #
+    def test_crossover(self):
+        pset = make_pset()
+        random.seed(0)
+        code1, code2 = "add(neg(ARG0), 0.5)", "neg(add(ARG1, neg(0.5)))"
+        tree1 = CompactTree.from_string(code1, pset)
+        tree2 = CompactTree.from_string(code2, pset)
+        cx_one_point(tree1, tree2)
+        random.seed(0)
+        ref1 = PrimitiveTree.from_string(code1, pset)
+        ref2 = PrimitiveTree.from_string(code2, pset)
+        cx_one_point(ref1, ref2)
+        assert str(tree1) == str(ref1) and str(tree2) == str(ref2)
+        assert tree1.height == ref1.height
+
+    # -------------------------------------------------------------------------------------- #
+    def test_opcode_tables(self):
+        pset = make_pset()
+        codes = ["add(ARG0, 0.5)", "neg(add(ARG1, ARG0))"] * 50
+        with ThreadPool(4) as pool:
+            trees = pool.map(lambda code: CompactTree.from_string(code, pset), codes)
+        assert [str(tree) for tree in trees] == codes
+        assert len({id(tree._table) for tree in trees}) == 1
+        clones = pickle.loads(pickle.dumps(trees))
+        assert clones == trees and clones[0]._table is clones[1]._table
+        assert CompactTree(trees[0])._table is trees[0]._table
+        table = weakref.ref(trees[0]._table)
+        del pset, trees, pool
+        assert table() is None
+
+
+# ====================================================================================== #
+class TestSignatureTables:
+
+    def test_lookups(self):
+        pset = make_pset()
+        add = pset.mapping["add"]
+        assert pset.primitives_like(object, add.args) == [add]
+        assert pset.primitives_accepting(object) == pset.primitives[object]
+        pset.add_primitive(operator.sub, 2)
+        names = [p.name for p in pset.primitives_like(object, add.args)]
+        assert names == ["add", "sub"]
+        assert pset.primitives_like(object, [object] * 3) == []
+
+
+# ====================================================================================== #
+class TestFromString:
+
+    def test_literals(self):
+        pset = make_pset()
+        tree = PrimitiveTree.from_string("add(-1.5e-3,\nadd(7, 'a'))", pset)
+        assert [node.value for node in (tree[1], tree[3], tree[4])] == [-1.5e-3, 7, 'a']
+        assert str(tree) == "add(-0.0015, add(7, 'a'))"
+
+    # -------------------------------------------------------------------------------------- #
+    def test_no_eval(self):
+        pset = make_pset()
+        for code in ("add(ARG0, __import__)", "add(ARG0, len([]))"):
+            try:
+                PrimitiveTree.from_string(code, pset)
+            except TypeError:
+                continue
+            raise AssertionError(code)
+
+    # -------------------------------------------------------------------------------------- #
+    def test_batch(self):
+        pset = make_pset()
+        codes = ["add(ARG0, 2)", "neg(2)", "add(neg(ARG1), 0.5)"]
+        trees = PrimitiveTree.from_strings(codes, pset)
+        assert [str(tree) for tree in trees] == codes
+        assert trees[0][2] is trees[1][1]
+        compact = CompactTree.from_strings(codes, pset)
+        assert [list(tree) for tree in compact] == [list(tree) for tree in trees]
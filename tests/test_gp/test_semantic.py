@@ -26,7 +26,10 @@
 from deap_er.gp.primitives import PrimitiveSet
 from deap_er.gp.generators import gen_grow
 from deap_er.gp import cx_semantic, mut_semantic
+from deap_er.gp import GeometricSemantics, SemanticTree, compile_tree
 import operator
+import pickle
+import numpy
 import math
 
 
@@ -34,6 +37,10 @@ def lf(x):
     return 1 / (1 + math.exp(-x))
 
 
+def np_lf(x):
+    return 1 / (1 + numpy.exp(-x))
+
+
 def test_semantic_crossover():
     pset = PrimitiveSet("main", 2)
     pset.add_primitive(operator.sub, 2)
@@ -61,3 +68,25 @@ def test_semantic_mutation():
     mutated = mut_semantic(individual, pset, max_depth=2)
     ctr = sum([m.name == individual[i].name for i, m in enumerate(mutated[0])])
     assert ctr == len(individual)
+
+
+def test_geometric_semantics():
+    pset = PrimitiveSet("main", 1)
+    pset.add_primitive(operator.sub, 2)
+    pset.add_terminal(3)
+    pset.add_primitive(np_lf, 1, name="lf")
+    pset.add_primitive(operator.add, 2)
+    pset.add_primitive(operator.mul, 2)
+    data = numpy.linspace(-1, 1, 11)
+    gsgp = GeometricSemantics(pset, data, max_depth=2)
+    ind1 = gsgp.make(SemanticTree, lambda: gen_grow(pset, 1, 3))
+    ind2 = gsgp.make(SemanticTree, lambda: gen_grow(pset, 1, 3))
+    for _ in range(5):
+        ind1, ind2 = gsgp.mate(ind1, ind2)
+        ind1, = gsgp.mutate(ind1)
+    tree = gsgp.expand(ind1)
+    assert numpy.allclose(compile_tree(tree, pset)(data), ind1.semantics)
+    assert numpy.allclose(gsgp.predict(ind1, data * 2), compile_tree(tree, pset)(data * 2))
+    clone = pickle.loads(pickle.dumps(gsgp))
+    assert numpy.allclose(clone.predict(ind1, data), ind1.semantics)
+
@@ -0,0 +1,157 @@
+# ====================================================================================== #
+#                                                                                        #
+#   MIT License                                                                          #
+#                                                                                        #
+#   Copyright (c) 2022 - Mattias Aabmets, The DEAP Team and Other Contributors           #
+#                                                                                        #
+#   Permission is hereby granted, free of charge, to any person obtaining a copy         #
+#   of this software and associated documentation files (the "Software"), to deal        #
+#   in the Software without restriction, including without limitation the rights         #
+#   to use, copy, modify, merge, publish, distribute, sublicense, and/or sell            #
+#   copies of the Software, and to permit persons to whom the Software is                #
+#   furnished to do so, subject to the following conditions:                             #
+#                                                                                        #
+#   The above copyright notice and this permission notice shall be included in all       #
+#   copies or substantial portions of the Software.                                      #
+#                                                                                        #
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR           #
+#   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,             #
+#   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE          #
+#   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER               #
+#   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,        #
+#   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE        #
+#   SOFTWARE.                                                                            #
+#                                                                                        #
+# ====================================================================================== #
+from deap_er.gp import PrimitiveSet, PrimitiveTree, CompileCache
+from deap_er.gp import compile_tree, compile_adf_tree, static_limit
+from deap_er.gp import Simplifier, rule_identity, rule_absorbing
+from multiprocessing.pool import ThreadPool
+import operator
+
+
+def make_pset():
+    pset = PrimitiveSet("main", 2)
+    pset.add_primitive(operator.add, 2)
+    pset.add_primitive(operator.mul, 2)
+    pset.add_primitive(operator.neg, 1)
+    pset.add_terminal(3)
+    return pset
+
+
+# ====================================================================================== #
+class TestCompileCache:
+
+    def test_compile_tree(self):
+        pset = make_pset()
+        expr = PrimitiveTree.from_string("add(mul(ARG0, 3), neg(ARG1))", pset)
+        func = compile_tree(expr, pset)
+        assert func(2, 1) == 5
+        assert compile_tree(PrimitiveTree(expr), pset) is func
+        assert pset.compile_cache.hits == 1
+        assert pset.compile_cache.misses == 1
+
+    # -------------------------------------------------------------------------------------- #
+    def test_eviction(self):
+        cache = CompileCache(maxsize=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        assert cache.get('a') == 1
+        cache.put('c', 3)
+        assert 'b' not in cache
+        assert len(cache) == 2
+        assert cache.get('b') is None
+        assert (cache.hits, cache.misses) == (1, 1)
+
+
+# ====================================================================================== #
+class TestStackEngine:
+
+    def test_same_result(self):
+        pset = make_pset()
+        stack_pset = make_pset()
+        stack_pset.engine = "stack"
+        code = "add(mul(ARG0, 3), neg(add(ARG1, ARG0)))"
+        expr = PrimitiveTree.from_string(code, pset)
+        expected = compile_tree(expr, pset)(2, 5)
+        assert compile_tree(expr, stack_pset)(2, 5) == expected
+        assert compile_tree(code, stack_pset)(2, 5) == expected
+
+    # -------------------------------------------------------------------------------------- #
+    def test_deep_tree(self):
+        pset = PrimitiveSet("main", 1, engine="stack")
+        pset.add_primitive(operator.neg, 1)
+        expr = PrimitiveTree([pset.mapping["neg"]] * 1001 + [pset.mapping["ARG0"]])
+        assert compile_tree(expr, pset)(3) == -3
+
+
+# ====================================================================================== #
+class TestStaticLimit:
+
+    def test_replacement(self):
+        pset = make_pset()
+        tree = PrimitiveTree.from_string("add(ARG0, ARG1)", pset)
+        tree.label = "parent"
+
+        def grow(ind):
+            ind[1:2] = [pset.mapping["neg"], pset.mapping["ARG0"]]
+            return ind,
+
+        limited = static_limit(len, 3)(grow)
+        child, = limited(tree)
+        assert str(child) == "add(ARG0, ARG1)"
+        assert child is not tree and child.label == "parent"
+        assert str(tree) == "add(neg(ARG0), ARG1)"
+
+
+# ====================================================================================== #
+class TestSimplifier:
+
+    def test_rules(self):
+        pset = make_pset()
+        simplifier = Simplifier(pset, fold_constants=["add", "neg"])
+        simplifier.add_rule("add", rule_identity(0))
+        simplifier.add_rule("mul", rule_identity(1))
+        simplifier.add_rule("mul", rule_absorbing(0))
+        code = "add(mul(ARG0, add(3, neg(3))), mul(add(ARG1, 0), neg(neg(1))))"
+        tree = PrimitiveTree.from_string(code, pset)
+        assert str(simplifier(tree)) == "ARG1"
+        assert str(tree) == code
+        simplifier(tree, in_place=True)
+        assert str(tree) == "ARG1" and tree.height == 0
+
+    # -------------------------------------------------------------------------------------- #
+    def test_compile(self):
+        pset = make_pset()
+        pset.simplifier = Simplifier(pset)
+        tree = PrimitiveTree.from_string("mul(ARG0, add(3, 3))", pset)
+        assert compile_tree(tree, pset)(2, 0) == 12
+        assert pset.compile_cache.get("lambda ARG0,ARG1: mul(ARG0, add(3, 3))") is not None
+        pset.simplifier = Simplifier(pset, fold_constants=True)
+        assert compile_tree(tree, pset)(2, 0) == 12
+        assert pset.compile_cache.get("lambda ARG0,ARG1: mul(ARG0, 6)") is not None
+
+
+# ====================================================================================== #
+class TestCompileADF:
+
+    def test_isolated(self):
+        adf = PrimitiveSet("ADF0", 1)
+        adf.add_primitive(operator.add, 2)
+        adf.add_primitive(operator.mul, 2)
+        main = make_pset()
+        main.add_adf(adf)
+        context = dict(main.context)
+        codes = [("ADF0(ARG1)", f"add(ARG0, mul(ARG0, {i}))") for i in range(8)]
+        trees = [[PrimitiveTree.from_string(c, p) for c, p in zip(code, (main, adf))]
+                 for code in codes]
+
+        def run(i):
+            return compile_adf_tree(trees[i % 8], [main, adf])(0, 2)
+
+        with ThreadPool(4) as pool:
+            results = pool.map(run, range(64))
+        assert results == [2 + 2 * (i % 8) for i in range(64)]
+        assert main.context == context
+        assert len(main.compile_cache) == 1
+
@@ -0,0 +1,58 @@
+# ====================================================================================== #
+#                                                                                        #
+#   MIT License                                                                          #
+#                                                                                        #
+#   Copyright (c) 2022 - Mattias Aabmets, The DEAP Team and Other Contributors           #
+#                                                                                        #
+#   Permission is hereby granted, free of charge, to any person obtaining a copy         #
+#   of this software and associated documentation files (the "Software"), to deal        #
+#   in the Software without restriction, including without limitation the rights         #
+#   to use, copy, modify, merge, publish, distribute, sublicense, and/or sell            #
+#   copies of the Software, and to permit persons to whom the Software is                #
+#   furnished to do so, subject to the following conditions:                             #
+#                                                                                        #
+#   The above copyright notice and this permission notice shall be included in all       #
+#   copies or substantial portions of the Software.                                      #
+#                                                                                        #
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR           #
+#   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,             #
+#   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE          #
+#   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER               #
+#   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,        #
+#   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE        #
+#   SOFTWARE.                                                                            #
+#                                                                                        #
+# ====================================================================================== #
+from deap_er.operators import cx_simulated_binary_bounded, cx_uniform
+import random
+import numpy
+
+
+# ====================================================================================== #
+class TestSimulatedBinaryBounded:
+
+    def test_array_matches_list(self):
+        random.seed(0)
+        numpy.random.seed(0)
+        lists = [[0.5] * 10, [1.5] * 10]
+        values = list()
+        for _ in range(1000):
+            values.extend(sum(cx_simulated_binary_bounded(*map(list, lists), 5.0, 0, 2), []))
+        matrix1, matrix2 = numpy.full((1000, 10), 0.5), numpy.full((1000, 10), 1.5)
+        cx_simulated_binary_bounded(matrix1, matrix2, 5.0, numpy.zeros(10), numpy.full(10, 2.0))
+        arrays = numpy.concatenate([matrix1, matrix2])
+        assert numpy.all((arrays >= 0) & (arrays <= 2))
+        assert abs(numpy.mean(values) - 1.0) < 0.01
+        assert abs(arrays.mean() - 1.0) < 0.01
+        assert abs(numpy.std(values) - arrays.std()) < 0.02
+
+
+# ====================================================================================== #
+class TestUniform:
+
+    def test_arrays(self):
+        numpy.random.seed(0)
+        ind1, ind2 = numpy.zeros(1000), numpy.ones(800)
+        cx_uniform(ind1, ind2, 0.5)
+        assert numpy.all(ind1[:800] + ind2 == 1)
+        assert not ind1[800:].any()
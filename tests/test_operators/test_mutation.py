@@ -0,0 +1,75 @@
+# ====================================================================================== #
+#                                                                                        #
+#   MIT License                                                                          #
+#                                                                                        #
+#   Copyright (c) 2022 - Mattias Aabmets, The DEAP Team and Other Contributors           #
+#                                                                                        #
+#   Permission is hereby granted, free of charge, to any person obtaining a copy         #
+#   of this software and associated documentation files (the "Software"), to deal        #
+#   in the Software without restriction, including without limitation the rights         #
+#   to use, copy, modify, merge, publish, distribute, sublicense, and/or sell            #
+#   copies of the Software, and to permit persons to whom the Software is                #
+#   furnished to do so, subject to the following conditions:                             #
+#                                                                                        #
+#   The above copyright notice and this permission notice shall be included in all       #
+#   copies or substantial portions of the Software.                                      #
+#                                                                                        #
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR           #
+#   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,             #
+#   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE          #
+#   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER               #
+#   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,        #
+#   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE        #
+#   SOFTWARE.                                                                            #
+#                                                                                        #
+# ====================================================================================== #
+from deap_er.operators import mut_flip_bit, mut_polynomial_bounded
+from deap_er.operators import mut_gaussian, mut_uniform_int
+import numpy
+
+
+# ====================================================================================== #
+class TestArrayMutation:
+
+    def test_flip_bit(self):
+        numpy.random.seed(0)
+        matrix = numpy.zeros((20, 500), dtype=bool)
+        mut_flip_bit(matrix, 0.2)
+        assert 0.15 < matrix.mean() < 0.25
+
+    # -------------------------------------------------------------------------------------- #
+    def test_polynomial_bounded(self):
+        numpy.random.seed(0)
+        low, up = numpy.zeros(100), numpy.arange(1, 101)
+        ind = numpy.full(100, 0.5)
+        mut_polynomial_bounded(ind, 20.0, low, up, 1.0)
+        assert numpy.all(ind >= low) and numpy.all(ind <= up)
+        assert numpy.all(ind != 0.5)
+
+    # -------------------------------------------------------------------------------------- #
+    def test_gaussian(self):
+        numpy.random.seed(0)
+        mu, sigma = [0.0, 5.0, -5.0], [1.0, 2.0, 0.5]
+        matrix = numpy.zeros((20000, 3))
+        mut_gaussian(matrix, mu, sigma, 0.5)
+        mutated = matrix != 0
+        assert 0.48 < mutated.mean() < 0.52
+        for i in range(3):
+            genes = matrix[mutated[:, i], i]
+            assert abs(genes.mean() - mu[i]) < 0.1
+            assert abs(genes.std() - sigma[i]) < 0.1
+
+    # -------------------------------------------------------------------------------------- #
+    def test_gaussian_int(self):
+        numpy.random.seed(0)
+        ind = numpy.zeros(100, dtype=int)
+        mut_gaussian(ind, 0, 3, 1.0)
+        assert ind.dtype == int and numpy.any(ind != 0)
+
+    # -------------------------------------------------------------------------------------- #
+    def test_uniform_int(self):
+        numpy.random.seed(0)
+        matrix = numpy.zeros((50, 200), dtype=int)
+        mut_uniform_int(matrix, -3, 4, 1.0)
+        assert matrix.min() >= -3 and matrix.max() <= 4
+        assert set(numpy.unique(matrix)) == set(range(-3, 5))
@@ -0,0 +1,116 @@
+# ====================================================================================== #
+#                                                                                        #
+#   MIT License                                                                          #
+#                                                                                        #
+#   Copyright (c) 2022 - Mattias Aabmets, The DEAP Team and Other Contributors           #
+#                                                                                        #
+#   Permission is hereby granted, free of charge, to any person obtaining a copy         #
+#   of this software and associated documentation files (the "Software"), to deal        #
+#   in the Software without restriction, including without limitation the rights         #
+#   to use, copy, modify, merge, publish, distribute, sublicense, and/or sell            #
+#   copies of the Software, and to permit persons to whom the Software is                #
+#   furnished to do so, subject to the following conditions:                             #
+#                                                                                        #
+#   The above copyright notice and this permission notice shall be included in all       #
+#   copies or substantial portions of the Software.                                      #
+#                                                                                        #
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR           #
+#   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,             #
+#   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE          #
+#   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER               #
+#   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,        #
+#   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE        #
+#   SOFTWARE.                                                                            #
+#                                                                                        #
+# ====================================================================================== #
+from deap_er.records import HallOfFame, HashedHallOfFame
+from deap_er.records import ParetoFront, ParetoArchive
+from deap_er.base.fitness import Fitness
+import random
+
+
+# ====================================================================================== #
+class Individual(list):
+    def __init__(self, genes: list, weights: tuple, values: list):
+        super().__init__(genes)
+        fitness_type = type('HofFitness', (Fitness,), {'weights': weights})
+        self.fitness = fitness_type(values)
+
+
+def _contents(hof) -> list:
+    return sorted((ind.fitness.wvalues, tuple(ind)) for ind in hof)
+
+
+# ====================================================================================== #
+class TestHashedHallOfFame:
+
+    def test_matches_hall_of_fame(self):
+        random.seed(0)
+        weights = (1.0, -1.0)
+        hof, hashed = HallOfFame(8), HashedHallOfFame(8)
+        for _ in range(10):
+            pop = [
+                Individual(
+                    [random.randint(0, 3), random.randint(0, 1)], weights,
+                    [random.randint(0, 5), random.randint(0, 5)]
+                ) for _ in range(40)
+            ]
+            hof.update(pop)
+            hashed.update(pop)
+            assert [(ind.fitness.wvalues, list(ind)) for ind in hof] == \
+                   [(ind.fitness.wvalues, list(ind)) for ind in hashed]
+
+    # -------------------------------------------------------------------------------------- #
+    def test_duplicates_and_copies(self):
+        weights = (1.0,)
+        pop = [Individual([i % 3], weights, [i % 3]) for i in range(9)]
+        hashed = HashedHallOfFame(5)
+        hashed.update(pop)
+        assert [ind[0] for ind in hashed] == [2, 1, 0]
+        assert not {id(ind) for ind in hashed} & {id(ind) for ind in pop}
+        hashed.clear()
+        assert len(hashed) == 0
+
+
+# ====================================================================================== #
+class TestParetoArchive:
+
+    def test_matches_pareto_front(self):
+        random.seed(0)
+        for obj_count in (2, 3, 4):
+            weights = (1.0,) * obj_count
+            front, archive = ParetoFront(), ParetoArchive(leaf_size=4)
+            for _ in range(10):
+                pop = [
+                    Individual(
+                        [random.randint(0, 2)], weights,
+                        [random.randint(0, 6) for _ in weights]
+                    ) for _ in range(50)
+                ]
+                front.update(pop)
+                archive.update(pop)
+                assert len(archive) == len(front)
+                assert _contents(archive) == _contents(front)
+
+    # -------------------------------------------------------------------------------------- #
+    def test_copy_semantics(self):
+        weights = (1.0, 1.0, 1.0)
+        pop = [Individual([i], weights, [i, -i, 0]) for i in range(5)]
+        archive = ParetoArchive()
+        archive.update(pop)
+        assert len(archive) == 5
+        assert not {id(ind) for ind in archive} & {id(ind) for ind in pop}
+        archive = ParetoArchive(copy=False)
+        archive.update(pop)
+        assert {id(ind) for ind in archive} == {id(ind) for ind in pop}
+
+    # -------------------------------------------------------------------------------------- #
+    def test_ordering_and_clear(self):
+        weights = (1.0, -1.0)
+        pop = [Individual([i], weights, [i, i]) for i in range(5)]
+        archive = ParetoArchive()
+        archive.update(pop)
+        assert [ind[0] for ind in archive] == [4, 3, 2, 1, 0]
+        assert archive[0][0] == 4
+        archive.clear()
+        assert len(archive) == 0
@@ -24,7 +24,14 @@
 #                                                                                        #
 # ====================================================================================== #
 from deap_er.utilities.hypervolume import HyperVolume
+from deap_er.utilities.hypervolume import hv_exact, hv_2d, hv_3d, hv_4d, hv_wfg
+from deap_er.utilities.hypervolume import hv_contributions, HvContributions
+from deap_er.utilities.hypervolume import hv_approx, hv_approx_contributions
 from deap_er.utilities.hypervolume.node import Node
+from multiprocessing.pool import ThreadPool
+import subprocess
+import itertools
+import sys
 import numpy
 
 
@@ -92,6 +99,152 @@ class TestHyperVolume:
         result = hv.compute(front)
         assert result == 0.0
 
+    # -------------------------------------------------------------------------------------- #
+    def test_8(self):
+        front = numpy.array([(a, 3 - a, a / 2) for a in numpy.arange(0, 3, 0.25)])
+        backup = front.copy()
+        ref = numpy.array([4.0, 4.0, 4.0])
+        hv = HyperVolume(ref)
+        assert hv.compute(front) == hv.compute(front)
+        assert numpy.array_equal(front, backup)
+
+
+# ====================================================================================== #
+class TestEngines:
+
+    @staticmethod
+    def grid_volume(front, size):
+        cells = itertools.product(range(size), repeat=front.shape[1])
+        return sum(numpy.all(front <= cell, axis=1).any() for cell in cells)
+
+    # -------------------------------------------------------------------------------------- #
+    def test_against_grid(self):
+        rng = numpy.random.default_rng(0)
+        engines = {2: hv_2d, 3: hv_3d, 4: hv_4d, 5: hv_wfg}
+        for dims, engine in engines.items():
+            for _ in range(10):
+                front = rng.integers(0, 4, size=(rng.integers(1, 12), dims))
+                ref = numpy.full(dims, 4)
+                expected = self.grid_volume(front, 4)
+                assert engine(front, ref) == expected
+                assert hv_wfg(front, ref) == expected
+                assert hv_exact(front, ref) == expected
+
+    # -------------------------------------------------------------------------------------- #
+    def test_against_hypervolume(self):
+        for dims in range(2, 7):
+            front = [numpy.roll(numpy.arange(dims), i) for i in range(dims)]
+            front = numpy.array(front, dtype=float)
+            ref = numpy.full(dims, dims + 1.0)
+            expected = HyperVolume(ref).compute(front.copy())
+            assert numpy.isclose(hv_exact(front, ref), expected)
+            assert numpy.isclose(hv_wfg(front, ref), expected)
+
+    # -------------------------------------------------------------------------------------- #
+    def test_irrelevant_points(self):
+        front = numpy.array([[1.0, 1.0, 1.0], [3.0, 0.0, 0.0]])
+        ref = numpy.array([2.0, 2.0, 2.0])
+        assert hv_exact(front, ref) == 1.0
+        assert hv_exact(numpy.empty((0, 3)), ref) == 0.0
+
+
+# ====================================================================================== #
+class TestContributions:
+
+    @staticmethod
+    def leave_one_out(front, ref):
+        total = hv_exact(front, ref)
+        return numpy.array([
+            total - hv_exact(numpy.delete(front, i, axis=0), ref)
+            for i in range(len(front))
+        ])
+
+    # -------------------------------------------------------------------------------------- #
+    def test_all_at_once(self):
+        rng = numpy.random.default_rng(0)
+        for dims in (2, 3, 4):
+            sphere = numpy.abs(rng.normal(size=(30, dims)))
+            sphere /= numpy.linalg.norm(sphere, axis=1, keepdims=True)
+            grid = rng.integers(0, 4, size=(30, dims)).astype(float)
+            for front in (sphere, grid, numpy.vstack((sphere, sphere[:3]))):
+                ref = front.max(axis=0) + 1
+                expected = self.leave_one_out(front, ref)
+                assert numpy.allclose(hv_contributions(front, ref), expected)
+
+    # -------------------------------------------------------------------------------------- #
+    def test_shared_points(self):
+        rng = numpy.random.default_rng(4)
+        front = numpy.abs(rng.normal(size=(25, 4)))
+        front /= numpy.linalg.norm(front, axis=1, keepdims=True)
+        ref = numpy.full(4, 1.1)
+        with ThreadPool(2) as pool:
+            result = hv_contributions(front, ref, pool.map)
+        assert numpy.allclose(result, hv_contributions(front, ref))
+
+    # -------------------------------------------------------------------------------------- #
+    def test_shared_points_spawn(self):
+        script = (
+            "import multiprocessing, numpy\n"
+            "from deap_er.utilities.hypervolume import hv_contributions\n"
+            "if __name__ == '__main__':\n"
+            "    front = numpy.random.default_rng(5).random((12, 4))\n"
+            "    ref = numpy.ones(4)\n"
+            "    with multiprocessing.get_context('spawn').Pool(2) as pool:\n"
+            "        result = hv_contributions(front, ref, pool.map)\n"
+            "    assert numpy.allclose(result, hv_contributions(front, ref))\n"
+        )
+        proc = subprocess.run(
+            [sys.executable, '-c', script],
+            capture_output=True, text=True, timeout=120
+        )
+        assert proc.returncode == 0, proc.stderr
+        assert 'Traceback' not in proc.stderr
+        assert 'leaked' not in proc.stderr
+
+    # -------------------------------------------------------------------------------------- #
+    def test_incremental_removal(self):
+        rng = numpy.random.default_rng(1)
+        for dims in (2, 3, 4):
+            front = numpy.abs(rng.normal(size=(20, dims)))
+            front /= numpy.linalg.norm(front, axis=1, keepdims=True)
+            ref = numpy.full(dims, 1.1)
+            contribs = HvContributions(front, ref)
+            remaining = list(range(len(front)))
+            for _ in range(15):
+                index = contribs.least()
+                contribs.remove(index)
+                remaining.remove(index)
+                expected = self.leave_one_out(front[remaining], ref)
+                assert numpy.allclose(contribs.values[remaining], expected)
+
+
+# ====================================================================================== #
+class TestApproximate:
+
+    def test_total_within_bounds(self):
+        numpy.random.seed(0)
+        rng = numpy.random.default_rng(2)
+        for dims in (3, 5, 8):
+            front = numpy.abs(rng.normal(size=(40, dims)))
+            front /= numpy.linalg.norm(front, axis=1, keepdims=True)
+            ref = numpy.full(dims, 1.1)
+            exact = hv_exact(front, ref)
+            value, low, high = hv_approx(front, ref, samples=200000)
+            assert low <= exact <= high
+            assert abs(value - exact) / exact < 0.02
+
+    # -------------------------------------------------------------------------------------- #
+    def test_contributions(self):
+        numpy.random.seed(0)
+        rng = numpy.random.default_rng(3)
+        front = numpy.abs(rng.normal(size=(15, 4)))
+        front /= numpy.linalg.norm(front, axis=1, keepdims=True)
+        ref = numpy.full(4, 1.1)
+        exact = hv_contributions(front, ref)
+        values, lows, highs = hv_approx_contributions(front, ref, samples=20000)
+        assert numpy.allclose(values, exact, rtol=0.1, atol=1e-4)
+        assert numpy.mean((lows <= exact) & (exact <= highs)) > 0.8
+
 
 # ====================================================================================== #
 class TestNode:
@@ -0,0 +1,81 @@
+# ====================================================================================== #
+#                                                                                        #
+#   MIT License                                                                          #
+#                                                                                        #
+#   Copyright (c) 2022 - Mattias Aabmets, The DEAP Team and Other Contributors           #
+#                                                                                        #
+#   Permission is hereby granted, free of charge, to any person obtaining a copy         #
+#   of this software and associated documentation files (the "Software"), to deal        #
+#   in the Software without restriction, including without limitation the rights         #
+#   to use, copy, modify, merge, publish, distribute, sublicense, and/or sell            #
+#   copies of the Software, and to permit persons to whom the Software is                #
+#   furnished to do so, subject to the following conditions:                             #
+#                                                                                        #
+#   The above copyright notice and this permission notice shall be included in all       #
+#   copies or substantial portions of the Software.                                      #
+#                                                                                        #
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR           #
+#   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,             #
+#   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE          #
+#   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER               #
+#   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,        #
+#   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE        #
+#   SOFTWARE.                                                                            #
+#                                                                                        #
+# ====================================================================================== #
+from deap_er.utilities.sorting import sort_log_non_dominated
+from deap_er.utilities.sorting import sort_non_dominated
+from deap_er.base.fitness import Fitness
+import random
+
+
+# ====================================================================================== #
+class Individual:
+    def __init__(self, weights: tuple, values: tuple):
+        fitness_type = type('SortFitness', (Fitness,), {'weights': weights})
+        self.fitness = fitness_type(values)
+
+
+def _ranks(fronts: list) -> dict:
+    return {id(ind): i for i, front in enumerate(fronts) for ind in front}
+
+
+# ====================================================================================== #
+class TestSortLogNonDominated:
+
+    def test_matches_fast_sort(self):
+        random.seed(0)
+        for obj_count in range(1, 6):
+            weights = (1.0,) * obj_count
+            for _ in range(20):
+                pop = [
+                    Individual(weights, [random.randint(0, 4) for _ in weights])
+                    for _ in range(random.randint(1, 80))
+                ]
+                log_fronts = sort_log_non_dominated(pop, len(pop))
+                fast_fronts = sort_non_dominated(pop, len(pop))
+                assert _ranks(log_fronts) == _ranks(fast_fronts)
+
+    # -------------------------------------------------------------------------------------- #
+    def test_first_front_only(self):
+        weights = (1.0, 1.0)
+        pop = [Individual(weights, (i, -i)) for i in range(10)]
+        pop.append(Individual(weights, (0, -1)))
+        front = sort_log_non_dominated(pop, len(pop), ffo=True)
+        assert len(front) == 10
+        assert pop[-1] not in front
+
+    # -------------------------------------------------------------------------------------- #
+    def test_stress_100k(self):
+        random.seed(1)
+        weights = (1.0, 1.0, 1.0)
+        pop = [
+            Individual(weights, (i, 1000 - i, -layer))
+            for layer in range(100) for i in range(1000)
+        ]
+        random.shuffle(pop)
+        fronts = sort_log_non_dominated(pop, len(pop))
+        assert len(fronts) == 100
+        for i, front in enumerate(fronts):
+            assert len(front) == 1000
+            assert all(ind.fitness.wvalues[2] == -i for ind in front)